@@ -0,0 +1,6 @@
+"""
+This package contains the benchmarks of the project.
+
+Every benchmark is a module or a package run with `python -m benchmarks.<name>`;
+it creates a throwaway test database, seeds it and prints its measurements.
+"""
@@ -0,0 +1,139 @@
+"""
+This module benchmarks the SQLite settings under concurrent writes.
+
+`WRITERS` threads commit `TRANSACTIONS` transactions each, every one reading a number
+of rows and inserting a row as the comment and task writes do, while `READERS` threads
+keep reading the table. The same load runs on a file database with the default settings
+of Django and with the settings of the project (WAL journal, immediate transactions,
+busy timeout, mmap), and the committed and failed ("database is locked") transactions
+and the throughput are printed.
+Run it with `python -m benchmarks.database_writes`.
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.utils import OperationalError
+
+from benchmarks.environment import settings
+
+WRITERS = 8
+READERS = 4
+TRANSACTIONS = 200
+ENGINE = 'django.db.backends.sqlite3'
+CREATE_TABLE = 'CREATE TABLE bench_row (id INTEGER PRIMARY KEY, owner INTEGER, content TEXT)'
+COUNT_ROWS = 'SELECT COUNT(*) FROM bench_row WHERE owner = %s'  # noqa: WPS323
+INSERT_ROW = 'INSERT INTO bench_row (owner, content) VALUES (%s, %s)'  # noqa: WPS323
+READ_ROWS = 'SELECT owner, content FROM bench_row ORDER BY id DESC LIMIT 20'
+RESULT_LINE = '{0:<8}{1:>8} committed{2:>8} failed{3:>10.0f} transactions/s\n'
+
+
+def profiles(directory) -> dict:
+    """
+    Get the database settings to compare, under aliases other than the project's.
+
+    Args:
+        directory: directory of the database files.
+
+    Returns:
+        dict: settings by profile name.
+    """
+    tuned = settings.DATABASES[DEFAULT_DB_ALIAS]
+    return {
+        'django': {'ENGINE': ENGINE, 'NAME': str(Path(directory) / 'default.sqlite3')},
+        'project': {'ENGINE': ENGINE, 'NAME': str(Path(directory) / 'tuned.sqlite3'), 'OPTIONS': tuned['OPTIONS']},
+    }
+
+
+def add_database(alias, database) -> None:
+    """
+    Add a database connection and create the benchmarked table.
+
+    Args:
+        alias: connection alias;
+        database: connection settings.
+    """
+    connections.settings[alias] = connections.configure_settings({DEFAULT_DB_ALIAS: database})[DEFAULT_DB_ALIAS]
+    with connections[alias].cursor() as cursor:
+        cursor.execute(CREATE_TABLE)
+    connections[alias].close()
+
+
+def write(alias, owner) -> tuple:
+    """
+    Commit the transactions of a writer.
+
+    Args:
+        alias: connection alias;
+        owner: number of the writer.
+
+    Returns:
+        tuple: numbers of committed and failed transactions.
+    """
+    committed = 0
+    for number in range(TRANSACTIONS):
+        try:
+            with transaction.atomic(using=alias):
+                with connections[alias].cursor() as cursor:
+                    cursor.execute(COUNT_ROWS, (owner,))
+                    cursor.execute(INSERT_ROW, (owner, f'row {number}'))
+        except OperationalError:
+            continue
+        committed += 1
+    connections[alias].close()
+    return committed, TRANSACTIONS - committed
+
+
+def read(alias, done) -> None:
+    """
+    Read the table until the writers are done.
+
+    Args:
+        alias: connection alias;
+        done: event set when the writers are done.
+    """
+    while not done.is_set():
+        with suppress(OperationalError):
+            with connections[alias].cursor() as cursor:
+                cursor.execute(READ_ROWS)
+                cursor.fetchall()
+    connections[alias].close()
+
+
+def run_profile(alias) -> None:
+    """
+    Run the concurrent writers and readers on a database and print the results.
+
+    Args:
+        alias: connection alias.
+    """
+    done = Event()
+    with ThreadPoolExecutor(WRITERS + READERS) as pool:
+        readers = [pool.submit(read, alias, done) for _ in range(READERS)]
+        start = time.perf_counter()
+        counts = list(pool.map(lambda owner: write(alias, owner), range(WRITERS)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        for reader in readers:
+            reader.result()
+    committed = sum(count[0] for count in counts)
+    failed = sum(count[1] for count in counts)
+    sys.stdout.write(RESULT_LINE.format(alias, committed, failed, committed / elapsed))
+
+
+def run() -> None:
+    """Run the same load with the default and the project settings."""
+    with TemporaryDirectory() as directory:
+        for alias, database in profiles(directory).items():
+            add_database(alias, database)
+            run_profile(alias)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,31 @@
+"""
+This module sets Django up for the benchmarks.
+
+Import it before the project modules; `test_database` gives a throwaway database
+created the same way as for the tests.
+"""
+
+import os
+from contextlib import ExitStack, contextmanager
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_sirius.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test.utils import get_runner  # noqa: E402
+
+
+@contextmanager
+def test_database():
+    """
+    Create the test databases and destroy them on exit.
+
+    Yields:
+        None: while the test databases are in use.
+    """
+    runner = get_runner(settings)(verbosity=0)
+    with ExitStack() as stack:
+        stack.callback(runner.teardown_databases, runner.setup_databases())
+        yield
@@ -0,0 +1,79 @@
+"""
+This module benchmarks the list serialization of tasks.
+
+The same rows are serialized by the DRF serializer and by the compiled `values()` plan,
+and the throughput of both is printed. Run it with `python -m benchmarks.list_serialization`.
+"""
+
+import sys
+import time
+
+from django.contrib.auth import get_user_model
+
+from benchmarks.environment import test_database
+from freelance import models, rows, serializers
+
+ROWS = 10000
+ROUNDS = 3
+RESULT_LINE = '{0:<12}{1:>10.1f} ms{2:>12.0f} rows/s\n'
+
+
+def seed(rows_number):
+    """
+    Create tasks of one owner with a status and two developers each.
+
+    Args:
+        rows_number: number of tasks.
+    """
+    user_model = get_user_model()
+    task_status = models.Status.objects.create(name='open')
+    position = models.Position.objects.create(name='senior')
+    developers = [
+        models.Developer.objects.create(developer=user_model.objects.create(username=f'dev{num}'), position=position)
+        for num in range(2)
+    ]
+    owner = user_model.objects.create(username='owner')
+    tasks = models.Task.objects.bulk_create(
+        models.Task(name=f'task {num}', description='benchmark', owner=owner, status=task_status)
+        for num in range(rows_number)
+    )
+    models.TaskDeveloper.objects.bulk_create(
+        models.TaskDeveloper(task=task, developer=developer) for task in tasks for developer in developers
+    )
+
+
+def best_time(serialize) -> float:
+    """
+    Measure the best of several rounds.
+
+    Args:
+        serialize: function serializing all rows.
+
+    Returns:
+        float: best time in seconds.
+    """
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        serialize()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run() -> None:
+    """Seed the rows and print the timings of both serializations."""
+    seed(ROWS)
+    queryset = models.Task.objects.select_related('owner').prefetch_related('developers').order_by('name', 'id')
+    plan = rows.compile_plan(serializers.TaskSerializer())
+    candidates = (
+        ('serializer', lambda: serializers.TaskSerializer(queryset.all(), many=True).data),
+        ('plan', lambda: plan.serialize(plan.values_queryset(queryset.all()))),
+    )
+    for name, serialize in candidates:
+        elapsed = best_time(serialize)
+        sys.stdout.write(RESULT_LINE.format(name, elapsed * 1000, ROWS / elapsed))
+
+
+if __name__ == '__main__':
+    with test_database():
+        run()
@@ -0,0 +1,8 @@
+"""
+This package benchmarks every page and API endpoint on a large synthetic dataset.
+
+`dataset` seeds the volumes given on the command line, `drivers` makes the requests through
+the test client and a real local server, and `comparison` computes the statistics
+of the endpoints and compares them with the stored baseline.
+Run it with `python -m benchmarks.load --help`.
+"""
@@ -0,0 +1,290 @@
+"""
+This module runs the load benchmark.
+
+The dataset is seeded with the volumes given on the command line, e.g. `--tasks 1000000`.
+Every URL of `freelance/urls.py` and every API endpoint of `django_sirius/urls.py` is requested
+after a warm-up request `--requests` times, the exports of all tasks a tenth as often: first
+through the test client one request at a time, then through a real local server by
+`--concurrency` clients. The median and the 99th percentile latency, the requests per second
+and the SQL queries per request of every endpoint are printed and compared with the baseline.
+The run exits with status 1 if an endpoint regressed.
+
+The event stream of a task is left out: it never ends and is served under ASGI only,
+see `benchmarks.wsgi_asgi`. The admin is Django's own.
+Run it with `python -m benchmarks.load`.
+"""
+
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.test import Client, override_settings
+
+from benchmarks.environment import settings, test_database
+from benchmarks.load import comparison, dataset, drivers
+from freelance import models
+
+REQUESTS = 20
+HEAVY_SHARE = 10
+CONCURRENCY = 8
+TOLERANCE = 0.5
+NEVER_SLOW_MS = 10 ** 9
+GET = 'GET'
+ENDPOINTS = (
+    (GET, '/'),
+    (GET, '/register/'),
+    (GET, '/login/'),
+    (GET, '/logout/'),
+    (GET, '/profile/'),
+    (GET, '/become-human/'),
+    (GET, '/dev-tasks/'),
+    (GET, '/my-tasks/'),
+    (GET, '/task/{task}'),
+    (GET, '/add-task'),
+    (GET, '/comment/{task}'),
+    (GET, '/edit-task/{task}'),
+    (GET, '/search/?q={word}'),
+    (GET, '/api/'),
+    (GET, '/api/tasks/'),
+    (GET, '/api/tasks/{task}/'),
+    (GET, '/api/statuses/'),
+    (GET, '/api/statuses/{status}/'),
+    (GET, '/api/positions/'),
+    (GET, '/api/positions/{position}/'),
+    (GET, '/api/comments/'),
+    (GET, '/api/comments/{comment}/'),
+    (GET, '/api/export/tasks.ndjson'),
+    (GET, '/api/export/tasks.csv'),
+    (GET, '/api/search/?q={word}'),
+    (GET, '/api/summaries/'),
+    (GET, '/api/metrics/'),
+    (drivers.POST, '/api-token-auth'),
+)
+METRICS_PATH = '/api/metrics/'
+HEAVY_PATHS = frozenset(('/api/export/tasks.ndjson', '/api/export/tasks.csv'))
+PRIMARY_KEY = 'pk'
+RESULT_LINE = '{0:<44}{1:>9.1f} ms p50{2:>9.1f} ms p99{3:>8.1f} requests/s{4:>7.1f} queries{5:>4} errors\n'
+
+
+def parse_options():
+    """
+    Read the volumes and the load from the command line.
+
+    Returns:
+        return: options namespace.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks.load', description='Benchmark every endpoint.')
+    for name, default in dataset.VOLUMES.items():
+        parser.add_argument(f'--{name}', type=int, default=default, help=f'number of {name}')
+    parser.add_argument('--requests', type=int, default=REQUESTS, help='measured requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=CONCURRENCY, help='concurrent clients of the server')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='allowed slowdown, e.g. 0.5')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    return parser.parse_args()
+
+
+def first_pk(queryset):
+    """
+    Get the smallest primary key of a queryset.
+
+    Args:
+        queryset: queryset.
+
+    Returns:
+        return: primary key, or None if the queryset is empty.
+    """
+    return queryset.order_by(PRIMARY_KEY).values_list(PRIMARY_KEY, flat=True).first()
+
+
+def endpoints(user) -> list:
+    """
+    Get the requested endpoints with the rows of the staff user in their paths.
+
+    Args:
+        user: staff user.
+
+    Returns:
+        list: method, path template and path of every endpoint.
+    """
+    task = models.Task.objects.filter(owner=user).order_by(PRIMARY_KEY).first()
+    path_values = {
+        'task': task.pk,
+        'comment': first_pk(models.Comment.objects.filter(task=task)),
+        'status': first_pk(models.Status.objects.all()),
+        'position': first_pk(models.Position.objects.all()),
+        'word': dataset.WORDS[0],
+    }
+    return [
+        (method, template, template.format(**path_values))
+        for method, template in ENDPOINTS
+        if template != METRICS_PATH or settings.METRICS_DIR
+    ]
+
+
+def measured_requests(requests_number, endpoint) -> int:
+    """
+    Get the number of measured requests of an endpoint.
+
+    Args:
+        requests_number: measured requests per endpoint;
+        endpoint: method, path template and path.
+
+    Returns:
+        int: measured requests of the endpoint.
+    """
+    if endpoint[1] in HEAVY_PATHS:
+        return max(requests_number // HEAVY_SHARE, 1)
+    return requests_number
+
+
+def client_samples(clients, endpoint, repeats) -> list:
+    """
+    Request an endpoint through the test client one request at a time.
+
+    Args:
+        clients: anonymous client and client of the staff user;
+        endpoint: method, path template and path;
+        repeats: range of the requests.
+
+    Returns:
+        list: latency, number of queries and status of every request.
+    """
+    return [drivers.client_request(clients, endpoint) for _ in repeats]
+
+
+def server_samples(pool, make_request, repeats) -> list:
+    """
+    Request an endpoint from the local server with concurrent clients.
+
+    Args:
+        pool: executor of the clients;
+        make_request: function making a request;
+        repeats: range of the requests.
+
+    Returns:
+        list: latency, number of queries and status of every request.
+    """
+    futures = [pool.submit(make_request) for _ in repeats]
+    return [future.result() for future in futures]
+
+
+def measure(driver, endpoint, make_requests) -> tuple:
+    """
+    Time the requests of an endpoint.
+
+    Args:
+        driver: 'client' or 'server';
+        endpoint: method, path template and path;
+        make_requests: function making the requests and returning their samples.
+
+    Returns:
+        tuple: name of the endpoint and its statistics.
+    """
+    start = time.perf_counter()
+    samples = make_requests()
+    elapsed = time.perf_counter() - start
+    method, template, _ = endpoint
+    return f'{driver} {method} {template}', comparison.summarize(samples, elapsed)
+
+
+def run_client(user, options, requests) -> dict:
+    """
+    Request every endpoint through the test client one request at a time.
+
+    Args:
+        user: staff user;
+        options: options namespace;
+        requests: method, path template and path of every endpoint.
+
+    Returns:
+        dict: statistics by endpoint.
+    """
+    clients = (Client(), Client())
+    clients[1].force_login(user)
+    statistics = {}
+    for endpoint in requests:
+        drivers.client_request(clients, endpoint)
+        repeats = range(measured_requests(options.requests, endpoint))
+        name, endpoint_statistics = measure('client', endpoint, partial(client_samples, clients, endpoint, repeats))
+        statistics[name] = endpoint_statistics
+    return statistics
+
+
+def session_cookie(user) -> str:
+    """
+    Log the staff user in.
+
+    Args:
+        user: staff user.
+
+    Returns:
+        str: Cookie header of the session.
+    """
+    client = Client()
+    client.force_login(user)
+    return client.cookies.output(attrs=(), header='', sep=';').strip()
+
+
+def run_server(user, options, requests) -> dict:
+    """
+    Request every endpoint from the local server with concurrent clients.
+
+    Args:
+        user: staff user;
+        options: options namespace;
+        requests: method, path template and path of every endpoint.
+
+    Returns:
+        dict: statistics by endpoint.
+    """
+    cookie = session_cookie(user)
+    statistics = {}
+    with drivers.local_server() as port:
+        with ThreadPoolExecutor(options.concurrency) as pool:
+            for endpoint in requests:
+                make_request = partial(drivers.server_request, port, cookie, endpoint)
+                make_request()
+                repeats = range(measured_requests(options.requests, endpoint))
+                make_requests = partial(server_samples, pool, make_request, repeats)
+                name, endpoint_statistics = measure('server', endpoint, make_requests)
+                statistics[name] = endpoint_statistics
+    return statistics
+
+
+def run(options) -> bool:
+    """
+    Seed the dataset, benchmark the endpoints and compare them with the baseline.
+
+    Args:
+        options: options namespace.
+
+    Returns:
+        bool: did no endpoint regress.
+    """
+    volumes = {name: getattr(options, name) for name in dataset.VOLUMES}
+    user = dataset.seed(volumes)
+    requests = endpoints(user)
+    statistics = run_client(user, options, requests)
+    statistics.update(run_server(user, options, requests))
+    for name, endpoint_statistics in statistics.items():
+        sys.stdout.write(RESULT_LINE.format(name, *endpoint_statistics.values()))
+    if options.save_baseline:
+        comparison.save_baseline(volumes, statistics)
+        return True
+    found = comparison.regressions(statistics, comparison.load_baseline(volumes), options.tolerance)
+    for regression in found:
+        sys.stdout.write(f'REGRESSION {regression}\n')
+    return not found
+
+
+if __name__ == '__main__':
+    command_options = parse_options()
+    measured_settings = override_settings(
+        DEBUG=False, ALLOWED_HOSTS=[drivers.HOST, 'testserver'], REQUEST_TIMING=True, SLOW_REQUEST_MS=NEVER_SLOW_MS,
+    )
+    with measured_settings:
+        with test_database():
+            passed = run(command_options)
+    sys.exit(0 if passed else 1)
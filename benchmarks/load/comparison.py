@@ -0,0 +1,125 @@
+"""
+This module computes the statistics of the load benchmark and compares them with the baseline.
+
+The baseline is stored in `baseline.json` next to this module together with the volumes
+of its dataset, and only a run with the same volumes is compared with it. A run regresses
+if an endpoint answers with an error, makes more queries per request, or is slower than
+the baseline by more than the tolerance. The latencies depend on the machine: store
+the baseline with `--save-baseline` on the machine that runs the comparisons.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+BASELINE = Path(__file__).with_name('baseline.json')
+MEDIAN = 0.5
+HIGH_PERCENTILE = 0.99
+MILLISECONDS = 1000
+CLIENT_ERROR = 400
+QUERY_TOLERANCE = 0.5
+P50 = 'p50_ms'
+P99 = 'p99_ms'
+RPS = 'requests_per_second'
+QUERIES = 'queries_per_request'
+ERRORS = 'errors'
+VOLUMES = 'volumes'
+ENDPOINTS = 'endpoints'
+
+
+def summarize(samples, elapsed) -> dict:
+    """
+    Compute the statistics of the requests of an endpoint.
+
+    Args:
+        samples: latency in seconds, number of queries and status of every request;
+        elapsed: time of all requests in seconds.
+
+    Returns:
+        dict: statistics.
+    """
+    latencies = sorted(sample[0] for sample in samples)
+    return {
+        P50: latencies[int(len(latencies) * MEDIAN)] * MILLISECONDS,
+        P99: latencies[int(len(latencies) * HIGH_PERCENTILE)] * MILLISECONDS,
+        RPS: len(latencies) / elapsed,
+        QUERIES: sum(sample[1] for sample in samples) / len(samples),
+        ERRORS: sum(sample[2] >= CLIENT_ERROR for sample in samples),
+    }
+
+
+def compare(measured, expected, tolerance):
+    """
+    Find the regressions of an endpoint.
+
+    Args:
+        measured: statistics of the run;
+        expected: statistics of the baseline;
+        tolerance: allowed slowdown, e.g. 0.5 for 50%.
+
+    Yields:
+        str: description of a regression.
+    """
+    if measured[QUERIES] > expected[QUERIES] + QUERY_TOLERANCE:
+        yield f'{measured[QUERIES]} queries per request instead of {expected[QUERIES]}'
+    for percentile in (P50, P99):
+        if measured[percentile] > expected[percentile] * (1 + tolerance):
+            slower = measured[percentile]
+            yield f'{percentile} {slower:.1f} instead of {expected[percentile]:.1f}'
+    if measured[RPS] * (1 + tolerance) < expected[RPS]:
+        yield f'{measured[RPS]:.0f} requests/s instead of {expected[RPS]:.0f}'
+
+
+def regressions(statistics, baseline, tolerance) -> list:
+    """
+    Find the errors and the regressions of all endpoints.
+
+    Args:
+        statistics: statistics by endpoint;
+        baseline: statistics by endpoint of the baseline;
+        tolerance: allowed slowdown.
+
+    Returns:
+        list: descriptions of the regressions.
+    """
+    found = []
+    for name, measured in statistics.items():
+        if measured[ERRORS]:
+            found.append(f'{name}: {measured[ERRORS]} errors')
+        expected = baseline.get(name)
+        if expected is not None:
+            found.extend(f'{name}: {regression}' for regression in compare(measured, expected, tolerance))
+    return found
+
+
+def load_baseline(volumes) -> dict:
+    """
+    Read the baseline stored for the volumes.
+
+    Args:
+        volumes: numbers of rows by name.
+
+    Returns:
+        dict: statistics by endpoint, empty if there is no baseline for the volumes.
+    """
+    if not BASELINE.exists():
+        sys.stdout.write('No baseline is stored.\n')
+        return {}
+    stored = json.loads(BASELINE.read_text())
+    if stored[VOLUMES] != volumes:
+        sys.stdout.write(f'The baseline is stored for other volumes: {stored[VOLUMES]}.\n')
+        return {}
+    return stored[ENDPOINTS]
+
+
+def save_baseline(volumes, statistics) -> None:
+    """
+    Store the statistics as the baseline of the volumes.
+
+    Args:
+        volumes: numbers of rows by name;
+        statistics: statistics by endpoint.
+    """
+    stored = {VOLUMES: volumes, ENDPOINTS: statistics}
+    BASELINE.write_text(f'{json.dumps(stored, indent=2, sort_keys=True)}\n')
+    sys.stdout.write(f'Stored the baseline in {BASELINE}.\n')
@@ -0,0 +1,116 @@
+"""
+This module seeds the synthetic dataset of the load benchmark.
+
+The dataset is imported by `importer.TaskImporter` from task records generated with a fixed
+random seed, so the same volumes give the same rows: the tasks are shared out among `users`
+owners, and get `assignments` developers out of the first `developers` users and `comments`
+comments of their developers each. The first user is made staff; with enough tasks it owns
+tasks and is a developer.
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+from types import MappingProxyType
+
+from django.contrib.auth import get_user_model
+
+from freelance import importer
+
+VOLUMES = MappingProxyType({
+    'users': 1000,
+    'developers': 100,
+    'tasks': 5000,
+    'assignments': 2,
+    'comments': 3,
+})
+SEED = 20240101
+STARTED = datetime.fromisoformat('2024-01-01T00:00:00+00:00')
+STATUSES = ('open', 'in progress', 'review', 'done')
+POSITIONS = ('junior', 'middle', 'senior')
+WORDS = ('deadline', 'refactor', 'invoice', 'design', 'review', 'deploy', 'migration', 'budget')
+DESCRIPTION_WORDS = 8
+COMMENT_WORDS = 5
+USERNAME = 'username'
+STAFF_USERNAME = 'user0'
+STAFF_PASSWORD = 'benchmark-password'  # noqa: S105
+CREDENTIALS = MappingProxyType({USERNAME: STAFF_USERNAME, 'password': STAFF_PASSWORD})
+
+
+def username(number) -> str:
+    """
+    Get the username of a seeded user.
+
+    Args:
+        number: number of the user.
+
+    Returns:
+        str: username.
+    """
+    return f'user{number}'
+
+
+def text(rng, words_number) -> str:
+    """
+    Generate a text of random words.
+
+    Args:
+        rng: random generator;
+        words_number: number of words.
+
+    Returns:
+        str: text.
+    """
+    return ' '.join(rng.choices(WORDS, k=words_number))
+
+
+def task_records(volumes):
+    """
+    Generate the task records in the import format.
+
+    Args:
+        volumes: numbers of rows by name.
+
+    Yields:
+        dict: task record.
+    """
+    rng = random.Random(SEED)
+    developers = [
+        {USERNAME: username(number), 'position': POSITIONS[number % len(POSITIONS)]}
+        for number in range(min(volumes['developers'], volumes['users']))
+    ]
+    for number in range(volumes['tasks']):
+        assigned = rng.sample(developers, min(volumes['assignments'], len(developers)))
+        commenters = [developer[USERNAME] for developer in assigned] or [STAFF_USERNAME]
+        yield {
+            'name': f'task {number} {rng.choice(WORDS)}',
+            'description': text(rng, DESCRIPTION_WORDS),
+            'owner': username(number % volumes['users']),
+            'status': rng.choice(STATUSES),
+            'created': (STARTED + timedelta(seconds=number)).isoformat(),
+            'developers': assigned,
+            'comments': [
+                {'owner': rng.choice(commenters), 'content': text(rng, COMMENT_WORDS)}
+                for _ in range(volumes['comments'])
+            ],
+        }
+
+
+def seed(volumes):
+    """
+    Import the dataset and make its first user a staff user with a password.
+
+    Args:
+        volumes: numbers of rows by name.
+
+    Returns:
+        return: staff user.
+    """
+    for imported in importer.TaskImporter().run(task_records(volumes)):
+        sys.stderr.write(f'\rseeded {imported} tasks')
+    sys.stderr.write('\n')
+    user = get_user_model().objects.get(username=STAFF_USERNAME)
+    user.is_staff = True
+    user.set_password(STAFF_PASSWORD)
+    user.save()
+    return user
@@ -0,0 +1,110 @@
+"""
+This module makes the requests of the load benchmark.
+
+A request is made either through the test client, which counts its queries in the process,
+or through a real local WSGI server, which reports them in the `Server-Timing` header.
+The header is sent before a streamed body, so the queries of the export are missed there.
+The body is always read whole. Logging out and getting a token are done anonymously,
+the other requests are made by the staff user.
+"""
+
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from http.client import HTTPConnection
+from threading import Thread
+from urllib.parse import urlencode
+
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+
+from benchmarks.load.dataset import CREDENTIALS
+from freelance import timing
+
+HOST = '127.0.0.1'
+POST = 'POST'
+ANONYMOUS_PATHS = frozenset(('/logout/', '/api-token-auth'))
+SERVER_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def client_request(clients, endpoint) -> tuple:
+    """
+    Make a request through the test client.
+
+    Args:
+        clients: anonymous client and client of the staff user;
+        endpoint: method, path template and path.
+
+    Returns:
+        tuple: latency in seconds, number of queries and status.
+    """
+    method, _, path = endpoint
+    client = clients[path not in ANONYMOUS_PATHS]
+    start = time.perf_counter()
+    with timing.measured() as measurements:
+        if method == POST:
+            response = client.post(path, CREDENTIALS)
+        else:
+            response = client.get(path)
+        response.getvalue()
+        return time.perf_counter() - start, measurements.query_count, response.status_code
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Request handler of the local server that does not log the requests."""
+
+    def log_message(self, *args) -> None:
+        """
+        Skip the request log.
+
+        Args:
+            args: log arguments.
+        """
+
+
+@contextmanager
+def local_server():
+    """
+    Serve the project on a free local port in a background thread.
+
+    Yields:
+        int: port of the server.
+    """
+    server = ThreadedWSGIServer((HOST, 0), QuietRequestHandler)
+    server.set_app(get_wsgi_application())
+    with ExitStack() as stack:
+        stack.callback(server.server_close)
+        stack.callback(server.shutdown)
+        Thread(target=server.serve_forever, daemon=True).start()
+        yield server.server_port
+
+
+def server_request(port, cookie, endpoint) -> tuple:
+    """
+    Make a request to the local server.
+
+    Args:
+        port: port of the server;
+        cookie: Cookie header of the staff user;
+        endpoint: method, path template and path.
+
+    Returns:
+        tuple: latency in seconds, number of queries and status.
+    """
+    method, _, path = endpoint
+    headers = {}
+    if path not in ANONYMOUS_PATHS:
+        headers['Cookie'] = cookie
+    body = None
+    if method == POST:
+        body = urlencode(CREDENTIALS)
+        headers['Content-Type'] = 'application/x-www-form-urlencoded'
+    start = time.perf_counter()
+    connection = HTTPConnection(HOST, port)
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+    latency = time.perf_counter() - start
+    queries = SERVER_QUERIES.search(response.headers.get('Server-Timing', ''))
+    return latency, int(queries.group(1)) if queries else 0, response.status
@@ -0,0 +1,206 @@
+"""
+This module benchmarks the WSGI and ASGI deployments of the read endpoints under concurrency.
+
+Every client reads its response slowly: delivering the body takes `CLIENT_DELAY` seconds.
+The WSGI deployment is a pool of `THREADS` worker threads, each writing the body to its client
+before it takes the next request; the ASGI deployment is one event loop that awaits the clients.
+Both serve `REQUESTS` requests of `CLIENTS` concurrent clients to the task list,
+a task and the task page, and the throughput and the latencies are printed.
+Run it with `python -m benchmarks.wsgi_asgi`.
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from threading import BoundedSemaphore
+
+from django.contrib.auth import get_user_model
+from django.test import Client
+
+from benchmarks.environment import test_database
+from django_sirius import asgi, wsgi
+from freelance import models
+from tests.test_queries import seed
+
+TASKS = 100
+REQUESTS = 600
+CLIENTS = 60
+THREADS = 4
+CLIENT_DELAY = 0.05
+HOST = 'localhost'
+TYPE = 'type'
+REQUEST_PATHS = ('/api/tasks/?page_size=20', '/api/tasks/{0}/', '/task/{0}')
+P50 = 0.5
+P95 = 0.95
+RESULT_LINE = '{0:<6}{1:>10.0f} requests/s{2:>10.1f} ms p50{3:>10.1f} ms p95\n'
+
+
+def session_cookie() -> str:
+    """
+    Log a user in.
+
+    Returns:
+        str: Cookie header of the session.
+    """
+    client = Client()
+    client.force_login(get_user_model().objects.create(username='benchmark', is_staff=True))
+    return client.cookies.output(attrs=(), header='', sep=';').strip()
+
+
+def request_paths() -> list:
+    """
+    Get the paths of the requests.
+
+    Returns:
+        list: paths with query strings.
+    """
+    task_ids = list(models.Task.objects.values_list('id', flat=True))
+    paths = []
+    for number in range(REQUESTS):
+        task_id = task_ids[number % len(task_ids)]
+        paths.append(REQUEST_PATHS[number % len(REQUEST_PATHS)].format(task_id))
+    return paths
+
+
+def wsgi_request(path, cookie, workers) -> float:
+    """
+    Wait for a free worker thread, serve a request and deliver the body to a slow client.
+
+    Args:
+        path: path with a query string;
+        cookie: Cookie header;
+        workers: semaphore of the worker threads.
+
+    Returns:
+        float: latency in seconds.
+    """
+    start = time.perf_counter()
+    path_info, _, query = path.partition('?')
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'SCRIPT_NAME': '',
+        'PATH_INFO': path_info,
+        'QUERY_STRING': query,
+        'SERVER_NAME': HOST,
+        'SERVER_PORT': '80',
+        'HTTP_HOST': HOST,
+        'HTTP_COOKIE': cookie,
+        'wsgi.input': BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.url_scheme': 'http',
+    }
+    with workers:
+        b''.join(wsgi.application(environ, lambda *args: None))
+        time.sleep(CLIENT_DELAY)
+    return time.perf_counter() - start
+
+
+def run_wsgi(paths, cookie) -> list:
+    """
+    Serve the requests of the concurrent clients with a fixed number of worker threads.
+
+    Args:
+        paths: paths of the requests;
+        cookie: Cookie header.
+
+    Returns:
+        list: latencies in seconds.
+    """
+    workers = BoundedSemaphore(THREADS)
+    with ThreadPoolExecutor(CLIENTS) as clients:
+        return list(clients.map(lambda path: wsgi_request(path, cookie, workers), paths))
+
+
+async def asgi_request(path, cookie, clients) -> float:
+    """
+    Serve a request of a client on the event loop and deliver the body to the slow client.
+
+    Args:
+        path: path with a query string;
+        cookie: Cookie header;
+        clients: semaphore of the concurrent clients.
+
+    Returns:
+        float: latency in seconds.
+    """
+    async with clients:
+        start = time.perf_counter()
+        path_info, _, query = path.partition('?')
+        scope = {
+            TYPE: 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path_info,
+            'root_path': '',
+            'query_string': query.encode('ascii'),
+            'headers': [(b'host', HOST.encode('ascii')), (b'cookie', cookie.encode('ascii'))],
+            'server': (HOST, 80),
+        }
+        messages = asyncio.Queue()
+        messages.put_nowait({TYPE: 'http.request', 'body': b'', 'more_body': False})
+        await asgi.application(scope, messages.get, slow_send)
+        messages.put_nowait({TYPE: 'http.disconnect'})
+        return time.perf_counter() - start
+
+
+async def slow_send(message) -> None:
+    """
+    Deliver a message to a slow client.
+
+    Args:
+        message: ASGI message.
+    """
+    if message[TYPE] == 'http.response.body' and not message.get('more_body'):
+        await asyncio.sleep(CLIENT_DELAY)
+
+
+async def run_asgi(paths, cookie) -> list:
+    """
+    Serve the requests concurrently on one event loop.
+
+    Args:
+        paths: paths of the requests;
+        cookie: Cookie header.
+
+    Returns:
+        list: latencies in seconds.
+    """
+    clients = asyncio.Semaphore(CLIENTS)
+    return await asyncio.gather(*(asgi_request(path, cookie, clients) for path in paths))
+
+
+def report(name, elapsed, latencies) -> None:
+    """
+    Print the throughput and the latencies of a deployment.
+
+    Args:
+        name: deployment name;
+        elapsed: time of all requests in seconds;
+        latencies: latencies of the requests in seconds.
+    """
+    ordered = sorted(latencies)
+    positions = [int(len(ordered) * share) for share in (P50, P95)]
+    p50, p95 = (ordered[position] * 1000 for position in positions)
+    sys.stdout.write(RESULT_LINE.format(name, len(latencies) / elapsed, p50, p95))
+
+
+def run() -> None:
+    """Seed the tasks and serve the same requests with both deployments."""
+    seed(TASKS)
+    cookie = session_cookie()
+    paths = request_paths()
+    start = time.perf_counter()
+    latencies = run_wsgi(paths, cookie)
+    report('WSGI', time.perf_counter() - start, latencies)
+    start = time.perf_counter()
+    latencies = asyncio.run(run_asgi(paths, cookie))
+    report('ASGI', time.perf_counter() - start, latencies)
+
+
+if __name__ == '__main__':
+    with test_database():
+        run()
@@ -34,11 +34,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'freelance.middleware.MetricsMiddleware',
+    'freelance.middleware.TimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'freelance.middleware.ReplicaMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'freelance.middleware.DeveloperMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -65,19 +69,135 @@ TEMPLATES = [
 WSGI_APPLICATION = 'django_sirius.wsgi.application'
 
 
-DATABASES = {
+# Database, chosen by DATABASE_ENGINE: sqlite (default) or postgres.
+# SQLite runs in WAL mode, so the readers do not block the writer, and the transactions
+# take the write lock when they begin and wait for it, instead of failing with "database is locked".
+# Postgres connections are pooled if POSTGRES_POOL_SIZE is set (needs psycopg[pool]),
+# and kept open between the requests otherwise; both are checked before they are reused.
+# https://docs.djangoproject.com/en/5.2/ref/databases/
+
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout={0}'.format(int(getenv('SQLITE_BUSY_TIMEOUT', '20')) * 1000),
+    'PRAGMA mmap_size={0}'.format(getenv('SQLITE_MMAP_SIZE', '268435456')),
+    'PRAGMA cache_size=-{0}'.format(getenv('SQLITE_CACHE_KB', '65536')),
+    'PRAGMA temp_store=MEMORY',
+)
+
+if getenv('DATABASE_ENGINE', 'sqlite') == 'postgres':
+    POSTGRES_POOL_SIZE = int(getenv('POSTGRES_POOL_SIZE', '0'))
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': getenv('POSTGRES_DB'),
+            'USER': getenv('POSTGRES_USER'),
+            'PASSWORD': getenv('POSTGRES_PASSWORD'),
+            'HOST': getenv('POSTGRES_HOST'),
+            'PORT': getenv('POSTGRES_PORT'),
+            'CONN_MAX_AGE': 0 if POSTGRES_POOL_SIZE else int(getenv('POSTGRES_CONN_MAX_AGE', '600')),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'options': '-c search_path=public,postgres_django',
+                'pool': POSTGRES_POOL_SIZE and {
+                    'min_size': int(getenv('POSTGRES_POOL_MIN_SIZE', '2')),
+                    'max_size': POSTGRES_POOL_SIZE,
+                    'timeout': int(getenv('POSTGRES_POOL_TIMEOUT', '10')),
+                },
+            },
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': getenv('SQLITE_NAME', path.join(BASE_DIR, 'db.sqlite3')),
+            'OPTIONS': {
+                'init_command': ';'.join(SQLITE_PRAGMAS),
+                'transaction_mode': 'IMMEDIATE',
+                'timeout': int(getenv('SQLITE_BUSY_TIMEOUT', '20')),
+            },
+        }
+    }
+
+# Read replicas: DATABASE_REPLICAS lists their SQLite files or Postgres hosts.
+# The safe requests read from them in turn, and a client that writes reads from the primary
+# for REPLICA_PIN_SECONDS, see freelance.routers.
+
+REPLICA_FIELD = 'HOST' if DATABASES['default']['ENGINE'].endswith('postgresql') else 'NAME'
+DATABASE_REPLICAS = []
+for replica_number, replica in enumerate(filter(None, getenv('DATABASE_REPLICAS', '').split(','))):
+    DATABASE_REPLICAS.append(f'replica{replica_number}')
+    DATABASES[DATABASE_REPLICAS[-1]] = {
+        **DATABASES['default'],
+        REPLICA_FIELD: replica,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['freelance.routers.ReplicaRouter']
+
+REPLICA_PIN_SECONDS = int(getenv('REPLICA_PIN_SECONDS', '10'))
+
+# Shared cache of all worker processes, e.g. django.core.cache.backends.redis.RedisCache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': path.join(BASE_DIR, 'db.sqlite3'),
-        # 'NAME': getenv('POSTGRES_DB'),
-        # 'USER': getenv('POSTGRES_USER'),
-        # 'PASSWORD': getenv('POSTGRES_PASSWORD'),
-        # 'HOST': getenv('POSTGRES_HOST'),
-        # 'PORT': getenv('POSTGRES_PORT'),
-        # 'OPTIONS': {'options': '-c search_path=public,postgres_django'},
+        'BACKEND': getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': getenv('CACHE_LOCATION', ''),
     }
 }
 
+# Delivery of the task events to the subscribers of all worker processes,
+# e.g. freelance.events.RedisBackend with a Redis URL
+
+EVENTS_BACKEND = getenv('EVENTS_BACKEND', 'freelance.events.LocalBackend')
+EVENTS_LOCATION = getenv('EVENTS_LOCATION', '')
+
+# Seconds a worker keeps its statuses and positions before it checks the shared version again;
+# writes made by the worker itself are seen at once, see freelance.categories.
+
+CATEGORY_VERSION_TTL = float(getenv('CATEGORY_VERSION_TTL', '1'))
+
+DEVELOPER_SESSION_CACHE = getenv('DEVELOPER_SESSION_CACHE', '1') == '1'
+
+TOKEN_CACHE_SIZE = int(getenv('TOKEN_CACHE_SIZE', '1024'))
+
+# Request timing: Server-Timing headers and a JSON lines log of the requests slower
+# than SLOW_REQUEST_MS with their slowest queries, see freelance.timing.
+
+REQUEST_TIMING = getenv('REQUEST_TIMING', '0') == '1'
+SLOW_REQUEST_MS = int(getenv('SLOW_REQUEST_MS', '500'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '{message}', 'style': '{'},
+    },
+    'handlers': {
+        'slow_requests': {
+            'class': 'logging.FileHandler',
+            'filename': getenv('SLOW_REQUEST_LOG', path.join(BASE_DIR, 'slow_requests.jsonl')),
+            'formatter': 'message',
+            'delay': True,
+        },
+    },
+    'loggers': {
+        'freelance.slow_requests': {
+            'handlers': ['slow_requests'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+# Request and cache metrics of all workers, kept in memory-mapped files in METRICS_DIR and shown
+# to the staff at /api/metrics/, see freelance.metrics. Empty turns them off. The counters add up
+# across restarts, so clear the directory when deploying.
+
+METRICS_DIR = getenv('METRICS_DIR', '')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -101,8 +221,9 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_AUTHENTITICATIONS_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.SessionAuthentication',
+        'freelance.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer'
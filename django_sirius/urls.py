@@ -5,7 +5,7 @@ from django.urls import include, path
 from rest_framework.authtoken.views import obtain_auth_token
 from rest_framework.routers import DefaultRouter
 
-from freelance import views
+from freelance import async_views, metrics_views, views
 
 router = DefaultRouter()
 router.register('tasks', views.TaskViewSet)
@@ -18,6 +18,18 @@ urlpatterns = ()
 urlpatterns = [
     path('', include('freelance.urls')),
     path('admin/', admin.site.urls),
+    path('api/tasks/', async_views.AsyncViewSetView.as_view(viewset_class=views.TaskViewSet)),
+    path('api/tasks/<uuid:pk>/', async_views.AsyncViewSetView.as_view(
+        viewset_class=views.TaskViewSet, actions=async_views.DETAIL_ACTIONS,
+    )),
+    path('api/comments/', async_views.AsyncViewSetView.as_view(viewset_class=views.CommentViewSet)),
+    path('api/comments/<uuid:pk>/', async_views.AsyncViewSetView.as_view(
+        viewset_class=views.CommentViewSet, actions=async_views.DETAIL_ACTIONS,
+    )),
     path('api/', include(router.urls)),
+    path('api/export/tasks.<str:export_format>', views.TaskExportView.as_view(), name='export_tasks'),
+    path('api/search/', views.SearchAPIView.as_view(), name='api_search'),
+    path('api/summaries/', views.StatusSummaryAPIView.as_view(), name='api_summaries'),
+    path('api/metrics/', metrics_views.MetricsView.as_view(), name='api_metrics'),
     path('api-token-auth', obtain_auth_token, name='api_token_auth'),
 ]
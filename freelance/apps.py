@@ -18,3 +18,7 @@ class FreelanceConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'freelance'
+
+    def ready(self) -> None:
+        """Connect the signal receivers."""
+        from . import signals  # noqa: F401, WPS433
@@ -0,0 +1,260 @@
+"""
+This module contains the asynchronous read endpoints of the API.
+
+Under ASGI a request served by these views does not hold a worker thread while it waits
+for the database or for a slow client: the queries go through the async ORM interface
+and the rest of the request runs on the event loop. The viewsets are reused for
+everything but the queries, so the responses are the same as theirs; only the
+authentication and permission checks, whose backends are synchronous, run in a thread.
+Writes are passed to the synchronous viewsets.
+
+The event streams of the tasks are served here as well, since only an event loop
+can keep many of them open.
+"""
+
+from types import MappingProxyType
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import PermissionDenied
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Max
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBadRequest
+from django.shortcuts import aget_object_or_404
+from django.utils.dateparse import parse_datetime
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.response import Response
+
+from . import models
+from .events import task_events
+from .filters import visible_tasks
+from .rows import compile_plan
+from .versions import aget_version, list_versions
+
+MODIFIED = 'modified'
+LAST_MODIFIED_KEY = 'last_modified'
+GET = 'get'
+READ_METHODS = (GET, 'head')
+LIST_ACTIONS = MappingProxyType({GET: 'list', 'post': 'create'})
+DETAIL_ACTIONS = MappingProxyType({
+    GET: 'retrieve',
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+
+
+class AsyncViewSetView(View):
+    """View that serves the list or the detail reads of a viewset natively async."""
+
+    viewset_class = None
+    actions = LIST_ACTIONS
+    sync_view = None
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):  # noqa: N805
+        """
+        Create the view with the synchronous viewset view for writes.
+
+        Args:
+            initkwargs: attributes of the view, e.g. `viewset_class` and `actions`.
+
+        Returns:
+            return: view function.
+        """
+        viewset_class = initkwargs.get('viewset_class', cls.viewset_class)
+        actions = initkwargs.get('actions', cls.actions)
+        initkwargs['sync_view'] = viewset_class.as_view(dict(actions))
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def get(self, request, *args, **kwargs):
+        """
+        Read the rows in the same way as the viewset.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        viewset = self.viewset_class(action_map=dict.fromkeys(READ_METHODS, self.actions[GET]))
+        viewset.args = args
+        viewset.kwargs = kwargs
+        viewset.request = viewset.initialize_request(request, *args, **kwargs)
+        viewset.headers = viewset.default_response_headers
+        try:
+            response = await self.read(viewset)
+        except Exception as exc:
+            response = viewset.handle_exception(exc)
+        return viewset.finalize_response(viewset.request, response, *args, **kwargs)
+
+    async def read(self, viewset):
+        """
+        Check the access in a thread and run the read action of the viewset.
+
+        Args:
+            viewset: viewset prepared for the request.
+
+        Returns:
+            return: Response
+        """
+        await sync_to_async(viewset.initial)(viewset.request, *viewset.args, **viewset.kwargs)
+        return await getattr(self, viewset.action)(viewset, viewset.request)
+
+    async def head(self, request, *args, **kwargs):
+        """
+        Read the rows without the body.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        return await self.get(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        """
+        Pass a write to the synchronous viewset.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+    put = post
+    patch = post
+    delete = post
+    options = post
+
+    async def list(self, viewset, request):
+        """
+        List one page of rows or answer that the client's copy is still valid.
+
+        Args:
+            viewset: viewset prepared for the request;
+            request: DRF request.
+
+        Returns:
+            return: Response
+        """
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        aggregated = await queryset.order_by().aaggregate(last_modified=Max(MODIFIED))
+        not_modified = viewset.check_validators(
+            request,
+            aggregated[LAST_MODIFIED_KEY],
+            *[await aget_version(name) for name in list_versions(queryset.model, request.user)],
+        )
+        if not_modified:
+            return not_modified
+        plan = compile_plan(viewset.get_serializer())
+        if plan is None:
+            page = await paginate(viewset, request, queryset)
+            return respond(viewset, viewset.get_serializer(page, many=True).data)
+        ordering = getattr(viewset.pagination_class, 'ordering', ())
+        page = await paginate(viewset, request, plan.values_queryset(queryset, ordering))
+        return respond(viewset, await plan.aserialize(page))
+
+    async def retrieve(self, viewset, request):
+        """
+        Retrieve a row or answer that the client's copy is still valid.
+
+        Args:
+            viewset: viewset prepared for the request;
+            request: DRF request.
+
+        Returns:
+            return: Response
+        """
+        lookup = {viewset.lookup_field: viewset.kwargs[viewset.lookup_url_kwarg or viewset.lookup_field]}
+        queryset = viewset.filter_queryset(viewset.get_queryset()).filter(**lookup)
+        last_modified = await queryset.values_list(MODIFIED, flat=True).afirst()
+        not_modified = last_modified and viewset.check_validators(request, last_modified)
+        if not_modified:
+            return not_modified
+        instance = await aget_object_or_404(queryset)
+        viewset.check_object_permissions(request, instance)
+        return Response(viewset.get_serializer(instance).data)
+
+
+async def paginate(viewset, request, queryset) -> list:
+    """
+    Fetch the rows of the requested page, or all rows if the viewset is not paginated.
+
+    Args:
+        viewset: viewset prepared for the request;
+        request: DRF request;
+        queryset: rows to paginate.
+
+    Returns:
+        list: fetched rows.
+    """
+    if viewset.paginator is None:
+        return [row async for row in queryset]
+    return await viewset.paginator.apaginate_queryset(queryset, request, view=viewset)
+
+
+def respond(viewset, page_data):
+    """
+    Wrap the serialized rows in a response, paginated if the viewset is.
+
+    Args:
+        viewset: viewset prepared for the request;
+        page_data: serialized rows.
+
+    Returns:
+        return: Response
+    """
+    if viewset.paginator is None:
+        return Response(page_data)
+    return viewset.get_paginated_response(page_data)
+
+
+class TaskEventsView(View):
+    """API endpoint that streams new comments and status changes of a task as Server-Sent Events."""
+
+    async def get(self, request, pk):
+        """
+        Subscribe to the events of a task the user may see.
+
+        Args:
+            request: user's request with the `since` parameter or the `Last-Event-ID` header;
+            pk: task id.
+
+        Raises:
+            PermissionDenied: if the user is anonymous;
+            Http404: if there is no such task or the user may not see it.
+
+        Returns:
+            return: StreamingHttpResponse
+        """
+        if not isinstance(request, ASGIRequest):
+            return HttpResponse('Events are streamed under ASGI only.', status=status.HTTP_501_NOT_IMPLEMENTED)
+        try:
+            since = parse_datetime(request.headers.get('Last-Event-ID') or request.GET.get('since', ''))
+        except ValueError:
+            return HttpResponseBadRequest('Malformed event id.')
+        user = await request.auser()
+        if not user.is_authenticated:
+            raise PermissionDenied
+        tasks = models.Task.objects.filter(pk=pk)
+        if not user.is_staff:
+            tasks = tasks.filter(visible_tasks(user.id))
+        if not await tasks.aexists():
+            raise Http404
+        response = StreamingHttpResponse(task_events(pk, since), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
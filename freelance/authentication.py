@@ -0,0 +1,209 @@
+"""
+This module contains the authentication of the API.
+
+`CachedTokenAuthentication` resolves a token to its user without the queries of
+`TokenAuthentication`. Every process keeps the resolved tokens in a bounded LRU,
+and all processes share them through the Django cache. A resolved token is tagged
+with the version of its user read before the token is loaded from the primary
+database, never from a lagging replica; the signals replace
+the version when the user is saved or deleted (e.g. deactivated) or when the token
+is deleted, so the stale copies are dropped by every worker.
+
+Only the token and the user fields the views check are cached, never the password hash;
+the instances are rebuilt for every request, so a view may modify them, and the other
+user fields are loaded on access.
+"""
+
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+from . import metrics, routers
+from .versions import get_version, user_version
+
+RESOLVED_KEY = 'freelance:token:{0}'
+DEFAULT_CACHE_SIZE = 1024
+METRICS_NAME = 'tokens'
+USER_FIELDS = frozenset(('id', 'username', 'is_active', 'is_staff', 'is_superuser'))
+
+
+def cached_fields(model) -> list:
+    """
+    Get the cached fields of a model in the order of its columns.
+
+    Args:
+        model: Token or user model.
+
+    Returns:
+        list: field attribute names.
+    """
+    fields = [field.attname for field in model._meta.concrete_fields]  # noqa: WPS437
+    if model is get_user_model():
+        return [field for field in fields if field in USER_FIELDS]
+    return fields
+
+
+def resolved(token) -> tuple:
+    """
+    Get the cached fields of a token and its user.
+
+    Args:
+        token: Token with its user.
+
+    Returns:
+        tuple: values of the token fields and of the user fields.
+    """
+    return (
+        tuple(getattr(token, field) for field in cached_fields(type(token))),
+        tuple(getattr(token.user, field) for field in cached_fields(type(token.user))),
+    )
+
+
+def rebuild(token_model, token_values, user_values):
+    """
+    Build a token and its user from their cached fields.
+
+    Args:
+        token_model: Token model;
+        token_values: values of the token fields;
+        user_values: values of the user fields.
+
+    Returns:
+        return: Token with its user.
+    """
+    user_model = get_user_model()
+    token = token_model.from_db(None, cached_fields(token_model), token_values)
+    token.user = user_model.from_db(None, cached_fields(user_model), user_values)
+    return token
+
+
+class TokenCache:
+    """LRU of the resolved tokens of a process, backed by the shared cache."""
+
+    def __init__(self, size):
+        """
+        Create an empty cache.
+
+        Args:
+            size: maximum number of tokens kept by the process.
+        """
+        self.size = size
+        self._tokens = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, digest, token_model):
+        """
+        Get a resolved token if its user has not changed since.
+
+        Args:
+            digest: hash of the token key;
+            token_model: Token model.
+
+        Returns:
+            return: new Token with its user, or None.
+        """
+        with self._lock:
+            cached = self._tokens.get(digest)
+            if cached is not None:
+                self._tokens.move_to_end(digest)
+        if cached is None:
+            cached = cache.get(RESOLVED_KEY.format(digest))
+            if cached is None:
+                return None
+            self._remember(digest, cached)
+        version, token_values, user_values = cached
+        if version != get_version(user_version(user_values[0])):
+            return None
+        return rebuild(token_model, token_values, user_values)
+
+    def set(self, digest, version, token) -> None:
+        """
+        Keep a resolved token in the process and the shared cache.
+
+        Args:
+            digest: hash of the token key;
+            version: version of the user read before the token was loaded;
+            token: Token with its user.
+        """
+        cached = (version, *resolved(token))
+        cache.set(RESOLVED_KEY.format(digest), cached)
+        self._remember(digest, cached)
+
+    def clear(self) -> None:
+        """Forget the tokens kept by the process."""
+        with self._lock:
+            self._tokens.clear()
+
+    def __len__(self) -> int:
+        """
+        Count the tokens kept by the process.
+
+        Returns:
+            int: number of tokens.
+        """
+        return len(self._tokens)
+
+    def _remember(self, digest, cached) -> None:
+        """
+        Keep a token in the process, forgetting the least recently used one if full.
+
+        Args:
+            digest: hash of the token key;
+            cached: version of the user and the fields of the token and the user.
+        """
+        with self._lock:
+            self._tokens[digest] = cached
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > self.size:
+                self._tokens.popitem(last=False)
+
+
+token_cache = TokenCache(getattr(settings, 'TOKEN_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication that resolves the tokens from the cache."""
+
+    def authenticate_credentials(self, key):
+        """
+        Resolve a token to its user, querying it only on a cache miss.
+
+        Args:
+            key: token key from the request.
+
+        Returns:
+            return: user and token.
+        """
+        digest = sha256(key.encode()).hexdigest()
+        token = token_cache.get(digest, self.get_model())
+        metrics.count_cache(METRICS_NAME, token is not None)
+        if token is not None:
+            return token.user, token
+        with routers.primary_reads():
+            user_id, version = self.read_version(key)
+            user, token = super().authenticate_credentials(key)
+        if user.pk == user_id:
+            token_cache.set(digest, version, token)
+        return user, token
+
+    def read_version(self, key) -> tuple:
+        """
+        Read the version of the user of a token before the token is loaded.
+
+        A change of the user made after the version is read leaves a stale copy that is never used.
+
+        Args:
+            key: token key from the request.
+
+        Returns:
+            tuple: user id and version, or Nones for an unknown token.
+        """
+        user_id = self.get_model().objects.filter(key=key).values_list('user_id', flat=True).first()
+        if user_id is None:
+            return None, None
+        return user_id, get_version(user_version(user_id))
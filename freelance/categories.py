@@ -0,0 +1,117 @@
+"""
+This module contains the cache of the categorial models (statuses and positions).
+
+Every process keeps a dictionary of the rows keyed by id. The dictionary is tagged
+with a shared version token; the signals replace the token on every write,
+so all workers reload their copies after a change made through the model, admin or API.
+A worker checks the token at most once per `CATEGORY_VERSION_TTL` seconds, so the other
+workers see a change with that delay while the writing worker sees it at once.
+Writes that bypass the signals (`QuerySet.update`, raw SQL) must call `invalidate` themselves.
+
+The cached instances are shared between requests and must never be modified or saved.
+"""
+
+from threading import Lock
+from time import monotonic
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from . import metrics
+from .versions import bump_version, get_version
+
+ROWS_KEY = 'freelance:categories:{0}:{1}'
+FIELDS = ('id', 'name')
+
+
+class CategoryCache:
+    """Cache of the rows of one categorial model."""
+
+    def __init__(self, model):
+        """
+        Create an empty cache.
+
+        Args:
+            model: CategorialParametr subclass.
+        """
+        self.model = model
+        self._label = model._meta.label_lower  # noqa: WPS437
+        self._version = None
+        self._checked_until = 0
+        self._rows = {}
+        self._lock = Lock()
+
+    def all(self) -> list:
+        """
+        Get all rows in the default ordering.
+
+        Returns:
+            list: model instances.
+        """
+        return list(self._load().values())
+
+    def get(self, pk):
+        """
+        Get a row by its id.
+
+        Args:
+            pk: UUID of the row or None.
+
+        Returns:
+            return: model instance or None.
+        """
+        if pk is None:
+            return None
+        return self._load().get(str(pk))
+
+    def invalidate(self) -> None:
+        """Make every process reload the rows, this one at once."""
+        bump_version(self._label)
+        self._checked_until = 0
+
+    def _load(self) -> dict:
+        """
+        Get the rows of the current version, loading them if needed.
+
+        The shared version is checked only after the local TTL has run out.
+
+        Returns:
+            dict: model instances by string ids.
+        """
+        now = monotonic()
+        if now < self._checked_until:
+            return self._rows
+        version = get_version(self._label)
+        metrics.count_cache(self._label, version == self._version)
+        if version != self._version:
+            with self._lock:
+                rows_key = ROWS_KEY.format(self._label, version)
+                rows = cache.get(rows_key)
+                if rows is None:
+                    rows = list(self.model.objects.using(DEFAULT_DB_ALIAS).values_list(*FIELDS))
+                    cache.set(rows_key, rows)
+                self._rows = {
+                    str(row[0]): self.model.from_db(DEFAULT_DB_ALIAS, FIELDS, row) for row in rows
+                }
+                self._version = version
+        self._checked_until = now + settings.CATEGORY_VERSION_TTL
+        return self._rows
+
+
+_caches = {}
+
+
+def category_cache(model) -> CategoryCache:
+    """
+    Get the cache of a categorial model.
+
+    Args:
+        model: CategorialParametr subclass.
+
+    Returns:
+        CategoryCache: cache of the model.
+    """
+    if model not in _caches:
+        _caches.setdefault(model, CategoryCache(model))
+    return _caches[model]
@@ -0,0 +1,91 @@
+"""
+This module maintains the denormalised counters of the tasks.
+
+`Task.comment_count` and `Task.developer_count` are shifted with F-expressions by the
+signal receivers when comments and developer assignments are written, so the lists read
+them from the task rows instead of counting the related rows of every task. Writes that
+bypass the signals, e.g. `QuerySet.update()` or raw SQL, are fixed by `repair()`.
+"""
+
+from functools import reduce
+from operator import or_
+from types import MappingProxyType
+
+from django.db import models
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import Comment, Task, TaskDeveloper
+
+COMMENT_COUNT = 'comment_count'
+DEVELOPER_COUNT = 'developer_count'
+MODIFIED = 'modified'
+EXPECTED = 'expected_{0}'
+COUNTED_MODELS = MappingProxyType({
+    COMMENT_COUNT: Comment,
+    DEVELOPER_COUNT: TaskDeveloper,
+})
+
+
+def shift(tasks, field, delta) -> int:
+    """
+    Add a number to a counter of the tasks in the database and touch their modification time.
+
+    Args:
+        tasks: queryset of the tasks;
+        field: counter name;
+        delta: number to add, negative to subtract.
+
+    Returns:
+        int: number of updated tasks.
+    """
+    shifted = Greatest(models.F(field) + delta, models.Value(0))
+    return tasks.update(**{field: shifted, MODIFIED: timezone.now()})
+
+
+def count_subquery(field):
+    """
+    Build the expression counting the related rows of a counter for every task.
+
+    Args:
+        field: counter name.
+
+    Returns:
+        return: integer expression over the outer task.
+    """
+    counted = COUNTED_MODELS[field].objects.filter(task=models.OuterRef('pk')).order_by().values('task')
+    number = models.Subquery(counted.annotate(number=models.Count('pk')).values('number'))
+    return Coalesce(number, 0, output_field=models.IntegerField())
+
+
+def recount(tasks, field) -> int:
+    """
+    Count the related rows of a counter again for the tasks and touch their modification time.
+
+    Args:
+        tasks: queryset of the tasks;
+        field: counter name.
+
+    Returns:
+        int: number of updated tasks.
+    """
+    return tasks.update(**{field: count_subquery(field), MODIFIED: timezone.now()})
+
+
+def repair() -> int:
+    """
+    Recount the counters of the tasks whose counters differ from their related rows.
+
+    Returns:
+        int: number of repaired tasks.
+    """
+    expected = {EXPECTED.format(field): count_subquery(field) for field in COUNTED_MODELS}
+    mismatch = reduce(or_, (
+        ~models.Q(**{counter: models.F(EXPECTED.format(counter))}) for counter in COUNTED_MODELS
+    ))
+    broken = Task.objects.annotate(**expected).filter(mismatch)
+    broken_ids = list(broken.values_list('pk', flat=True))
+    tasks = Task.objects.filter(pk__in=broken_ids)
+    for field in COUNTED_MODELS:
+        recount(tasks, field)
+    return len(broken_ids)
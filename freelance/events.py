@@ -0,0 +1,293 @@
+"""
+This module contains the Server-Sent Events of the tasks.
+
+New comments and status changes of a task are published to the channel of the task
+after the commit, and every subscriber of the channel gets them in its queue.
+The backend that delivers the messages is set by `EVENTS_BACKEND`: the in-process one
+reaches the subscribers of the current process only, so deployments with several
+worker processes plug in a shared one, e.g. `freelance.events.RedisBackend`.
+"""
+
+import asyncio
+import json
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from threading import Lock
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from . import models
+from .categories import category_cache
+
+DEFAULT_BACKEND = 'freelance.events.LocalBackend'
+CHANNEL = 'freelance:task:{0}'
+QUEUE_SIZE = 100
+HEARTBEAT = 15
+COMMENT = 'comment'
+STATUS = 'status'
+EVENT = 'id: {0}\nevent: {1}\ndata: {2}\n\n'
+KEEP_ALIVE = ': keep-alive\n\n'
+
+
+def offer(queue, message) -> None:
+    """
+    Put a message to a subscriber's queue, dropping it if the subscriber does not keep up.
+
+    Args:
+        queue: asyncio queue of the subscriber;
+        message: encoded event.
+    """
+    if not queue.full():
+        queue.put_nowait(message)
+
+
+class LocalBackend:
+    """Backend that delivers the messages to the subscribers of the current process."""
+
+    def __init__(self, location=''):
+        """
+        Create a backend without subscribers.
+
+        Args:
+            location: unused.
+        """
+        self._subscribers = {}
+        self._lock = Lock()
+
+    def publish(self, channel, message) -> None:
+        """
+        Deliver a message from any thread.
+
+        Args:
+            channel: channel name;
+            message: encoded event.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(offer, queue, message)
+
+    async def subscribe(self, channel, queue) -> None:
+        """
+        Start delivering the messages of a channel to a queue of the running event loop.
+
+        Args:
+            channel: channel name;
+            queue: asyncio queue.
+        """
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add((asyncio.get_running_loop(), queue))
+
+    async def unsubscribe(self, channel, queue) -> None:
+        """
+        Stop delivering the messages of a channel to a queue.
+
+        Args:
+            channel: channel name;
+            queue: asyncio queue.
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(channel, set())
+            subscribers.discard((asyncio.get_running_loop(), queue))
+            if not subscribers:
+                self._subscribers.pop(channel, None)
+
+
+class RedisBackend:
+    """Backend that delivers the messages through Redis pub/sub to the subscribers of all processes."""
+
+    def __init__(self, location):
+        """
+        Connect to Redis; the `redis` package is needed only by this backend.
+
+        Args:
+            location: Redis URL.
+        """
+        import redis  # noqa: WPS433
+        from redis import asyncio as aioredis  # noqa: WPS433
+
+        self._client = redis.Redis.from_url(location)
+        self._async_client = aioredis.Redis.from_url(location)
+        self._listeners = {}
+
+    def publish(self, channel, message) -> None:
+        """
+        Publish a message.
+
+        Args:
+            channel: channel name;
+            message: encoded event.
+        """
+        self._client.publish(channel, message)
+
+    async def subscribe(self, channel, queue) -> None:
+        """
+        Subscribe to a channel, then copy its messages to a queue in a task of the running event loop.
+
+        Args:
+            channel: channel name;
+            queue: asyncio queue.
+        """
+        pubsub = self._async_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        listener = asyncio.get_running_loop().create_task(self._listen(pubsub, queue))
+        self._listeners[id(queue)] = (listener, pubsub)
+
+    async def unsubscribe(self, channel, queue) -> None:
+        """
+        Stop listening to a channel.
+
+        Args:
+            channel: channel name;
+            queue: asyncio queue.
+        """
+        listener, pubsub = self._listeners.pop(id(queue))
+        listener.cancel()
+        await pubsub.aclose()
+
+    async def _listen(self, pubsub, queue) -> None:
+        """
+        Copy the messages of a subscription to a queue.
+
+        Args:
+            pubsub: subscribed Redis pub/sub connection;
+            queue: asyncio queue.
+        """
+        async for redis_message in pubsub.listen():
+            offer(queue, redis_message['data'].decode('utf-8'))
+
+
+class Broker:
+    """Broker of the events of the tasks."""
+
+    def __init__(self, backend):
+        """
+        Create a broker.
+
+        Args:
+            backend: backend delivering the messages.
+        """
+        self.backend = backend
+
+    def publish(self, task_id, event_id, kind, payload) -> None:
+        """
+        Publish an event of a task after the current transaction is committed.
+
+        Args:
+            task_id: task id;
+            event_id: event id, the time of the event;
+            kind: event type;
+            payload: JSON compatible data of the event.
+        """
+        message = format_event(event_id, kind, payload)
+        transaction.on_commit(lambda: self.backend.publish(CHANNEL.format(task_id), message))
+
+    @asynccontextmanager
+    async def subscription(self, task_id):
+        """
+        Subscribe to the events of a task; the subscription is active when the queue is given.
+
+        Args:
+            task_id: task id.
+
+        Yields:
+            Queue: asyncio queue of encoded events.
+        """
+        channel = CHANNEL.format(task_id)
+        queue = asyncio.Queue(QUEUE_SIZE)
+        async with AsyncExitStack() as stack:
+            await self.backend.subscribe(channel, queue)
+            stack.push_async_callback(self.backend.unsubscribe, channel, queue)
+            yield queue
+
+
+@lru_cache(maxsize=None)
+def broker() -> Broker:
+    """
+    Get the broker of the process.
+
+    Returns:
+        Broker: broker with the configured backend.
+    """
+    backend_class = import_string(getattr(settings, 'EVENTS_BACKEND', DEFAULT_BACKEND))
+    return Broker(backend_class(getattr(settings, 'EVENTS_LOCATION', '')))
+
+
+def format_event(event_id, kind, payload) -> str:
+    """
+    Encode an event in the `text/event-stream` format.
+
+    Args:
+        event_id: event id, the time of the event;
+        kind: event type;
+        payload: JSON compatible data of the event.
+
+    Returns:
+        str: encoded event.
+    """
+    return EVENT.format(event_id.isoformat(), kind, json.dumps(payload, separators=(',', ':')))
+
+
+def comment_payload(comment) -> dict:
+    """
+    Get the data of a comment event.
+
+    Args:
+        comment: comment with its owner.
+
+    Returns:
+        dict: comment data.
+    """
+    return {
+        'id': str(comment.id),
+        'owner': comment.owner.developer.username,
+        'content': comment.comment_content,
+        'published': comment.publication_date.isoformat(),
+    }
+
+
+def status_payload(task) -> dict:
+    """
+    Get the data of a status event.
+
+    Args:
+        task: task with a new status.
+
+    Returns:
+        dict: status data.
+    """
+    task_status = category_cache(models.Status).get(task.status_id)
+    return {
+        STATUS: str(task.status_id) if task.status_id else None,
+        'name': task_status.name if task_status else None,
+    }
+
+
+async def task_events(task_id, since=None):
+    """
+    Stream the events of a task, starting with the comments published after a time.
+
+    The subscription starts before the missed comments are read, so no comment is lost
+    between the page render or a reconnection and the subscription.
+
+    Args:
+        task_id: task id;
+        since: time of the last event the client has, None for no missed comments.
+
+    Yields:
+        str: encoded events and keep-alive comments.
+    """
+    async with broker().subscription(task_id) as queue:
+        if since is not None:
+            missed = models.Comment.objects.filter(
+                task_id=task_id, publication_date__gt=since,
+            ).select_related('owner__developer').order_by('publication_date', 'id')
+            async for comment in missed:
+                yield format_event(comment.publication_date, COMMENT, comment_payload(comment))
+        while True:  # noqa: WPS457
+            try:
+                yield await asyncio.wait_for(queue.get(), HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield KEEP_ALIVE
@@ -0,0 +1,193 @@
+"""
+This module contains the streaming export of tasks with their developers and comments.
+
+The tasks are walked with a chunked server-side iterator and every record is turned
+into an NDJSON or CSV line as soon as it is read, so memory stays flat for any table size.
+Under ASGI the lines are handed out by an async iterator that reads them in batches through
+`sync_to_async`, since Django would collect a sync iterator into a list before sending it.
+"""
+
+import csv
+import json
+from contextlib import asynccontextmanager
+from itertools import islice
+from types import MappingProxyType
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Prefetch
+
+from .models import Comment, Developer, Task
+from .pagination import COMMENT_ORDERING
+
+CHUNK_SIZE = 2000
+LINES_PER_BATCH = 200
+NDJSON = 'ndjson'
+CSV = 'csv'
+FORMATS = (NDJSON, CSV)
+CONTENT_TYPES = MappingProxyType({NDJSON: 'application/x-ndjson', CSV: 'text/csv'})
+ID = 'id'
+OWNER = 'owner'
+DEVELOPERS = 'developers'
+COMMENTS = 'comments'
+COLUMNS = (ID, 'name', 'description', 'status', OWNER, 'created', DEVELOPERS, COMMENTS)
+
+
+class Echo:
+    """File-like object that returns what is written instead of storing it."""
+
+    def write(self, line_value):
+        """
+        Return the written value.
+
+        Args:
+            line_value: written value.
+
+        Returns:
+            return: the same value.
+        """
+        return line_value
+
+
+def export_queryset():
+    """
+    Get tasks with all related rows needed by the export.
+
+    Returns:
+        queryset: tasks.
+    """
+    return Task.objects.select_related(OWNER, 'status').prefetch_related(
+        Prefetch(DEVELOPERS, queryset=Developer.objects.select_related('developer', 'position')),
+        Prefetch(COMMENTS, queryset=Comment.objects.select_related('owner__developer').order_by(
+            *COMMENT_ORDERING,
+        )),
+    ).order_by(ID)
+
+
+def task_record(task) -> dict:
+    """
+    Convert a task to an export record.
+
+    Args:
+        task: task with prefetched related rows.
+
+    Returns:
+        dict: JSON compatible record.
+    """
+    return {
+        ID: str(task.id),
+        'name': task.name,
+        'description': task.description,
+        'status': task.status.name if task.status else None,
+        OWNER: task.owner.username,
+        'created': task.created.isoformat(),
+        DEVELOPERS: [
+            {
+                ID: str(developer.id),
+                'username': developer.developer.username,
+                'position': developer.position.name if developer.position else None,
+            }
+            for developer in task.developers.all()
+        ],
+        COMMENTS: [
+            {
+                ID: str(comment.id),
+                OWNER: comment.owner.developer.username,
+                'content': comment.comment_content,
+                'published': comment.publication_date.isoformat(),
+            }
+            for comment in task.comments.all()
+        ],
+    }
+
+
+def task_records(chunk_size=CHUNK_SIZE):
+    """
+    Iterate over the export records of all tasks.
+
+    Args:
+        chunk_size: number of tasks read from the database at once.
+
+    Yields:
+        dict: export record.
+    """
+    yield from (task_record(task) for task in export_queryset().iterator(chunk_size=chunk_size))
+
+
+def export_lines(export_format, chunk_size=CHUNK_SIZE):
+    """
+    Iterate over the lines of the export.
+
+    Args:
+        export_format: 'ndjson' or 'csv';
+        chunk_size: number of tasks read from the database at once.
+
+    Yields:
+        str: line of the export.
+    """
+    records = task_records(chunk_size)
+    if export_format == NDJSON:
+        yield from (f'{json.dumps(record, ensure_ascii=False)}\n' for record in records)
+        return
+    writer = csv.writer(Echo())
+    yield writer.writerow(COLUMNS)
+    for record in records:
+        record[DEVELOPERS] = json.dumps(record[DEVELOPERS], ensure_ascii=False)
+        record[COMMENTS] = json.dumps(record[COMMENTS], ensure_ascii=False)
+        yield writer.writerow([record[column] for column in COLUMNS])
+
+
+@asynccontextmanager
+async def closed_in_thread(lines):
+    """
+    Close sync lines in the thread of the database connection once they are no longer read.
+
+    Args:
+        lines: sync generator of lines.
+
+    Yields:
+        generator: the same lines.
+    """
+    try:
+        yield lines
+    finally:
+        await sync_to_async(lines.close)()
+
+
+async def aexport_lines(export_format, chunk_size=CHUNK_SIZE, batch_size=LINES_PER_BATCH):
+    """
+    Iterate asynchronously over the lines of the export.
+
+    The sync lines are read in batches in the thread of the request's database connection,
+    so the server-side cursor is kept and only one batch is held in memory.
+
+    Args:
+        export_format: 'ndjson' or 'csv';
+        chunk_size: number of tasks read from the database at once;
+        batch_size: number of lines read by one thread switch.
+
+    Yields:
+        str: lines of the export joined by batches.
+    """
+    async with closed_in_thread(export_lines(export_format, chunk_size)) as lines:
+        read_batch = sync_to_async(lambda: ''.join(islice(lines, batch_size)))
+        batch = await read_batch()
+        while batch:
+            yield batch
+            batch = await read_batch()
+
+
+def streamed_lines(request, export_format):
+    """
+    Get the lines of the export as the server of a request streams them.
+
+    Args:
+        request: DRF request;
+        export_format: 'ndjson' or 'csv'.
+
+    Returns:
+        iterator: async iterator under ASGI, sync one under WSGI.
+    """
+    if isinstance(request._request, ASGIRequest):  # noqa: WPS437
+        return aexport_lines(export_format)
+    return export_lines(export_format)
@@ -0,0 +1,132 @@
+"""
+This module contains the sparse fieldsets of the API.
+
+The `fields` query parameter selects the serializer fields of a response,
+and the queryset is restricted to the columns and relations those fields read,
+so large text columns that are not requested are never loaded from the database.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from .timing import SERIALIZE, timed
+
+FIELDS = 'fields'
+ALL_FIELDS = '*'
+LOOKUP_SEP = '__'
+
+
+def requested_fields(request):
+    """
+    Get the field names selected by the request.
+
+    Args:
+        request: user's request or None.
+
+    Returns:
+        set: field names, None if the request does not select fields.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    selector = request.query_params.get(FIELDS)
+    if not selector:
+        return None
+    return {name.strip() for name in selector.split(',') if name.strip()}
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """Serializer that drops the fields not selected by the `fields` query parameter."""
+
+    def __init__(self, *args, **kwargs):
+        """
+        Drop the fields not selected by the request.
+
+        Args:
+            args: position args;
+            kwargs: keyword args.
+
+        Raises:
+            ValidationError: if an unknown field is selected.
+        """
+        super().__init__(*args, **kwargs)
+        requested = requested_fields(self.context.get('request'))
+        if requested is None:
+            return
+        unknown = requested - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError({FIELDS: [f'Unknown field "{name}".' for name in sorted(unknown)]})
+        for name in set(self.fields) - requested:
+            self.fields.pop(name)
+
+    @timed(SERIALIZE)
+    def to_representation(self, instance):
+        """
+        Serialize a row, adding the time to the measured request.
+
+        Args:
+            instance: model object.
+
+        Returns:
+            return: serialized row.
+        """
+        return super().to_representation(instance)
+
+
+def load_only(queryset, serializer, extra_columns=()):
+    """
+    Restrict a queryset to what a serializer reads.
+
+    Related objects read through dotted sources are joined, many-to-many fields are prefetched,
+    and every other column is deferred.
+
+    Args:
+        queryset: queryset of the serialized model;
+        serializer: serializer with the selected fields;
+        extra_columns: columns read by others, e.g. the pagination.
+
+    Returns:
+        queryset: restricted queryset.
+    """
+    opts = queryset.model._meta  # noqa: WPS437
+    columns = {opts.pk.name, *extra_columns}
+    joined = set()
+    prefetched = set()
+    try:
+        for field in serializer.fields.values():
+            column, join, prefetch = field_paths(opts, field)
+            columns.add(column)
+            joined.add(join)
+            prefetched.add(prefetch)
+    except FieldDoesNotExist:
+        return queryset
+    for paths in (columns, joined, prefetched):
+        paths.discard(None)
+    queryset = queryset.select_related(None).prefetch_related(None).prefetch_related(*prefetched)
+    if joined:
+        queryset = queryset.select_related(*joined)
+    return queryset.only(*columns)
+
+
+def field_paths(opts, field) -> tuple:
+    """
+    Get the lookup paths a serializer field reads.
+
+    Args:
+        opts: model options;
+        field: serializer field.
+
+    Raises:
+        FieldDoesNotExist: if the field does not read a model field.
+
+    Returns:
+        tuple: loaded column, joined relation and prefetched relation, None for the unused ones.
+    """
+    if field.source == ALL_FIELDS:
+        raise FieldDoesNotExist(field.field_name)
+    model_field = opts.get_field(field.source_attrs[0])
+    if model_field.many_to_many or model_field.one_to_many:
+        return None, None, model_field.name
+    if len(field.source_attrs) > 1:
+        return LOOKUP_SEP.join(field.source_attrs), LOOKUP_SEP.join(field.source_attrs[:-1]), None
+    return model_field.name, None, None
@@ -6,10 +6,75 @@ Each form class extends forms.ModelForm and has a nested Meta class that defines
 
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
-from django.forms import ModelForm
+from django.core.exceptions import ValidationError
+from django.forms import ModelChoiceField, ModelForm
+from django.forms.models import ModelChoiceIterator
 
+from .categories import category_cache
 from .models import Comment, Developer, Task
 
+INVALID_CHOICE = 'invalid_choice'
+STATUS = 'status'
+
+
+class CategoryChoiceIterator(ModelChoiceIterator):
+    """Choice iterator that reads statuses or positions from the cache."""
+
+    def __iter__(self):
+        """
+        Iterate over the choices.
+
+        Yields:
+            tuple: choice value and label.
+        """
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        yield from (self.choice(category) for category in category_cache(self.queryset.model).all())
+
+    def __len__(self) -> int:
+        """
+        Count the choices.
+
+        Returns:
+            int: number of choices.
+        """
+        return len(category_cache(self.queryset.model).all()) + (self.field.empty_label is not None)
+
+
+class CategoryChoiceField(ModelChoiceField):
+    """Choice field of a categorial model that does not query the database."""
+
+    iterator = CategoryChoiceIterator
+
+    def to_python(self, choice_value):
+        """
+        Get the chosen status or position.
+
+        Args:
+            choice_value: submitted id.
+
+        Raises:
+            ValidationError: if there is no such row.
+
+        Returns:
+            return: model instance or None.
+        """
+        if choice_value in self.empty_values:
+            return None
+        model = self.queryset.model
+        try:
+            pk = model._meta.pk.to_python(choice_value)  # noqa: WPS437
+        except ValidationError:
+            pk = None
+        category = category_cache(model).get(pk)
+        if category is None:
+            raise ValidationError(
+                self.error_messages[INVALID_CHOICE],
+                code=INVALID_CHOICE,
+                params={'value': choice_value},
+            )
+        return category
+
 
 class RegistrationForm(UserCreationForm):
     """
@@ -37,6 +102,7 @@ class DeveloperCreatigForm(ModelForm):
 
         model = Developer
         fields = ('position',)
+        field_classes = {'position': CategoryChoiceField}
 
 
 class CommentForm(ModelForm):
@@ -64,7 +130,8 @@ class TaskForm(ModelForm):
         """Configuration class for Task form."""
 
         model = Task
-        fields = ('name', 'description', 'status', 'developers', 'created')
+        fields = ('name', 'description', STATUS, 'developers', 'created')
+        field_classes = {STATUS: CategoryChoiceField}
 
 
 class TaskEditForm(ModelForm):
@@ -78,4 +145,5 @@ class TaskEditForm(ModelForm):
         """Configuration class for Task form."""
 
         model = Task
-        fields = ('status',)
+        fields = (STATUS,)
+        field_classes = {STATUS: CategoryChoiceField}
@@ -0,0 +1,355 @@
+"""
+This module contains the bulk import of tasks with their developers and comments.
+
+The input has the shape of the export: one record per task with nested developers and comments.
+Statuses, positions, users and developers are resolved through dictionaries built once,
+and the rows are inserted in batches with `bulk_create(ignore_conflicts=True)`.
+Every row gets a UUID primary key taken from the input or derived from its content,
+so an import interrupted by a crash can be restarted without duplicating rows.
+The rows that already exist are left out of a batch; the counters of the existing tasks
+that get new developers or comments are recounted, and their new developers are counted
+in the status summaries.
+"""
+
+import csv
+import json
+from uuid import NAMESPACE_URL, UUID, uuid5
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import counters, models, search, summaries, versions
+from .categories import category_cache
+
+BATCH_SIZE = 1000
+NAMESPACE = uuid5(NAMESPACE_URL, 'freelance/import')
+ID = 'id'
+NAME = 'name'
+OWNER = 'owner'
+CREATED = 'created'
+DEVELOPERS = 'developers'
+DEVELOPER_ID = 'developer_id'
+TASK_ID = 'task_id'
+COMMENTS = 'comments'
+USERNAME = 'username'
+POSITION = 'position'
+NESTED_COLUMNS = (DEVELOPERS, COMMENTS)
+RECORD_ERRORS = (KeyError, TypeError, ValueError, ValidationError)
+
+
+def read_records(stream, input_format):
+    """
+    Iterate over the records of an NDJSON or CSV stream.
+
+    Args:
+        stream: text stream;
+        input_format: 'ndjson' or 'csv'.
+
+    Yields:
+        dict: record.
+    """
+    if input_format == 'csv':
+        for row in csv.DictReader(stream):
+            for column in NESTED_COLUMNS:
+                row[column] = json.loads(row.get(column) or '[]')
+            yield row
+        return
+    yield from (json.loads(line) for line in stream if line.strip())
+
+
+def parse_time(text):
+    """
+    Parse a time of the input, taking the times without an offset as local.
+
+    Args:
+        text: ISO 8601 time.
+
+    Returns:
+        return: aware datetime, or None if the text is not a time.
+    """
+    parsed = parse_datetime(text)
+    if parsed is not None and timezone.is_naive(parsed):
+        return timezone.make_aware(parsed)
+    return parsed
+
+
+def stable_id(given_id, *parts) -> UUID:
+    """
+    Get the id of an imported row.
+
+    Args:
+        given_id: id from the input or None;
+        parts: values identifying the row when no id is given.
+
+    Returns:
+        UUID: row id.
+    """
+    if given_id:
+        return UUID(str(given_id))
+    return uuid5(NAMESPACE, '\n'.join(str(part) for part in parts))
+
+
+class References:
+    """Dictionaries of statuses, positions, users and developers built once per import."""
+
+    def __init__(self):
+        """Load the dictionaries."""
+        self.statuses = dict(models.Status.objects.values_list(NAME, ID))
+        self.positions = dict(models.Position.objects.values_list(NAME, ID))
+        self.users = dict(User.objects.values_list(USERNAME, ID))
+        self.developers = dict(models.Developer.objects.values_list(DEVELOPER_ID, ID))
+
+    def developer(self, username) -> UUID:
+        """
+        Get the developer id of a username.
+
+        Args:
+            username: username.
+
+        Returns:
+            UUID: developer id.
+        """
+        return self.developers[self.users[username]]
+
+    def resolve(self, records) -> None:
+        """
+        Create the statuses, positions, users and developers missing in the dictionaries.
+
+        Args:
+            records: list of records.
+        """
+        developers = [developer for record in records for developer in record.get(DEVELOPERS) or ()]
+        commenters = [
+            {USERNAME: comment.get(OWNER)} for record in records for comment in record.get(COMMENTS) or ()
+        ]
+        self.add_categories(models.Status, self.statuses, {record.get('status') for record in records})
+        self.add_categories(models.Position, self.positions, {entry.get(POSITION) for entry in developers})
+        self.add_users(
+            {record.get(OWNER) for record in records} | {entry.get(USERNAME) for entry in developers + commenters},
+        )
+        self.add_developers(developers + commenters)
+
+    def add_categories(self, model, known, names) -> None:
+        """
+        Create missing statuses or positions.
+
+        Args:
+            model: Status or Position;
+            known: dictionary of ids by names;
+            names: names used by the batch.
+        """
+        missing = [name for name in names if name and name not in known]
+        if not missing:
+            return
+        rows = [model(id=stable_id(None, model.__name__, name), name=name) for name in missing]
+        model.objects.bulk_create(rows, ignore_conflicts=True)
+        known.update((row.name, row.id) for row in rows)
+        category_cache(model).invalidate()
+
+    def add_users(self, usernames) -> None:
+        """
+        Create missing users with unusable passwords.
+
+        Args:
+            usernames: usernames used by the batch.
+        """
+        missing = [username for username in usernames if username and username not in self.users]
+        if not missing:
+            return
+        User.objects.bulk_create(
+            [User(username=username, password=make_password(None)) for username in missing],
+            ignore_conflicts=True,
+        )
+        self.users.update(User.objects.filter(username__in=missing).values_list(USERNAME, ID))
+
+    def add_developers(self, developers) -> None:
+        """
+        Create missing developer profiles.
+
+        Args:
+            developers: developer entries used by the batch.
+        """
+        missing = {}
+        for developer in developers:
+            user_id = self.users.get(developer.get(USERNAME))
+            if user_id is not None and user_id not in self.developers:
+                missing.setdefault(user_id, models.Developer(
+                    id=stable_id(developer.get(ID), DEVELOPERS, user_id),
+                    developer_id=user_id,
+                    position_id=self.positions.get(developer.get(POSITION)),
+                ))
+        if not missing:
+            return
+        models.Developer.objects.bulk_create(missing.values(), ignore_conflicts=True)
+        self.developers.update(
+            models.Developer.objects.filter(developer_id__in=missing).values_list(DEVELOPER_ID, ID),
+        )
+
+
+def new_rows(tasks, assignments, comments) -> tuple:
+    """
+    Leave out the rows of a batch that already exist.
+
+    Args:
+        tasks: unsaved tasks;
+        assignments: unsaved assignments;
+        comments: unsaved comments.
+
+    Returns:
+        tuple: tasks, assignments and comments to insert.
+    """
+    task_ids = [task.pk for task in tasks]
+    existing_tasks = set(models.Task.objects.filter(pk__in=task_ids).order_by().values_list(ID, flat=True))
+    existing_assignments = set(
+        models.TaskDeveloper.objects.filter(task_id__in=task_ids).order_by().values_list(TASK_ID, DEVELOPER_ID),
+    )
+    existing_comments = set(
+        models.Comment.objects.filter(pk__in=[comment.pk for comment in comments]).order_by().values_list(
+            ID, flat=True,
+        ),
+    )
+    return (
+        [task for task in tasks if task.pk not in existing_tasks],
+        [row for row in assignments if (row.task_id, row.developer_id) not in existing_assignments],
+        [comment for comment in comments if comment.pk not in existing_comments],
+    )
+
+
+def recount_existing(new_task_ids, assignments, comments) -> None:
+    """
+    Recount the counters of the existing tasks that get new developers or comments.
+
+    Args:
+        new_task_ids: ids of the inserted tasks, whose counters are set already;
+        assignments: inserted assignments;
+        comments: inserted comments.
+    """
+    counted_rows = ((counters.DEVELOPER_COUNT, assignments), (counters.COMMENT_COUNT, comments))
+    for field, rows in counted_rows:
+        task_ids = {row.task_id for row in rows} - new_task_ids
+        if task_ids:
+            counters.recount(models.Task.objects.filter(pk__in=task_ids), field)
+
+
+class TaskImporter:
+    """Importer of task records that counts processed records and inserted rows."""
+
+    def __init__(self, imported=0):
+        """
+        Load the references.
+
+        Args:
+            imported: number of records processed by a previous run.
+        """
+        self.references = References()
+        self.imported = imported
+        self.rows = 0
+        self.errors = []
+
+    def run(self, records, batch_size=BATCH_SIZE):
+        """
+        Import the records batch by batch.
+
+        Args:
+            records: iterable of records;
+            batch_size: number of records inserted in one transaction.
+
+        Yields:
+            int: number of records processed so far.
+        """
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                self.import_batch(batch)
+                batch = []
+                yield self.imported
+        if batch:
+            self.import_batch(batch)
+            yield self.imported
+
+    def import_batch(self, records) -> None:
+        """
+        Insert one batch of records in a transaction.
+
+        Args:
+            records: list of records.
+        """
+        with transaction.atomic():
+            self.references.resolve(records)
+            tasks, assignments, comments = new_rows(*self.build_batch(records))
+            models.Task.objects.bulk_create(tasks, ignore_conflicts=True)
+            models.TaskDeveloper.objects.bulk_create(assignments, ignore_conflicts=True)
+            models.Comment.objects.bulk_create(comments, ignore_conflicts=True)
+            search.index_documents(tasks, comments)
+            summaries.add_tasks(tasks, assignments)
+            recount_existing({task.pk for task in tasks}, assignments, comments)
+            for model in (models.Task, models.Comment):
+                versions.bump_version(versions.shared_version(model))
+        self.imported += len(records)
+        self.rows += len(tasks) + len(assignments) + len(comments)
+
+    def build_batch(self, records) -> tuple:
+        """
+        Build the rows of a batch.
+
+        Records that can not be converted are skipped and reported in `errors`.
+
+        Args:
+            records: list of records.
+
+        Returns:
+            tuple: unsaved tasks, assignments and comments.
+        """
+        tasks, assignments, comments = [], [], []
+        for number, record in enumerate(records, start=self.imported + 1):
+            try:
+                rows = self.build_rows(record)
+            except RECORD_ERRORS as error:
+                self.errors.append(f'record {number}: {error!r}')
+                continue
+            tasks.append(rows[0])
+            assignments.extend(rows[1])
+            comments.extend(rows[2])
+        return tasks, assignments, comments
+
+    def build_rows(self, record) -> tuple:
+        """
+        Build the rows of a record.
+
+        Args:
+            record: task record.
+
+        Returns:
+            tuple: unsaved task, its assignments and its comments.
+        """
+        created = parse_time(record[CREATED]) if record.get(CREATED) else timezone.now()
+        models.time_traveler_trap(created)
+        task = models.Task(
+            id=stable_id(record.get(ID), record[OWNER], record[NAME], record.get(CREATED)),
+            name=record[NAME],
+            description=record.get('description') or '',
+            owner_id=self.references.users[record[OWNER]],
+            status_id=self.references.statuses.get(record.get('status')),
+            created=created,
+        )
+        developer_ids = {
+            self.references.developer(developer[USERNAME]) for developer in record.get(DEVELOPERS) or ()
+        }
+        comments = [
+            models.Comment(
+                id=stable_id(comment.get(ID), task.id, index),
+                task_id=task.id,
+                owner_id=self.references.developer(comment[OWNER]),
+                comment_content=comment.get('content') or '',
+                publication_date=parse_time(comment['published']) if comment.get('published') else created,
+            )
+            for index, comment in enumerate(record.get(COMMENTS) or ())
+        ]
+        task.developer_count = len(developer_ids)
+        task.comment_count = len(comments)
+        return task, [models.TaskDeveloper(task_id=task.id, developer_id=pk) for pk in developer_ids], comments
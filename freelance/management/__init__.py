@@ -0,0 +1 @@
+"""Management package of the freelance application."""
@@ -0,0 +1,40 @@
+"""Command that exports tasks with their developers and comments."""
+
+from django.core.management.base import BaseCommand
+
+from freelance.export import CHUNK_SIZE, FORMATS, NDJSON, export_lines
+
+STDOUT = '-'
+
+
+class Command(BaseCommand):
+    """Stream all tasks to a file as NDJSON or CSV."""
+
+    help = 'Export tasks with their status, owner, developers and comments.'
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments.
+
+        Args:
+            parser: argument parser.
+        """
+        parser.add_argument('--format', choices=FORMATS, default=NDJSON, dest='export_format')
+        parser.add_argument('--output', default=STDOUT, help='File path, "-" for stdout.')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """
+        Write the export.
+
+        Args:
+            args: position args;
+            options: command options.
+        """
+        lines = export_lines(options['export_format'], options['chunk_size'])
+        if options['output'] == STDOUT:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+            output.writelines(lines)
@@ -0,0 +1,69 @@
+"""Command that imports tasks with their developers and comments."""
+
+import sys
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+
+from freelance.export import CSV, FORMATS, NDJSON
+from freelance.importer import BATCH_SIZE, TaskImporter, read_records
+
+STDIN = '-'
+MIN_DURATION = 1e-6
+
+
+class Command(BaseCommand):
+    """Stream tasks from an NDJSON or CSV file into the database."""
+
+    help = 'Import tasks with their status, owner, developers and comments. Safe to restart.'
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments.
+
+        Args:
+            parser: argument parser.
+        """
+        parser.add_argument('input', help='File path, "-" for stdin.')
+        parser.add_argument('--format', choices=FORMATS, dest='input_format')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--skip', type=int, default=0, help='Number of records already imported.')
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """
+        Run the import and report its speed.
+
+        Args:
+            args: position args;
+            options: command options.
+        """
+        path = options['input']
+        input_format = options['input_format'] or NDJSON
+        if path.endswith('.csv') and not options['input_format']:
+            input_format = CSV
+        if path == STDIN:
+            self.load(read_records(sys.stdin, input_format), options)
+            return
+        with open(path, encoding='utf-8', newline='') as stream:
+            self.load(read_records(stream, input_format), options)
+
+    def load(self, records, options) -> None:
+        """
+        Import the records.
+
+        Args:
+            records: iterable of records;
+            options: command options.
+        """
+        importer = TaskImporter(imported=options['skip'])
+        records = islice(records, options['skip'], None)
+        started = time.monotonic()
+        for imported in importer.run(records, options['batch_size']):
+            rate = importer.rows / max(time.monotonic() - started, MIN_DURATION)
+            self.stdout.write(f'{imported} records, {importer.rows} rows inserted, {rate:.0f} rows/s')
+        for error in importer.errors:
+            self.stderr.write(f'Skipped {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {importer.imported - options["skip"] - len(importer.errors)} records',
+        ))
@@ -0,0 +1,21 @@
+"""Command that rebuilds the full-text search index."""
+
+from django.core.management.base import BaseCommand
+
+from freelance.search import rebuild
+
+
+class Command(BaseCommand):
+    """Recreate the search documents of all tasks and comments."""
+
+    help = 'Rebuild the full-text search index of tasks and comments.'
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """
+        Rebuild the index.
+
+        Args:
+            args: position args;
+            options: command options.
+        """
+        self.stdout.write(self.style.SUCCESS(f'Indexed {rebuild()} documents'))
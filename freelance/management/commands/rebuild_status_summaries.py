@@ -0,0 +1,21 @@
+"""Command that rebuilds the status summaries of the owners and the developers."""
+
+from django.core.management.base import BaseCommand
+
+from freelance.summaries import rebuild
+
+
+class Command(BaseCommand):
+    """Recompute the number of tasks of every owner and developer in every status."""
+
+    help = 'Rebuild the status summaries of the owners and the developers.'
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """
+        Rebuild the summaries.
+
+        Args:
+            args: position args;
+            options: command options.
+        """
+        self.stdout.write(self.style.SUCCESS(f'Summarized {rebuild()} rows'))
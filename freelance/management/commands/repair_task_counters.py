@@ -0,0 +1,21 @@
+"""Command that recomputes the comment and developer counters of the tasks."""
+
+from django.core.management.base import BaseCommand
+
+from freelance.counters import repair
+
+
+class Command(BaseCommand):
+    """Recount the counters of the tasks that differ from their related rows."""
+
+    help = 'Recompute the comment and developer counters of the tasks.'
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """
+        Repair the counters.
+
+        Args:
+            args: position args;
+            options: command options.
+        """
+        self.stdout.write(self.style.SUCCESS(f'Repaired {repair()} tasks'))
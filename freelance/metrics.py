@@ -0,0 +1,346 @@
+"""
+This module keeps the metrics of the requests in memory-mapped files shared by the worker processes.
+
+With `METRICS_DIR` set, every thread of every worker process writes to its own file in it,
+so the counters are incremented in place without locks: a file has one writer only.
+A file is a table of records: a name, e.g. the route of the requests or the name of a cache,
+followed by unsigned 64-bit counters. A route record counts the requests, the server errors,
+and the latencies and the numbers of SQL queries in histogram buckets; a cache record counts
+the hits and the misses. `exposition` sums the records of all files by name and formats them
+in the Prometheus text format. The counters are cumulative: clear the directory when
+the deployment starts.
+"""
+
+import mmap
+import os
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from struct import pack_into
+
+from django.conf import settings
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+NAME_SIZE = 128
+WORD_SIZE = 8
+RECORDS = 256
+REQUESTS = 0
+ERRORS = 1
+DURATIONS = 2
+DURATION_SUM = DURATIONS + len(DURATION_BUCKETS) + 1
+QUERIES = DURATION_SUM + 1
+QUERY_SUM = QUERIES + len(QUERY_BUCKETS) + 1
+HITS = 0
+MISSES = 1
+COUNTERS = QUERY_SUM + 1
+NAME_WORDS = NAME_SIZE // WORD_SIZE
+RECORD_WORDS = NAME_WORDS + COUNTERS
+FILE_SIZE = RECORDS * RECORD_WORDS * WORD_SIZE
+MICROSECONDS = 1000000
+SERVER_ERROR = 500
+ROUTE = 'route'
+CACHE = 'cache'
+KIND_SEP = ':'
+NAME_FORMAT = f'{NAME_SIZE}s'
+ZEROS = (0,) * COUNTERS
+UNMATCHED = 'unmatched'
+OTHER = 'other'
+FILE_PATTERN = 'metrics-*.bin'
+RESULT_LABEL = 'result'
+
+_stores = threading.local()
+
+
+class Store:
+    """Metrics file of one thread of a process."""
+
+    def __init__(self, directory, owner):
+        """
+        Map the file of a writer, creating it if needed.
+
+        Args:
+            directory: metrics directory;
+            owner: unique name of the writer, e.g. the process and thread ids.
+        """
+        self.directory = directory
+        self.pid = os.getpid()
+        path = Path(directory) / f'metrics-{owner}.bin'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a+b') as metrics_file:
+            metrics_file.truncate(max(FILE_SIZE, path.stat().st_size))
+            self._map = mmap.mmap(metrics_file.fileno(), FILE_SIZE)
+        self.words = memoryview(self._map).cast('Q')
+        self.offsets = dict(read_names(self._map))
+
+    def offset(self, name) -> int:
+        """
+        Get the position of the counters of a record, adding the record if needed.
+
+        Args:
+            name: record name.
+
+        Returns:
+            int: index of the first counter in `words`.
+        """
+        offset = self.offsets.get(name)
+        if offset is not None:
+            return offset
+        number = len(self.offsets)
+        if number >= RECORDS - 1 and not name.endswith(OTHER):
+            return self.offset(name.partition(KIND_SEP)[0] + KIND_SEP + OTHER)
+        start = number * RECORD_WORDS * WORD_SIZE
+        pack_into(NAME_FORMAT, self._map, start, name.encode())
+        offset = number * RECORD_WORDS + NAME_WORDS
+        self.offsets[name] = offset
+        return offset
+
+    def observe_request(self, route, status_code, duration, query_count) -> None:
+        """
+        Count a request.
+
+        Args:
+            route: route of the request;
+            status_code: response status;
+            duration: latency in seconds;
+            query_count: number of SQL queries.
+        """
+        offset = self.offset(f'{ROUTE}{KIND_SEP}{route}')
+        words = self.words
+        words[offset + REQUESTS] += 1
+        if status_code >= SERVER_ERROR:
+            words[offset + ERRORS] += 1
+        words[offset + DURATIONS + bisect_left(DURATION_BUCKETS, duration)] += 1
+        words[offset + DURATION_SUM] += int(duration * MICROSECONDS)
+        words[offset + QUERIES + bisect_left(QUERY_BUCKETS, query_count)] += 1
+        words[offset + QUERY_SUM] += query_count
+
+    def count_cache(self, cache_name, hit) -> None:
+        """
+        Count a cache lookup.
+
+        Args:
+            cache_name: name of the cache;
+            hit: was the value found.
+        """
+        counter = HITS if hit else MISSES
+        self.words[self.offset(f'{CACHE}{KIND_SEP}{cache_name}') + counter] += 1
+
+
+def read_names(buffer):
+    """
+    Read the record names of a metrics file.
+
+    Args:
+        buffer: file contents.
+
+    Yields:
+        tuple: record name and index of its first counter.
+    """
+    for number in range(RECORDS):
+        start = number * RECORD_WORDS * WORD_SIZE
+        name = bytes(buffer[start:start + NAME_SIZE]).rstrip(b'\0')
+        if not name:
+            return
+        yield name.decode(errors='replace'), number * RECORD_WORDS + NAME_WORDS
+
+
+def store():
+    """
+    Get the metrics file of the current thread.
+
+    Returns:
+        return: Store, or None if the metrics are off.
+    """
+    directory = settings.METRICS_DIR
+    if not directory:
+        return None
+    current = getattr(_stores, 'store', None)
+    if current is None or current.pid != os.getpid() or current.directory != directory:
+        current = Store(directory, f'{os.getpid()}-{threading.get_ident()}')
+        _stores.store = current
+    return current
+
+
+def observe_request(request, response, measurements) -> None:
+    """
+    Count a served request under its route if the metrics are on.
+
+    Args:
+        request: served request;
+        response: its response;
+        measurements: RequestTiming of the request.
+    """
+    current = store()
+    if current is None:
+        return
+    match = getattr(request, 'resolver_match', None)
+    route = match.route if match is not None else UNMATCHED
+    current.observe_request(route, response.status_code, measurements.elapsed(), measurements.query_count)
+
+
+def count_cache(cache_name, hit) -> None:
+    """
+    Count a cache lookup if the metrics are on.
+
+    Args:
+        cache_name: name of the cache;
+        hit: was the value found.
+    """
+    current = store()
+    if current is not None:
+        current.count_cache(cache_name, hit)
+
+
+def collect(directory) -> dict:
+    """
+    Sum the records of all metrics files.
+
+    Args:
+        directory: metrics directory.
+
+    Returns:
+        dict: lists of counters by record name.
+    """
+    totals = {}
+    for path in sorted(Path(directory).glob(FILE_PATTERN)):
+        buffer = path.read_bytes()[:FILE_SIZE]
+        words = memoryview(buffer).cast('Q')
+        for name, offset in read_names(buffer):
+            previous = totals.get(name, ZEROS)
+            totals[name] = [total + words[offset + index] for index, total in enumerate(previous)]
+    return totals
+
+
+def label(label_name, label_value) -> str:
+    """
+    Format a label of a sample.
+
+    Args:
+        label_name: label name;
+        label_value: label value.
+
+    Returns:
+        str: label.
+    """
+    escaped = str(label_value).replace('\\', r'\\')
+    escaped = escaped.replace('"', r'\"')
+    return f'{label_name}="{escaped}"'
+
+
+def sample(metric, labels, sample_value) -> str:
+    """
+    Format a sample.
+
+    Args:
+        metric: metric name;
+        labels: formatted labels;
+        sample_value: value of the sample.
+
+    Returns:
+        str: line of the sample.
+    """
+    return f'{metric}{{{labels}}} {sample_value}'
+
+
+def histogram_lines(metric, labels, counts, bounds, total) -> list:
+    """
+    Format a histogram.
+
+    Args:
+        metric: metric name;
+        labels: formatted labels;
+        counts: counts of the buckets, the last one unbounded;
+        bounds: upper bounds of the buckets;
+        total: sum of the observed values.
+
+    Returns:
+        list: lines of the buckets, the sum and the count.
+    """
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*bounds, '+Inf'), counts):
+        cumulative += count
+        bucket_labels = f'{labels},{label("le", bound)}'
+        lines.append(sample(f'{metric}_bucket', bucket_labels, cumulative))
+    lines.append(sample(f'{metric}_sum', labels, total))
+    lines.append(sample(f'{metric}_count', labels, cumulative))
+    return lines
+
+
+def route_lines(route, record) -> list:
+    """
+    Format the metrics of a route.
+
+    Args:
+        route: route of the requests;
+        record: counters of the route.
+
+    Returns:
+        list: lines.
+    """
+    labels = label('route', route)
+    lines = [
+        sample('freelance_requests_total', labels, record[REQUESTS]),
+        sample('freelance_request_errors_total', labels, record[ERRORS]),
+    ]
+    lines.extend(histogram_lines(
+        'freelance_request_duration_seconds',
+        labels,
+        record[DURATIONS:DURATION_SUM],
+        DURATION_BUCKETS,
+        record[DURATION_SUM] / MICROSECONDS,
+    ))
+    lines.extend(histogram_lines(
+        'freelance_request_queries', labels, record[QUERIES:QUERY_SUM], QUERY_BUCKETS, record[QUERY_SUM],
+    ))
+    return lines
+
+
+def cache_lines(cache_name, record) -> list:
+    """
+    Format the metrics of a cache.
+
+    Args:
+        cache_name: name of the cache;
+        record: counters of the cache.
+
+    Returns:
+        list: lines.
+    """
+    labels = label('cache', cache_name)
+    lookups = record[HITS] + record[MISSES]
+    ratio = record[HITS] / lookups if lookups else 0
+    return [
+        sample('freelance_cache_requests_total', f'{labels},{label(RESULT_LABEL, "hit")}', record[HITS]),
+        sample('freelance_cache_requests_total', f'{labels},{label(RESULT_LABEL, "miss")}', record[MISSES]),
+        sample('freelance_cache_hit_ratio', labels, f'{ratio:.4f}'),
+    ]
+
+
+def exposition(directory) -> str:
+    """
+    Format the metrics of all workers in the Prometheus text format.
+
+    Args:
+        directory: metrics directory.
+
+    Returns:
+        str: metrics text.
+    """
+    lines = [
+        '# TYPE freelance_requests_total counter',
+        '# TYPE freelance_request_errors_total counter',
+        '# TYPE freelance_request_duration_seconds histogram',
+        '# TYPE freelance_request_queries histogram',
+        '# TYPE freelance_cache_requests_total counter',
+        '# TYPE freelance_cache_hit_ratio gauge',
+    ]
+    for name, record in sorted(collect(directory).items()):
+        kind, _, subject = name.partition(KIND_SEP)
+        if kind == ROUTE:
+            lines.extend(route_lines(subject, record))
+        else:
+            lines.extend(cache_lines(subject, record))
+    lines.append('')
+    return '\n'.join(lines)
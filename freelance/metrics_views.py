@@ -0,0 +1,38 @@
+"""
+This module contains the metrics endpoint of the API.
+
+A local scraper logged in as a staff user reads the request and cache metrics
+of all workers from it in the Prometheus text format, see `metrics`.
+"""
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from .metrics import exposition
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsView(APIView):
+    """API endpoint that shows the metrics of all workers to the staff."""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request):
+        """
+        Get the metrics.
+
+        Args:
+            request: user's request.
+
+        Raises:
+            Http404: if the metrics are off.
+
+        Returns:
+            return: HttpResponse
+        """
+        if not settings.METRICS_DIR:
+            raise Http404
+        return HttpResponse(exposition(settings.METRICS_DIR), content_type=CONTENT_TYPE)
@@ -0,0 +1,331 @@
+"""
+This module contains the middleware of the application.
+
+`DeveloperMiddleware` gives every request a lazy `request.developer`: the developer profile
+of the user, or None. It is loaded at most once per request, when a view reads it, and with
+`DEVELOPER_SESSION_CACHE` it is kept in the session of a logged in user until
+the version of the profile is replaced by a write of the profile.
+
+`ReplicaMiddleware` sends the reads of the safe requests to the database replicas
+and pins the clients that write to the primary, see `routers`.
+
+`MetricsMiddleware` counts the requests in the metrics of the workers when `METRICS_DIR` is set,
+see `metrics`.
+
+`TimingMiddleware` measures the requests when `REQUEST_TIMING` is on, see `timing`.
+"""
+
+from uuid import UUID
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject
+
+from . import metrics, routers, timing
+from .models import Developer
+from .versions import developer_version, get_version
+
+DEVELOPER_SESSION_KEY = 'freelance_developer'
+DEVELOPER_FIELDS = ('id', 'developer_id', 'position_id')
+VERSION = 'version'
+ROW = 'row'
+METRICS_NAME = 'developer_sessions'
+
+
+def load_developer(request):
+    """
+    Get the developer profile of the request's user.
+
+    Args:
+        request: user's request.
+
+    Returns:
+        return: Developer, or None if the user is anonymous or has no profile.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    if not session_cached(request):
+        return Developer.objects.filter(developer=user).first()
+    version = get_version(developer_version(user.pk))
+    cached = request.session.get(DEVELOPER_SESSION_KEY)
+    hit = cached is not None and cached[VERSION] == version
+    metrics.count_cache(METRICS_NAME, hit)
+    if not hit:
+        row = Developer.objects.using(DEFAULT_DB_ALIAS).filter(developer=user).values_list(*DEVELOPER_FIELDS).first()
+        cached = {VERSION: version, ROW: dump_developer(row)}
+        request.session[DEVELOPER_SESSION_KEY] = cached
+    return restore_developer(cached[ROW])
+
+
+def session_cached(request) -> bool:
+    """
+    Check if the profile is cached in the session, which is done for the users logged in with it.
+
+    Args:
+        request: user's request.
+
+    Returns:
+        bool: is the session cache used.
+    """
+    if not getattr(settings, 'DEVELOPER_SESSION_CACHE', True):
+        return False
+    return request.session.get(SESSION_KEY) == str(request.user.pk)
+
+
+def dump_developer(row):
+    """
+    Convert a developer row to its session copy.
+
+    Args:
+        row: id, user id and position id, or None.
+
+    Returns:
+        return: list of JSON values, or None.
+    """
+    if row is None:
+        return None
+    developer_id, user_id, position_id = row
+    return [str(developer_id), user_id, position_id and str(position_id)]
+
+
+def restore_developer(row):
+    """
+    Build a developer profile from its session copy.
+
+    Args:
+        row: id, user id and position id, or None.
+
+    Returns:
+        return: Developer or None.
+    """
+    if row is None:
+        return None
+    developer_id, user_id, position_id = row
+    row_values = (UUID(developer_id), user_id, position_id and UUID(position_id))
+    return Developer.from_db(DEFAULT_DB_ALIAS, DEVELOPER_FIELDS, row_values)
+
+
+class DeveloperMiddleware:
+    """Middleware that adds the lazy developer profile of the user to the requests."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Create the middleware.
+
+        Args:
+            get_response: next handler, sync or async.
+        """
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Add the lazy profile and handle the request.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response, or a coroutine of it under ASGI.
+        """
+        request.developer = SimpleLazyObject(lambda: load_developer(request))
+        return self.get_response(request)
+
+
+class ReplicaMiddleware:
+    """Middleware that routes the reads of the requests and pins the writing clients."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Create the middleware.
+
+        Args:
+            get_response: next handler, sync or async.
+        """
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Handle the request with its reads routed.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response, or a coroutine of it under ASGI.
+        """
+        if self.is_async:
+            return self.__acall__(request)
+        with routers.routed_reads(request):
+            response = self.get_response(request)
+        self.pin_writer(request)
+        return response
+
+    async def __acall__(self, request):
+        """
+        Handle the request with its reads routed without blocking the event loop.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response.
+        """
+        with routers.routed_reads(request):
+            response = await self.get_response(request)
+        self.pin_writer(request)
+        return response
+
+    def pin_writer(self, request) -> None:
+        """
+        Pin the client to the primary if the request could write.
+
+        Args:
+            request: served request.
+        """
+        if settings.DATABASE_REPLICAS and request.method not in routers.SAFE_METHODS:
+            routers.pin(request)
+
+
+class TimingMiddleware:
+    """Middleware that measures the requests and reports them in the `Server-Timing` header and the slow log."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Create the middleware, or drop it if the timing is off.
+
+        Args:
+            get_response: next handler, sync or async.
+
+        Raises:
+            MiddlewareNotUsed: if `REQUEST_TIMING` is off.
+        """
+        if not settings.REQUEST_TIMING:
+            raise MiddlewareNotUsed
+        timing.watch_all_queries()
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Measure the request.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response, or a coroutine of it under ASGI.
+        """
+        if self.is_async:
+            return self.__acall__(request)
+        with timing.measured() as measurements:
+            response = self.get_response(request)
+            timing.report(measurements, request, response)
+        return response
+
+    async def __acall__(self, request):
+        """
+        Measure the request without blocking the event loop.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response.
+        """
+        with timing.measured() as measurements:
+            response = await self.get_response(request)
+            timing.report(measurements, request, response)
+        return response
+
+    def process_template_response(self, request, response):
+        """
+        Measure the rendering of a template or of a DRF renderer.
+
+        Args:
+            request: user's request;
+            response: response to render.
+
+        Returns:
+            return: the response.
+        """
+        measurements = timing.current()
+        if measurements is not None and measurements.begin(timing.RENDER):
+            response.add_post_render_callback(lambda rendered: measurements.end(timing.RENDER))
+        return response
+
+
+class MetricsMiddleware:
+    """Middleware that counts the requests with their latencies and queries in the shared metrics."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        """
+        Create the middleware, or drop it if the metrics are off.
+
+        Args:
+            get_response: next handler, sync or async.
+
+        Raises:
+            MiddlewareNotUsed: if `METRICS_DIR` is not set.
+        """
+        if not settings.METRICS_DIR:
+            raise MiddlewareNotUsed
+        timing.watch_all_queries()
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        """
+        Count the request.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response, or a coroutine of it under ASGI.
+        """
+        if self.is_async:
+            return self.__acall__(request)
+        with timing.measured() as measurements:
+            response = self.get_response(request)
+            metrics.observe_request(request, response, measurements)
+        return response
+
+    async def __acall__(self, request):
+        """
+        Count the request without blocking the event loop.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: response.
+        """
+        with timing.measured() as measurements:
+            response = await self.get_response(request)
+            metrics.observe_request(request, response, measurements)
+        return response
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['publication_date', 'id'], name='comment_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['name', 'status', 'id'], name='task_keyset_idx'),
+        ),
+    ]
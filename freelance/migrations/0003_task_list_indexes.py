@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0002_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'name', 'status', 'id'], name='task_owner_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskdeveloper',
+            index=models.Index(fields=['developer', 'task'], name='developer_task_idx'),
+        ),
+    ]
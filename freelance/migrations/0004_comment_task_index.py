@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0003_task_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['task', 'publication_date', 'id'], name='comment_task_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0004_comment_task_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='modification time'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='modification time'),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['modified'], name='comment_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['modified'], name='task_modified_idx'),
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SQLITE_INDEX = (
+    """
+    CREATE VIRTUAL TABLE freelance_search USING fts5(
+        title, body, content='freelance_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER freelance_search_insert AFTER INSERT ON freelance_searchdocument BEGIN
+        INSERT INTO freelance_search(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER freelance_search_delete AFTER DELETE ON freelance_searchdocument BEGIN
+        INSERT INTO freelance_search(freelance_search, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER freelance_search_update AFTER UPDATE ON freelance_searchdocument BEGIN
+        INSERT INTO freelance_search(freelance_search, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO freelance_search(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+)
+SQLITE_DROP = (
+    'DROP TRIGGER freelance_search_insert',
+    'DROP TRIGGER freelance_search_delete',
+    'DROP TRIGGER freelance_search_update',
+    'DROP TABLE freelance_search',
+)
+POSTGRES_INDEX = (
+    """
+    ALTER TABLE freelance_searchdocument ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX freelance_search_idx ON freelance_searchdocument USING GIN (search_vector)',
+)
+POSTGRES_DROP = (
+    'DROP INDEX freelance_search_idx',
+    'ALTER TABLE freelance_searchdocument DROP COLUMN search_vector',
+)
+BACKFILL = (
+    """
+    INSERT INTO freelance_searchdocument (kind, object_id, task_id, title, body)
+    SELECT 'task', id, id, name, description FROM freelance_task
+    """,
+    """
+    INSERT INTO freelance_searchdocument (kind, object_id, task_id, title, body)
+    SELECT 'comment', id, task_id, '', comment_content FROM freelance_comment
+    """,
+)
+
+
+def execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        execute(schema_editor, SQLITE_INDEX)
+    elif vendor == 'postgresql':
+        execute(schema_editor, POSTGRES_INDEX)
+    execute(schema_editor, BACKFILL)
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        execute(schema_editor, SQLITE_DROP)
+    elif vendor == 'postgresql':
+        execute(schema_editor, POSTGRES_DROP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0005_modification_time'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('task', 'task'), ('comment', 'comment')], max_length=8, verbose_name='kind')),
+                ('object_id', models.UUIDField(unique=True, verbose_name='object id')),
+                ('title', models.TextField(blank=True, verbose_name='title')),
+                ('body', models.TextField(blank=True, verbose_name='body')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to='freelance.task', verbose_name='task')),
+            ],
+            options={
+                'verbose_name': 'search document',
+                'verbose_name_plural': 'search documents',
+            },
+        ),
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_related(apps, schema_editor):
+    Task = apps.get_model('freelance', 'Task')
+    counted = {
+        'comment_count': apps.get_model('freelance', 'Comment'),
+        'developer_count': apps.get_model('freelance', 'TaskDeveloper'),
+    }
+    counts = {}
+    for field, model in counted.items():
+        rows = model.objects.filter(task=OuterRef('pk')).order_by().values('task')
+        counts[field] = Coalesce(
+            Subquery(rows.annotate(number=Count('pk')).values('number')), 0, output_field=IntegerField(),
+        )
+    Task.objects.update(**counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0007_task_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='number of comments'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='developer_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='number of developers'),
+        ),
+        migrations.RunPython(count_related, migrations.RunPython.noop),
+    ]
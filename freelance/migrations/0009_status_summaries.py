@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def summarize_tasks(apps, schema_editor):
+    Task = apps.get_model('freelance', 'Task')
+    TaskDeveloper = apps.get_model('freelance', 'TaskDeveloper')
+    OwnerStatusSummary = apps.get_model('freelance', 'OwnerStatusSummary')
+    DeveloperStatusSummary = apps.get_model('freelance', 'DeveloperStatusSummary')
+    owned = Task.objects.order_by().values('owner_id', 'status_id').annotate(task_count=Count('pk'))
+    OwnerStatusSummary.objects.bulk_create([OwnerStatusSummary(**row) for row in owned])
+    assigned = TaskDeveloper.objects.order_by().values('developer_id', status_id=models.F('task__status_id'))
+    DeveloperStatusSummary.objects.bulk_create([
+        DeveloperStatusSummary(**row) for row in assigned.annotate(task_count=Count('pk'))
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('freelance', '0008_task_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeveloperStatusSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_count', models.PositiveIntegerField(default=0, verbose_name='number of tasks')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_summaries', to='freelance.developer', verbose_name='developer')),
+                ('status', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='freelance.status', verbose_name='status')),
+            ],
+            options={
+                'verbose_name': 'developer status summary',
+                'verbose_name_plural': 'developer status summaries',
+                'constraints': [models.UniqueConstraint(fields=('developer', 'status'), name='developer_status_summary_uniq'), models.UniqueConstraint(condition=models.Q(('status__isnull', True)), fields=('developer',), name='developer_no_status_summary_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='OwnerStatusSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_count', models.PositiveIntegerField(default=0, verbose_name='number of tasks')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_summaries', to=settings.AUTH_USER_MODEL, verbose_name='owner')),
+                ('status', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='freelance.status', verbose_name='status')),
+            ],
+            options={
+                'verbose_name': 'owner status summary',
+                'verbose_name_plural': 'owner status summaries',
+                'constraints': [models.UniqueConstraint(fields=('owner', 'status'), name='owner_status_summary_uniq'), models.UniqueConstraint(condition=models.Q(('status__isnull', True)), fields=('owner',), name='owner_no_status_summary_uniq')],
+            },
+        ),
+        migrations.RunPython(summarize_tasks, migrations.RunPython.noop),
+    ]
@@ -23,11 +23,20 @@ from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from .categories import category_cache
+
 NAME = 'name'
 STATUS = 'status'
 TASK = 'task'
 DEVELOPER = 'developer'
 POSITION = 'position'
+ID = 'id'
+MODIFICATION_TIME = 'modification time'
+MODIFIED = 'modified'
+COMMENT = 'comment'
+CREATED = 'created'
+OWNER = 'owner'
+TASK_ID = 'task_id'
 
 
 def time_traveler_trap(checking_date) -> None:
@@ -62,6 +71,61 @@ class UUIDMixin(models.Model):
         abstract = True
 
 
+class TrackedFieldsMixin(models.Model):
+    """Abstract base class that remembers the loaded values of some columns to detect their changes."""
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, field_values):
+        """
+        Create an instance from a database row and remember its tracked columns.
+
+        Args:
+            db: database alias;
+            field_names: loaded attribute names;
+            field_values: loaded values.
+
+        Returns:
+            return: model instance.
+        """
+        instance = super().from_db(db, field_names, field_values)
+        loaded = dict(zip(field_names, field_values))
+        instance.saved_values = {attname: loaded.get(attname, models.DEFERRED) for attname in cls.tracked_fields}
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save object and remember its tracked columns once the `post_save` receivers have compared them.
+
+        Args:
+            args: position args;
+            kwargs: keyword args.
+        """
+        super().save(*args, **kwargs)
+        self.saved_values = {
+            attname: self.__dict__.get(attname, models.DEFERRED) for attname in self.tracked_fields
+        }
+
+    def saved_change(self, attname) -> tuple:
+        """
+        Compare a tracked column with its value when the object was loaded or saved last time.
+
+        Args:
+            attname: attribute name of the column.
+
+        Returns:
+            tuple: is the column changed and its previous value; new instances and deferred columns are unchanged.
+        """
+        saved_value = getattr(self, 'saved_values', {}).get(attname, models.DEFERRED)
+        return saved_value is not models.DEFERRED and saved_value != getattr(self, attname), saved_value
+
+    class Meta:
+        """Configuration class for TrackedFieldsMixin model."""
+
+        abstract = True
+
+
 class CategorialParametr(UUIDMixin):
     """Abstract base class that adds a name field and __str__ method."""
 
@@ -82,7 +146,7 @@ class CategorialParametr(UUIDMixin):
         abstract = True
 
 
-class Task(UUIDMixin):
+class Task(UUIDMixin, TrackedFieldsMixin):
     """
     Model representing a task.
 
@@ -106,6 +170,11 @@ class Task(UUIDMixin):
     created = models.DateTimeField(
         _('creation time'), default=timezone.now, validators=(time_traveler_trap,),
     )
+    modified = models.DateTimeField(_(MODIFICATION_TIME), auto_now=True)
+    comment_count = models.PositiveIntegerField(_('number of comments'), default=0, editable=False)
+    developer_count = models.PositiveIntegerField(_('number of developers'), default=0, editable=False)
+
+    tracked_fields = ('owner_id', 'status_id')
 
     def save(self, *args, **kwargs) -> None:
         """
@@ -128,7 +197,7 @@ class Task(UUIDMixin):
         Returns:
             str: A string representation of the task.
         """
-        return f'"{self.name}": {self.status}'
+        return f'"{self.name}": {category_cache(Status).get(self.status_id)}'
 
     class Meta:
         """Configuration class for Task model."""
@@ -136,6 +205,14 @@ class Task(UUIDMixin):
         ordering = [NAME, STATUS]
         verbose_name = _(TASK)
         verbose_name_plural = _('tasks')
+        indexes = (
+            models.Index(fields=(NAME, STATUS, ID), name='task_keyset_idx'),
+            models.Index(fields=(OWNER, NAME, STATUS, ID), name='task_owner_keyset_idx'),
+            models.Index(fields=(MODIFIED,), name='task_modified_idx'),
+            models.Index(fields=(STATUS, NAME, ID), name='task_status_keyset_idx'),
+            models.Index(fields=(OWNER, STATUS, NAME, ID), name='task_owner_status_idx'),
+            models.Index(fields=(CREATED, ID), name='task_created_idx'),
+        )
 
 
 class Status(CategorialParametr):
@@ -189,7 +266,7 @@ class Developer(UUIDMixin):
         Returns:
             str: A string representation of the developer.
         """
-        return f'{self.developer.get_username()} ({str(self.position)})'
+        return f'{self.developer.get_username()} ({category_cache(Position).get(self.position_id)})'
 
     class Meta:
         """Configuration class for Developer model."""
@@ -231,7 +308,7 @@ class Position(CategorialParametr):
         verbose_name_plural = _('positions')
 
 
-class Comment(UUIDMixin):
+class Comment(UUIDMixin, TrackedFieldsMixin):
     """
     Model representing a comment.
 
@@ -253,6 +330,9 @@ class Comment(UUIDMixin):
         default=timezone.now,
         editable=False,
     )
+    modified = models.DateTimeField(_(MODIFICATION_TIME), auto_now=True)
+
+    tracked_fields = (TASK_ID,)
 
     class Meta:
         """Configuration class for Comment model."""
@@ -260,9 +340,14 @@ class Comment(UUIDMixin):
         ordering = ['publication_date']
         verbose_name = _('comment')
         verbose_name_plural = _('comment')
+        indexes = (
+            models.Index(fields=('publication_date', ID), name='comment_keyset_idx'),
+            models.Index(fields=(TASK, 'publication_date', ID), name='comment_task_keyset_idx'),
+            models.Index(fields=(MODIFIED,), name='comment_modified_idx'),
+        )
 
 
-class TaskDeveloper(models.Model):
+class TaskDeveloper(TrackedFieldsMixin):
     """Model representing the association between a task and a developer."""
 
     developer = models.ForeignKey(
@@ -270,11 +355,105 @@ class TaskDeveloper(models.Model):
     )
     task = models.ForeignKey('Task', verbose_name=_(TASK), on_delete=models.CASCADE)
 
+    tracked_fields = (TASK_ID, 'developer_id')
+
     class Meta:
         """Configuration class for TaskDeveloper model."""
 
         unique_together = (
             (TASK, DEVELOPER),
         )
+        indexes = (
+            models.Index(fields=(DEVELOPER, TASK), name='developer_task_idx'),
+        )
         verbose_name = _('relationship task developer')
         verbose_name_plural = _('relationships task developer')
+
+
+class StatusSummary(models.Model):
+    """Abstract base class for the number of tasks of someone in a status."""
+
+    status = models.ForeignKey(
+        Status, verbose_name=_(STATUS), null=True, on_delete=models.CASCADE, related_name='+',
+    )
+    task_count = models.PositiveIntegerField(_('number of tasks'), default=0)
+
+    key_field = ''
+
+    class Meta:
+        """Configuration class for StatusSummary model."""
+
+        abstract = True
+
+
+class OwnerStatusSummary(StatusSummary):
+    """Model representing the number of tasks of an owner in a status."""
+
+    owner = models.ForeignKey(
+        User, verbose_name=_(OWNER), on_delete=models.CASCADE, related_name='status_summaries',
+    )
+
+    key_field = 'owner_id'
+
+    class Meta:
+        """Configuration class for OwnerStatusSummary model."""
+
+        constraints = (
+            models.UniqueConstraint(fields=(OWNER, STATUS), name='owner_status_summary_uniq'),
+            models.UniqueConstraint(
+                fields=(OWNER,), condition=models.Q(status__isnull=True), name='owner_no_status_summary_uniq',
+            ),
+        )
+        verbose_name = _('owner status summary')
+        verbose_name_plural = _('owner status summaries')
+
+
+class DeveloperStatusSummary(StatusSummary):
+    """Model representing the number of tasks of a developer in a status."""
+
+    developer = models.ForeignKey(
+        Developer, verbose_name=_(DEVELOPER), on_delete=models.CASCADE, related_name='status_summaries',
+    )
+
+    key_field = 'developer_id'
+
+    class Meta:
+        """Configuration class for DeveloperStatusSummary model."""
+
+        constraints = (
+            models.UniqueConstraint(fields=(DEVELOPER, STATUS), name='developer_status_summary_uniq'),
+            models.UniqueConstraint(
+                fields=(DEVELOPER,),
+                condition=models.Q(status__isnull=True),
+                name='developer_no_status_summary_uniq',
+            ),
+        )
+        verbose_name = _('developer status summary')
+        verbose_name_plural = _('developer status summaries')
+
+
+class SearchDocument(models.Model):
+    """
+    Model representing a searchable text of a task or a comment.
+
+    The integer primary key is the row id of the full-text index built over this table.
+    """
+
+    kind = models.CharField(
+        _('kind'), max_length=8, choices=(
+            (TASK, _(TASK)),
+            (COMMENT, _(COMMENT)),
+        ),
+    )
+    object_id = models.UUIDField(_('object id'), unique=True)
+    task = models.ForeignKey(
+        Task, verbose_name=_(TASK), on_delete=models.CASCADE, related_name='search_documents',
+    )
+    title = models.TextField(_('title'), blank=True)
+    body = models.TextField(_('body'), blank=True)
+
+    class Meta:
+        """Configuration class for SearchDocument model."""
+
+        verbose_name = _('search document')
+        verbose_name_plural = _('search documents')
@@ -0,0 +1,318 @@
+"""
+This module contains the pagination classes for the API.
+
+Keyset pagination seeks to the next page with a `WHERE` clause over the full ordering,
+so every page costs the same as the first one: no `OFFSET` scans and no `COUNT(*)`.
+"""
+
+import json
+from base64 import b64decode, b64encode
+from datetime import datetime
+from functools import reduce
+from operator import or_
+from uuid import UUID
+
+from django.core.exceptions import ValidationError
+from django.db import connections, models
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+TASK_ORDERING = ('name', 'status_id', 'id')
+COMMENT_ORDERING = ('publication_date', 'id')
+
+POSITION = 'p'
+REVERSE = 'r'
+
+
+def _dump_value(position_value):
+    """
+    Convert an ordering value to a JSON compatible one.
+
+    Args:
+        position_value: value of an ordering column.
+
+    Returns:
+        return: JSON compatible value.
+    """
+    if isinstance(position_value, UUID):
+        return str(position_value)
+    if isinstance(position_value, datetime):
+        return position_value.isoformat()
+    return position_value
+
+
+def row_position(row, ordering) -> list:
+    """
+    Get the values of the ordering columns of a row.
+
+    Args:
+        row: model instance or a values() dictionary;
+        ordering: ordering column names.
+
+    Returns:
+        list: JSON compatible position of the row.
+    """
+    if isinstance(row, dict):
+        return [_dump_value(row[column]) for column in ordering]
+    return [_dump_value(getattr(row, column)) for column in ordering]
+
+
+def _beyond(column, column_value, reverse, nulls_last) -> models.Q:
+    """
+    Build a condition for the rows that follow a value of one column.
+
+    Args:
+        column: column name;
+        column_value: column value of the cursor row;
+        reverse: is the page walked backwards;
+        nulls_last: are NULLs placed after other values in walking direction.
+
+    Returns:
+        Q: a condition or None if no row can follow the value.
+    """
+    if column_value is None:
+        return None if nulls_last else models.Q(**{f'{column}__isnull': False})
+    condition = models.Q(**{'{0}__{1}'.format(column, 'lt' if reverse else 'gt'): column_value})
+    if nulls_last:
+        condition |= models.Q(**{f'{column}__isnull': True})
+    return condition
+
+
+def _equal(column, column_value) -> models.Q:
+    """
+    Build a NULL-safe equality condition.
+
+    Args:
+        column: column name;
+        column_value: column value of the cursor row.
+
+    Returns:
+        Q: a condition.
+    """
+    if column_value is None:
+        return models.Q(**{f'{column}__isnull': True})
+    return models.Q(**{column: column_value})
+
+
+def seek_condition(ordering, position, reverse, nulls_last) -> models.Q:
+    """
+    Build a lexicographic condition for the rows that follow the position.
+
+    Args:
+        ordering: ordering column names;
+        position: values of the ordering columns of the cursor row;
+        reverse: is the page walked backwards;
+        nulls_last: are NULLs placed after other values in walking direction.
+
+    Returns:
+        Q: a condition.
+    """
+    prefix = models.Q()
+    terms = []
+    for column, column_value in zip(ordering, position):
+        beyond = _beyond(column, column_value, reverse, nulls_last)
+        if beyond is not None:
+            terms.append(prefix & beyond)
+        prefix &= _equal(column, column_value)
+    if not terms:
+        return models.Q(pk__in=[])
+    condition = reduce(or_, terms)
+    first_value = position[0]
+    if first_value is not None:
+        # The redundant bound on the leading column lets the database use an index range scan.
+        condition &= models.Q(**{'{0}__{1}'.format(ordering[0], 'lte' if reverse else 'gte'): first_value})
+    return condition
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Cursor pagination whose cursor keeps the values of every ordering column of a row."""
+
+    ordering = ('id',)
+
+    def decode_cursor(self, request):
+        """
+        Get the cursor from the request.
+
+        Args:
+            request: request object.
+
+        Raises:
+            NotFound: if the cursor is malformed.
+
+        Returns:
+            Cursor: decoded cursor or None.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            payload = json.loads(b64decode(encoded.encode('ascii')))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        position = payload.get(POSITION) if isinstance(payload, dict) else None
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=bool(payload.get(REVERSE)), position=position)
+
+    def encode_cursor(self, cursor):
+        """
+        Get a link with the encoded cursor.
+
+        Args:
+            cursor: cursor to encode.
+
+        Returns:
+            str: url.
+        """
+        payload = {POSITION: cursor.position}
+        if cursor.reverse:
+            payload[REVERSE] = 1
+        encoded = b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _clean_position(self, model, position):
+        """
+        Convert the cursor values to python values of the ordering columns.
+
+        Args:
+            model: paginated model;
+            position: JSON values of the cursor.
+
+        Raises:
+            NotFound: if a value does not fit its column.
+
+        Returns:
+            list: python values.
+        """
+        try:
+            return [
+                None if column_value is None else model._meta.get_field(column).to_python(column_value)  # noqa: WPS437
+                for column, column_value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class KeysetPagination(KeysetCursorPagination):
+    """
+    Cursor pagination over a unique multi-column ordering.
+
+    Unlike `CursorPagination`, the cursor keeps the values of every ordering column,
+    so duplicates in the leading column never make it fall back to offsets.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Get one page of the queryset.
+
+        Args:
+            queryset: queryset to paginate;
+            request: request object;
+            view: view.
+
+        Returns:
+            list: rows of the page.
+        """
+        return self.keep_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Get one page of the queryset with the async ORM interface.
+
+        Args:
+            queryset: queryset to paginate;
+            request: request object;
+            view: view.
+
+        Returns:
+            list: rows of the page.
+        """
+        return self.keep_page([row async for row in self.page_queryset(queryset, request)])
+
+    def page_queryset(self, queryset, request):
+        """
+        Get the queryset of the rows of the requested page and one more row.
+
+        Args:
+            queryset: queryset to paginate;
+            request: request object.
+
+        Returns:
+            queryset: sliced queryset.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self._page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        self._reverse = self.cursor is not None and self.cursor.reverse
+        if self.cursor is not None:
+            nulls_last = connections[queryset.db].features.nulls_order_largest != self._reverse
+            queryset = queryset.filter(seek_condition(
+                self.ordering,
+                self._clean_position(queryset.model, self.cursor.position),
+                self._reverse,
+                nulls_last,
+            ))
+        queryset = queryset.order_by(*[
+            f'-{column}' if self._reverse else column for column in self.ordering
+        ])
+        return queryset[:self._page_size + 1]
+
+    def keep_page(self, rows) -> list:
+        """
+        Keep the rows of the page fetched by `page_queryset`.
+
+        Args:
+            rows: fetched rows.
+
+        Returns:
+            list: rows of the page.
+        """
+        has_more = len(rows) > self._page_size
+        self.page = rows[:self._page_size]
+        if self._reverse:
+            self.page.reverse()
+        self._has_next = has_more or self._reverse
+        self._has_previous = has_more if self._reverse else self.cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        """
+        Get a link to the next page.
+
+        Returns:
+            str: url or None.
+        """
+        if not self._has_next:
+            return None
+        position = row_position(self.page[-1], self.ordering) if self.page else self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        """
+        Get a link to the previous page.
+
+        Returns:
+            str: url or None.
+        """
+        if not self._has_previous:
+            return None
+        position = row_position(self.page[0], self.ordering) if self.page else self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+
+class TaskPagination(KeysetPagination):
+    """Keyset pagination in the order of `Task.Meta.ordering` with the id as a tie-breaker."""
+
+    ordering = TASK_ORDERING
+
+
+class CommentPagination(KeysetPagination):
+    """Keyset pagination in the order of `Comment.Meta.ordering` with the id as a tie-breaker."""
+
+    ordering = COMMENT_ORDERING
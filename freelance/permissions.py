@@ -1,7 +1,33 @@
-"""This module contains different access permissions."""
+"""
+This module contains different access permissions.
+
+The rows a user may see are selected by `filters.VisibleRowsFilterBackend` in the query that loads them,
+and the rows a user may change are checked by comparing the owner id of the loaded row,
+so no permission check fetches a row of its own.
+"""
 
 from rest_framework import permissions
 
+LOOKUP_SEP = '__'
+
+
+def owner_id(m_object, owner_field):
+    """
+    Read the id of the user owning a row through the loaded relations.
+
+    Args:
+        m_object: model object;
+        owner_field: path to the user id, e.g. `owner_id` or `owner__developer_id`.
+
+    Returns:
+        return: user id, or None if a relation on the path is empty.
+    """
+    for name in owner_field.split(LOOKUP_SEP):
+        if m_object is None:
+            return None
+        m_object = getattr(m_object, name)
+    return m_object
+
 
 class UserPermission(permissions.BasePermission):
     """Default users's permission."""
@@ -21,11 +47,11 @@ class UserPermission(permissions.BasePermission):
 
     def has_object_permission(self, request, view, m_object):
         """
-        Check if user is a staff.
+        Check if user is a staff or owns the object.
 
         Args:
             request: A request object;
-            view: view;
+            view: view with the `owner_field` path from its rows to the owner id;
             m_object: model object.
 
         Returns:
@@ -33,7 +59,7 @@ class UserPermission(permissions.BasePermission):
         """
         if request.user.is_authenticated and request.method in permissions.SAFE_METHODS:
             return True
-        return request.user.is_staff or m_object.owner == request.user
+        return request.user.is_staff or owner_id(m_object, getattr(view, 'owner_field', 'owner_id')) == request.user.id
 
 
 class AdminOrReadOnlyPermission(permissions.BasePermission):
@@ -0,0 +1,164 @@
+"""
+This module routes the reads of the safe requests to the database replicas.
+
+`ReplicaMiddleware` marks the requests with the safe methods with one of the `DATABASE_REPLICAS`
+in turn, and `ReplicaRouter` sends all reads made while serving a request to its replica,
+so the request sees one snapshot. The writes and all queries of the other requests go
+to the primary, as do the reads inside `primary_reads`: the ones filling the shared caches,
+which must not store the stale rows of a lagging replica under a new version. After a client writes, it is pinned to
+the primary for `REPLICA_PIN_SECONDS`, so it reads its own writes while the replicas catch up;
+the client is identified by its token or session, and the pins are kept in the shared cache.
+
+Locally two SQLite files can act as the primary and the replica: set `DATABASE_REPLICAS`
+to the name of the replica file and copy the primary into it with
+`sqlite3 db.sqlite3 ".backup replica.sqlite3"` to replicate.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import sha256
+from itertools import count
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+
+PIN_KEY = 'freelance:pin:{0}'
+PINNED = 1
+
+_replica = ContextVar('replica', default=None)
+_turns = count()
+
+
+def client_keys(request) -> list:
+    """
+    Get the pin keys of the client of a request.
+
+    Args:
+        request: user's request.
+
+    Returns:
+        list: cache keys of the token and the sessions of the client.
+    """
+    credentials = {
+        request.headers.get('Authorization'),
+        request.COOKIES.get(settings.SESSION_COOKIE_NAME),
+    }
+    session = getattr(request, 'session', None)
+    if session is not None:
+        credentials.add(session.session_key)
+    return [
+        PIN_KEY.format(sha256(credential.encode()).hexdigest()) for credential in credentials if credential
+    ]
+
+
+def is_pinned(request) -> bool:
+    """
+    Check if the client of a request has written recently.
+
+    Args:
+        request: user's request.
+
+    Returns:
+        bool: must the client read from the primary.
+    """
+    keys = client_keys(request)
+    return bool(keys and cache.get_many(keys))
+
+
+def pin(request) -> None:
+    """
+    Pin the client of a writing request to the primary.
+
+    Args:
+        request: user's request.
+    """
+    cache.set_many(dict.fromkeys(client_keys(request), PINNED), settings.REPLICA_PIN_SECONDS)
+
+
+@contextmanager
+def routed_reads(request):
+    """
+    Send the reads to one replica while a safe request of a client that is not pinned is served.
+
+    Args:
+        request: user's request.
+
+    Yields:
+        None: while the request is served.
+    """
+    replicas = settings.DATABASE_REPLICAS
+    replica = None
+    if replicas and request.method in SAFE_METHODS and not is_pinned(request):
+        replica = replicas[next(_turns) % len(replicas)]
+    token = _replica.set(replica)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Send the reads to the primary, e.g. while a shared cache is filled.
+
+    Yields:
+        None: while the reads are made.
+    """
+    token = _replica.set(None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+class ReplicaRouter:
+    """Database router that sends the reads of the safe requests to the replicas."""
+
+    def db_for_read(self, model, **hints):
+        """
+        Choose the database of a read.
+
+        Args:
+            model: model class;
+            hints: routing hints.
+
+        Returns:
+            return: replica alias of the request, or None for the primary.
+        """
+        return _replica.get()
+
+    def allow_relation(self, first, second, **hints):
+        """
+        Allow the relations between the rows of the primary and the replicas.
+
+        Args:
+            first: model object;
+            second: model object;
+            hints: routing hints.
+
+        Returns:
+            return: True if both rows come from the replicated database, or None.
+        """
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if databases >= {first._state.db, second._state.db}:  # noqa: WPS437
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        """
+        Migrate the primary only, since the replicas copy it.
+
+        Args:
+            db: database alias;
+            app_label: application label;
+            hints: routing hints.
+
+        Returns:
+            return: False for the replicas, or None.
+        """
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,263 @@
+"""
+This module contains the fast read-only serialization of list rows.
+
+A plan is compiled once per serializer class and field selection: every field gets
+a `values()` path and a converter picked by its type, so a page is serialized from
+plain dictionaries without building model instances or walking DRF fields per row.
+Serializers with fields the plan can not reproduce exactly are left to DRF.
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+from .timing import SERIALIZE, timed
+
+LOOKUP_SEP = '__'
+ALL_FIELDS = '*'
+HEX_VERBOSE = 'hex_verbose'
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+)
+UNSUPPORTED_FIELDS = (
+    serializers.ChoiceField,
+    serializers.RelatedField,
+    serializers.Serializer,
+    serializers.SerializerMethodField,
+)
+
+
+def identity(field_value):
+    """
+    Return the value as is.
+
+    Args:
+        field_value: value of a column.
+
+    Returns:
+        return: the same value.
+    """
+    return field_value
+
+
+def field_converter(field):
+    """
+    Pick the converter that gives the same JSON as `field.to_representation`.
+
+    Args:
+        field: serializer field.
+
+    Returns:
+        callable: converter, None if the field is not supported.
+    """
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+        return identity
+    if isinstance(field, UNSUPPORTED_FIELDS):
+        return None
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == HEX_VERBOSE:
+        return str
+    return identity if isinstance(field, IDENTITY_FIELDS) else field.to_representation
+
+
+class RowPlan:
+    """Compiled serialization of `values()` rows of one model."""
+
+    def __init__(self, model, columns, related):
+        """
+        Store the compiled fields.
+
+        Args:
+            model: serialized model;
+            columns: tuples of field names, `values()` paths and converters in the output order;
+            related: tuples of field names, related models and reverse query names of many-to-many fields.
+        """
+        self.model = model
+        self.pk = model._meta.pk.attname  # noqa: WPS437
+        self.columns = columns
+        self.related = related
+        self.paths = tuple({self.pk, *(path for _, path, _ in columns if path)})
+
+    def values_queryset(self, queryset, extra_columns=()):
+        """
+        Get the rows of a queryset as dictionaries with all columns the plan reads.
+
+        Args:
+            queryset: queryset of the model;
+            extra_columns: other needed columns, e.g. the pagination ordering.
+
+        Returns:
+            queryset: values queryset.
+        """
+        return queryset.values(*self.paths, *(column for column in extra_columns if column not in self.paths))
+
+    def serialize(self, rows) -> list:
+        """
+        Serialize `values()` rows.
+
+        Args:
+            rows: dictionaries returned by `values()`.
+
+        Returns:
+            list: serialized rows.
+        """
+        rows = list(rows)
+        pks = [row[self.pk] for row in rows]
+        related_ids = [related_pairs(related_model, query_name, pks) for _, related_model, query_name in self.related]
+        return self.convert(rows, [group_pairs(pairs) for pairs in related_ids])
+
+    async def aserialize(self, rows) -> list:
+        """
+        Serialize `values()` rows loading the many-to-many ids with the async ORM interface.
+
+        Args:
+            rows: dictionaries returned by `values()`.
+
+        Returns:
+            list: serialized rows.
+        """
+        rows = list(rows)
+        pks = [row[self.pk] for row in rows]
+        related_ids = []
+        for _, related_model, query_name in self.related:
+            related_ids.append(group_pairs([pair async for pair in related_pairs(related_model, query_name, pks)]))
+        return self.convert(rows, related_ids)
+
+    @timed(SERIALIZE)
+    def convert(self, rows, related_ids) -> list:
+        """
+        Convert the rows to the serialized representation.
+
+        Args:
+            rows: list of dictionaries returned by `values()`;
+            related_ids: lists of related ids by row primary keys for every many-to-many field.
+
+        Returns:
+            list: serialized rows.
+        """
+        for (field_name, _, _), ids in zip(self.related, related_ids):
+            for related_row in rows:
+                related_row[field_name] = ids.get(related_row[self.pk], [])
+        return [
+            {
+                name: None if row[path or name] is None else convert(row[path or name])
+                for name, path, convert in self.columns
+            }
+            for row in rows
+        ]
+
+    @timed(SERIALIZE)
+    def serialize_objects(self, instances) -> list:
+        """
+        Serialize model instances that are already loaded, e.g. from a cache.
+
+        Args:
+            instances: model instances.
+
+        Returns:
+            list: serialized rows.
+        """
+        getters = [(path, attrgetter(path.replace(LOOKUP_SEP, '.'))) for path in self.paths]
+        return self.serialize({path: getter(instance) for path, getter in getters} for instance in instances)
+
+
+def related_pairs(related_model, query_name, pks):
+    """
+    Get the row and related ids of a many-to-many field for many rows in one query.
+
+    The related model's default ordering is kept, as in a prefetch.
+
+    Args:
+        related_model: model on the other side of the field;
+        query_name: name of the relation from the related model back to the rows;
+        pks: primary keys of the rows.
+
+    Returns:
+        queryset: pairs of row and related ids.
+    """
+    return related_model.objects.filter(**{f'{query_name}__in': pks}).values_list(query_name, 'pk')
+
+
+def group_pairs(pairs) -> dict:
+    """
+    Group the related ids by row ids.
+
+    Args:
+        pairs: pairs of row and related ids.
+
+    Returns:
+        dict: lists of related ids by row primary keys.
+    """
+    related_ids = {}
+    for pk, related_pk in pairs:
+        related_ids.setdefault(pk, []).append(related_pk)
+    return related_ids
+
+
+def compile_plan(serializer):
+    """
+    Get the plan of a serializer with its selected fields.
+
+    Args:
+        serializer: serializer instance.
+
+    Returns:
+        RowPlan: compiled plan, None if some field is not supported.
+    """
+    readable = (name for name, field in serializer.fields.items() if not field.write_only)
+    return _compile(type(serializer), tuple(readable))
+
+
+@lru_cache(maxsize=None)
+def _compile(serializer_class, field_names):
+    """
+    Compile the plan of a serializer class for the selected fields.
+
+    Args:
+        serializer_class: serializer class;
+        field_names: names of the selected fields in the output order.
+
+    Returns:
+        RowPlan: compiled plan, None if some field is not supported.
+    """
+    fields = serializer_class().fields
+    model = serializer_class.Meta.model
+    try:
+        compiled = [compile_field(model, name, fields[name]) for name in field_names]
+    except (LookupError, FieldDoesNotExist):
+        return None
+    columns = tuple(column for column, _ in compiled)
+    related = tuple(relation for _, relation in compiled if relation is not None)
+    return RowPlan(model, columns, related)
+
+
+def compile_field(model, name, field) -> tuple:
+    """
+    Compile one serializer field.
+
+    Args:
+        model: serialized model;
+        name: field name;
+        field: serializer field.
+
+    Raises:
+        LookupError: if the field is not supported.
+
+    Returns:
+        tuple: output column and the many-to-many relation to load, None for other fields.
+    """
+    if field.source == ALL_FIELDS:
+        raise LookupError(name)
+    if not isinstance(field, serializers.ManyRelatedField):
+        convert = field_converter(field)
+        if convert is None:
+            raise LookupError(name)
+        return (name, LOOKUP_SEP.join(field.source_attrs), convert), None
+    model_field = model._meta.get_field(field.source)  # noqa: WPS437
+    if not model_field.many_to_many or field_converter(field.child_relation) is not identity:
+        raise LookupError(name)
+    return (name, None, list), (name, model_field.related_model, model_field.related_query_name())
@@ -0,0 +1,233 @@
+"""
+This module contains the full-text search over tasks and comments.
+
+Every task and comment has a row in `SearchDocument`, kept in sync by the signal receivers.
+The inverted index over that table depends on the database: an external content FTS5 table
+filled by triggers on SQLite, a generated tsvector column with a GIN index on PostgreSQL.
+Other databases fall back to substring scans of the documents.
+A search may be restricted to the documents matching a condition, e.g. those of the tasks
+a user may see; the restriction is a subquery of the ranking query, so the pages stay full.
+"""
+
+import re
+from types import MappingProxyType
+
+from django.db import connection, models, transaction
+
+from .models import COMMENT, TASK, SearchDocument
+
+OBJECT_ID = 'object_id'
+INDEXED_FIELDS = (TASK, 'title', 'body')
+WORD = re.compile(r'\w+')
+DOCUMENTS_TABLE = 'freelance_searchdocument'
+FTS_TABLE = 'freelance_search'
+SQLITE_RANKING = f"""
+    SELECT rowid, -bm25({FTS_TABLE}, 4.0, 1.0) AS score FROM {FTS_TABLE}
+    WHERE {FTS_TABLE} MATCH %s{{0}} ORDER BY score DESC, rowid LIMIT %s OFFSET %s
+"""  # noqa: S608, WPS323
+POSTGRES_RANKING = f"""
+    SELECT id, ts_rank(search_vector, query) AS score
+    FROM {DOCUMENTS_TABLE}, to_tsquery('simple', %s) query
+    WHERE search_vector @@ query{{0}} ORDER BY score DESC, id LIMIT %s OFFSET %s
+"""  # noqa: S608, WPS323
+SQLITE_QUERY = SQLITE_RANKING.format('')
+RESTRICTION = ' AND {0} IN ({1})'
+ID = 'id'
+BACKFILL = (
+    f"""
+    INSERT INTO {DOCUMENTS_TABLE} (kind, object_id, task_id, title, body)
+    SELECT 'task', id, id, name, description FROM freelance_task
+    """,  # noqa: S608
+    f"""
+    INSERT INTO {DOCUMENTS_TABLE} (kind, object_id, task_id, title, body)
+    SELECT 'comment', id, task_id, '', comment_content FROM freelance_comment
+    """,  # noqa: S608
+)
+
+
+def restriction(column, visible) -> tuple:
+    """
+    Build the condition of a ranking query restricting it to the visible documents.
+
+    Args:
+        column: document id column of the ranking query;
+        visible: condition on the documents, or None for all documents.
+
+    Returns:
+        tuple: SQL to append to the WHERE clause and its parameters.
+    """
+    if visible is None:
+        return '', ()
+    sql, sql_params = SearchDocument.objects.filter(visible).values(ID).query.sql_with_params()
+    return RESTRICTION.format(column, sql), sql_params
+
+
+class SqliteSearch:
+    """Search through the FTS5 table."""
+
+    def ranked(self, words, limit, offset, visible=None) -> list:
+        """
+        Get the best documents for the words, every word may be a prefix.
+
+        Args:
+            words: searched words;
+            limit: number of documents;
+            offset: number of skipped documents;
+            visible: condition on the documents, or None for all documents.
+
+        Returns:
+            list: pairs of document ids and ranks.
+        """
+        match = ' '.join(f'"{word}"*' for word in words)
+        condition, condition_params = restriction('rowid', visible)
+        with connection.cursor() as cursor:
+            cursor.execute(SQLITE_RANKING.format(condition), (match, *condition_params, limit, offset))
+            return cursor.fetchall()
+
+    def optimize(self) -> None:
+        """Rebuild the FTS5 table from the documents and merge its segments."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")  # noqa: S608
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")  # noqa: S608
+
+
+class PostgresSearch:
+    """Search through the tsvector column."""
+
+    def ranked(self, words, limit, offset, visible=None) -> list:
+        """
+        Get the best documents for the words, every word may be a prefix.
+
+        Args:
+            words: searched words;
+            limit: number of documents;
+            offset: number of skipped documents;
+            visible: condition on the documents, or None for all documents.
+
+        Returns:
+            list: pairs of document ids and ranks.
+        """
+        query = ' & '.join(f'{word}:*' for word in words)
+        condition, condition_params = restriction(ID, visible)
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRES_RANKING.format(condition), (query, *condition_params, limit, offset))
+            return cursor.fetchall()
+
+    def optimize(self) -> None:
+        """Refresh the planner statistics of the documents."""
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {DOCUMENTS_TABLE}')
+
+
+class ScanSearch:
+    """Search by substrings for databases without a full-text index."""
+
+    def ranked(self, words, limit, offset, visible=None) -> list:
+        """
+        Get the documents containing all words.
+
+        Args:
+            words: searched words;
+            limit: number of documents;
+            offset: number of skipped documents;
+            visible: condition on the documents, or None for all documents.
+
+        Returns:
+            list: pairs of document ids and ranks.
+        """
+        documents = SearchDocument.objects.order_by(ID)
+        if visible is not None:
+            documents = documents.filter(visible)
+        for word in words:
+            documents = documents.filter(models.Q(title__icontains=word) | models.Q(body__icontains=word))
+        return [(pk, 0) for pk in documents.values_list(ID, flat=True)[offset:offset + limit]]
+
+    def optimize(self) -> None:
+        """Do nothing, there is no index."""
+
+
+BACKENDS = MappingProxyType({'sqlite': SqliteSearch(), 'postgresql': PostgresSearch()})
+
+
+def backend():
+    """
+    Get the search backend of the default database.
+
+    Returns:
+        backend: search backend.
+    """
+    return BACKENDS.get(connection.vendor, ScanSearch())
+
+
+def search(query, limit, offset=0, visible=None) -> list:
+    """
+    Find the documents matching a query, the best first.
+
+    Args:
+        query: text typed by the user;
+        limit: number of documents;
+        offset: number of skipped documents;
+        visible: condition on the documents, or None for all documents.
+
+    Returns:
+        list: documents with their tasks and `rank` attributes.
+    """
+    words = WORD.findall(query.lower())
+    if not words:
+        return []
+    ranked = backend().ranked(words, limit, offset, visible)
+    documents = SearchDocument.objects.select_related(TASK).in_bulk([pk for pk, _ in ranked])
+    found = []
+    for pk, rank in ranked:
+        document = documents[pk]
+        document.rank = rank
+        found.append(document)
+    return found
+
+
+def index_documents(tasks=(), comments=()) -> None:
+    """
+    Insert or update the documents of tasks and comments in one query.
+
+    Args:
+        tasks: saved tasks;
+        comments: saved comments.
+    """
+    documents = [
+        SearchDocument(kind=TASK, object_id=task.pk, task_id=task.pk, title=task.name, body=task.description)
+        for task in tasks
+    ]
+    documents.extend(
+        SearchDocument(kind=COMMENT, object_id=comment.pk, task_id=comment.task_id, body=comment.comment_content)
+        for comment in comments
+    )
+    if documents:
+        SearchDocument.objects.bulk_create(
+            documents, update_conflicts=True, unique_fields=(OBJECT_ID,), update_fields=INDEXED_FIELDS,
+        )
+
+
+def unindex(object_ids) -> None:
+    """
+    Delete the documents of deleted objects.
+
+    Args:
+        object_ids: ids of tasks or comments.
+    """
+    SearchDocument.objects.filter(object_id__in=object_ids).delete()
+
+
+def rebuild() -> int:
+    """
+    Recreate all documents from the tasks and comments.
+
+    Returns:
+        int: number of documents.
+    """
+    with transaction.atomic():
+        SearchDocument.objects.all().delete()
+        with connection.cursor() as cursor:
+            for statement in BACKFILL:
+                cursor.execute(statement)
+        backend().optimize()
+    return SearchDocument.objects.count()
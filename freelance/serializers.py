@@ -4,16 +4,27 @@ This module defines the serializers for the application.
 It includes serializers for tasks, positions, statuses, students and comments.
 Each serializer is a Django REST Framework ModelSerializer,
 which means it automatically generates fields based on the model it's serializing.
+
+Related objects read by the serializers are loaded by the querysets of the viewsets,
+so keep `select_related`/`prefetch_related` there in sync with the fields here.
 """
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import Comment, Position, Status, Task
+from . import search, summaries
+from .categories import category_cache
+from .fieldsets import SparseFieldsetSerializer
+from .models import Comment, Developer, Position, Status, Task, TaskDeveloper
 
 ALL = '__all__'
+ID = 'id'
+DEVELOPERS = 'developers'
+BULK_BATCH_SIZE = 500
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsetSerializer):
     """Serializer for the Task model."""
 
     owner = serializers.ReadOnlyField(source='owner.username')
@@ -25,6 +36,16 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = ALL
 
 
+class TaskListSerializer(TaskSerializer):
+    """Serializer for tasks in lists, without descriptions and developers."""
+
+    class Meta:
+        """Configuration class for task list serializer."""
+
+        model = Task
+        fields = (ID, 'name', 'owner', 'status', 'created', 'modified', 'comment_count', 'developer_count')
+
+
 class StatusSerializer(serializers.ModelSerializer):
     """Serializer for the status model."""
 
@@ -45,13 +66,145 @@ class PositionSerializer(serializers.ModelSerializer):
         fields = ALL
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsetSerializer):
     """Serializer for the Comment model."""
 
-    owner = serializers.ReadOnlyField(source='owner.username')
+    owner = serializers.ReadOnlyField(source='owner.developer.username')
 
     class Meta:
         """Configuration class for comment serializer."""
 
         model = Comment
         fields = ALL
+
+
+class CommentListSerializer(CommentSerializer):
+    """Serializer for comments in lists, without their content."""
+
+    class Meta:
+        """Configuration class for comment list serializer."""
+
+        model = Comment
+        fields = (ID, 'task', 'owner', 'publication_date', 'modified')
+
+
+class CategoryRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key field of a categorial model that reads the rows from the cache."""
+
+    def to_internal_value(self, pk_value):
+        """
+        Get the status or position by its id.
+
+        Args:
+            pk_value: submitted id.
+
+        Returns:
+            return: model instance.
+        """
+        model = self.queryset.model
+        try:
+            category = category_cache(model).get(model._meta.pk.to_python(pk_value))  # noqa: WPS437
+        except DjangoValidationError:
+            self.fail('incorrect_type', data_type=type(pk_value).__name__)
+        if category is None:
+            self.fail('does_not_exist', pk_value=pk_value)
+        return category
+
+
+class TaskBulkListSerializer(serializers.ListSerializer):
+    """Serializer that validates and inserts many tasks at once."""
+
+    def validate(self, attrs):
+        """
+        Check that all referenced developers exist with one query per batch.
+
+        Args:
+            attrs: validated tasks.
+
+        Raises:
+            ValidationError: if a developer does not exist.
+
+        Returns:
+            return: validated tasks.
+        """
+        requested = list({pk for task in attrs for pk in task.get(DEVELOPERS, ())})
+        existing = set()
+        for start in range(0, len(requested), BULK_BATCH_SIZE):
+            batch = requested[start:start + BULK_BATCH_SIZE]
+            existing.update(Developer.objects.filter(pk__in=batch).order_by().values_list('pk', flat=True))
+        missing = [str(pk) for pk in requested if pk not in existing]
+        if missing:
+            raise serializers.ValidationError(
+                {DEVELOPERS: [f'Invalid pk "{pk}" - object does not exist.' for pk in missing]},
+            )
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Insert the tasks and their developer assignments in batches in one transaction.
+
+        Args:
+            validated_data: validated tasks with their owner.
+
+        Returns:
+            list: created tasks.
+        """
+        tasks = []
+        assignments = []
+        for attrs in validated_data:
+            developer_ids = set(attrs.pop(DEVELOPERS, ()))
+            task = Task(**attrs, developer_count=len(developer_ids))
+            tasks.append(task)
+            assignments.extend(TaskDeveloper(task=task, developer_id=pk) for pk in developer_ids)
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=BULK_BATCH_SIZE)
+            TaskDeveloper.objects.bulk_create(assignments, batch_size=BULK_BATCH_SIZE)
+            search.index_documents(tasks=tasks)
+            summaries.add_tasks(tasks, assignments)
+        return tasks
+
+
+class TaskBulkSerializer(serializers.ModelSerializer):
+    """Serializer for one task of a bulk creation request."""
+
+    status = CategoryRelatedField(queryset=Status.objects.all(), allow_null=True, required=False)
+    developers = serializers.ListField(child=serializers.UUIDField(), required=False)
+
+    class Meta:
+        """Configuration class for task bulk serializer."""
+
+        model = Task
+        fields = ('id', 'name', 'description', 'status', 'created', DEVELOPERS)
+        read_only_fields = ('id',)
+        list_serializer_class = TaskBulkListSerializer
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """Serializer for a found task or comment."""
+
+    kind = serializers.CharField()
+    object_id = serializers.UUIDField()
+    task = serializers.UUIDField(source='task_id')
+    task_name = serializers.CharField(source='task.name')
+    title = serializers.CharField()
+    body = serializers.CharField()
+    rank = serializers.FloatField()
+
+
+class StatusSummarySerializer(serializers.Serializer):
+    """Serializer for the number of tasks of someone in a status."""
+
+    status = serializers.UUIDField(source='status_id', allow_null=True)
+    task_count = serializers.IntegerField()
+
+
+class OwnerStatusSummarySerializer(StatusSummarySerializer):
+    """Serializer for the number of tasks of an owner in a status."""
+
+    owner = serializers.CharField(source='owner.username')
+
+
+class DeveloperStatusSummarySerializer(StatusSummarySerializer):
+    """Serializer for the number of tasks of a developer in a status."""
+
+    developer = serializers.CharField(source='developer.developer.username')
@@ -0,0 +1,464 @@
+"""
+This module contains the signal receivers of the application.
+
+The receivers keep the caches and the derived data in sync with the writes made
+through the models, the admin site and the API.
+"""
+
+from django.contrib.auth.models import User
+from django.db.models import signals
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from . import counters, events, search, summaries, versions
+from .categories import category_cache
+from .models import Comment, Developer, Position, Status, Task, TaskDeveloper
+
+POST_ADD = 'post_add'
+TASK_ID = 'task_id'
+
+
+@receiver(signals.post_save, sender=Status)
+@receiver(signals.post_delete, sender=Status)
+@receiver(signals.post_save, sender=Position)
+@receiver(signals.post_delete, sender=Position)
+def invalidate_categories(sender, **kwargs) -> None:
+    """
+    Drop the cached rows of a categorial model after a write.
+
+    Args:
+        sender: model class;
+        kwargs: signal arguments.
+    """
+    category_cache(sender).invalidate()
+
+
+def task_readers(task_ids) -> set:
+    """
+    Get the users who may see the rows of tasks: their owners and their developers.
+
+    Args:
+        task_ids: task ids.
+
+    Returns:
+        set: user ids.
+    """
+    rows = Task.objects.filter(pk__in=task_ids).values_list('owner_id', 'taskdeveloper__developer__developer_id')
+    return {user_id for row in rows for user_id in row if user_id is not None}
+
+
+def bump_lists(changed_models, user_ids) -> None:
+    """
+    Change the validators of the lists of the staff and of the users whose rows are written.
+
+    A write may move a row out of a filtered list, so every write changes them.
+
+    Args:
+        changed_models: written models;
+        user_ids: ids of the users who may see the written rows.
+    """
+    for model in changed_models:
+        versions.bump_version(versions.writes_version(model))
+        for user_id in user_ids:
+            versions.bump_version(versions.reader_version(model, user_id))
+
+
+def saved_values(instance, attname) -> set:
+    """
+    Get the current value of a column and its value before the last save.
+
+    Args:
+        instance: saved or deleted object;
+        attname: tracked column.
+
+    Returns:
+        set: one or two values.
+    """
+    changed, saved_value = instance.saved_change(attname)
+    return {getattr(instance, attname), saved_value} if changed else {getattr(instance, attname)}
+
+
+@receiver(signals.post_save, sender=Task)
+@receiver(signals.post_delete, sender=Task)
+def bump_task_lists(sender, instance, **kwargs) -> None:
+    """
+    Change the validators of the lists of the users who may see a written task.
+
+    A new owner sees the comments of the task as well.
+
+    Args:
+        sender: model class;
+        instance: written task;
+        kwargs: signal arguments.
+    """
+    owner_ids = saved_values(instance, 'owner_id')
+    changed_models = (Task, Comment) if len(owner_ids) > 1 else (Task,)
+    bump_lists(changed_models, task_readers([instance.pk]) | owner_ids)
+
+
+@receiver(signals.post_save, sender=Comment)
+@receiver(signals.post_delete, sender=Comment)
+def bump_comment_lists(sender, instance, **kwargs) -> None:
+    """
+    Change the validators of the lists of the users who may see a written comment.
+
+    Args:
+        sender: model class;
+        instance: written comment;
+        kwargs: signal arguments.
+    """
+    bump_lists((Comment,), task_readers(saved_values(instance, TASK_ID)))
+
+
+@receiver(signals.post_save, sender=TaskDeveloper)
+@receiver(signals.post_delete, sender=TaskDeveloper)
+def bump_assignment_lists(sender, instance, **kwargs) -> None:
+    """
+    Change the validators of the lists of the developers assigned or unassigned, since it shows or hides rows.
+
+    Args:
+        sender: model class;
+        instance: written assignment;
+        kwargs: signal arguments.
+    """
+    developers = Developer.objects.filter(pk__in=saved_values(instance, 'developer_id'))
+    bump_lists((Task, Comment), set(developers.values_list('developer_id', flat=True)))
+
+
+@receiver(signals.post_save, sender=Developer)
+@receiver(signals.post_delete, sender=Developer)
+def bump_developer(sender, instance, **kwargs) -> None:
+    """
+    Expire the copies of a developer profile kept in the sessions of its user.
+
+    Args:
+        sender: model class;
+        instance: saved or deleted developer;
+        kwargs: signal arguments.
+    """
+    versions.bump_version(versions.developer_version(instance.developer_id))
+
+
+@receiver(signals.post_save, sender=User)
+@receiver(signals.post_delete, sender=User)
+def bump_user(sender, instance, **kwargs) -> None:
+    """
+    Expire the cached tokens of a user after the user is changed, e.g. deactivated.
+
+    Args:
+        sender: model class;
+        instance: saved or deleted user;
+        kwargs: signal arguments.
+    """
+    versions.bump_version(versions.user_version(instance.pk))
+
+
+@receiver(signals.post_delete, sender=Token)
+def bump_token(sender, instance, **kwargs) -> None:
+    """
+    Expire the cached tokens of a user after one is deleted.
+
+    Args:
+        sender: model class;
+        instance: deleted token;
+        kwargs: signal arguments.
+    """
+    versions.bump_version(versions.user_version(instance.user_id))
+
+
+@receiver(signals.post_save, sender=Task)
+def index_task(sender, instance, **kwargs) -> None:
+    """
+    Update the search document of a saved task.
+
+    Args:
+        sender: model class;
+        instance: saved task;
+        kwargs: signal arguments.
+    """
+    search.index_documents(tasks=(instance,))
+
+
+@receiver(signals.post_save, sender=Comment)
+def index_comment(sender, instance, **kwargs) -> None:
+    """
+    Update the search document of a saved comment.
+
+    Args:
+        sender: model class;
+        instance: saved comment;
+        kwargs: signal arguments.
+    """
+    search.index_documents(comments=(instance,))
+
+
+@receiver(signals.post_delete, sender=Comment)
+def unindex_comment(sender, instance, origin=None, **kwargs) -> None:
+    """
+    Delete the search document of a deleted comment.
+
+    The documents of a deleted task are removed by the cascade together with the task.
+
+    Args:
+        sender: model class;
+        instance: deleted comment;
+        origin: object or queryset whose deletion started the cascade;
+        kwargs: signal arguments.
+    """
+    if not deleted_with_task(origin):
+        search.unindex((instance.pk,))
+
+
+@receiver(signals.post_save, sender=Comment)
+def count_saved_comment(sender, instance, created, **kwargs) -> None:
+    """
+    Count a new or moved comment in its tasks.
+
+    Args:
+        sender: model class;
+        instance: saved comment;
+        created: is the comment new;
+        kwargs: signal arguments.
+    """
+    count_saved(instance, created, counters.COMMENT_COUNT)
+
+
+@receiver(signals.post_delete, sender=Comment)
+def count_deleted_comment(sender, instance, origin=None, **kwargs) -> None:
+    """
+    Uncount a deleted comment in its task unless the task is deleted as well.
+
+    Args:
+        sender: model class;
+        instance: deleted comment;
+        origin: object or queryset whose deletion started the cascade;
+        kwargs: signal arguments.
+    """
+    if not deleted_with_task(origin):
+        counters.shift(Task.objects.filter(pk=instance.task_id), counters.COMMENT_COUNT, -1)
+
+
+@receiver(signals.post_save, sender=TaskDeveloper)
+def count_saved_assignment(sender, instance, created, **kwargs) -> None:
+    """
+    Count a new or moved developer assignment in its tasks and touch them.
+
+    Args:
+        sender: model class;
+        instance: assignment of a developer;
+        created: is the assignment new;
+        kwargs: signal arguments.
+    """
+    if not count_saved(instance, created, counters.DEVELOPER_COUNT):
+        Task.objects.filter(pk=instance.task_id).update(modified=timezone.now())
+
+
+@receiver(signals.post_delete, sender=TaskDeveloper)
+def count_deleted_assignment(sender, instance, origin=None, **kwargs) -> None:
+    """
+    Uncount a deleted developer assignment in its task unless the task is deleted as well.
+
+    Args:
+        sender: model class;
+        instance: assignment of a developer;
+        origin: object or queryset whose deletion started the cascade;
+        kwargs: signal arguments.
+    """
+    if not deleted_with_task(origin):
+        counters.shift(Task.objects.filter(pk=instance.task_id), counters.DEVELOPER_COUNT, -1)
+
+
+def count_saved(instance, created, field) -> bool:
+    """
+    Shift a counter of the tasks after a related row is created or moved to another task.
+
+    Args:
+        instance: saved comment or assignment;
+        created: is the row new;
+        field: counter name.
+
+    Returns:
+        bool: are the counters shifted.
+    """
+    moved, saved_task_id = instance.saved_change(TASK_ID)
+    if moved:
+        counters.shift(Task.objects.filter(pk=saved_task_id), field, -1)
+    if created or moved:
+        counters.shift(Task.objects.filter(pk=instance.task_id), field, 1)
+    return created or moved
+
+
+def deleted_with_task(origin) -> bool:
+    """
+    Check if a row is deleted by the cascade of its task deletion.
+
+    Args:
+        origin: object or queryset whose deletion started the cascade.
+
+    Returns:
+        bool: is the origin a task or tasks.
+    """
+    return isinstance(origin, Task) or getattr(origin, 'model', None) is Task
+
+
+@receiver(signals.m2m_changed, sender=TaskDeveloper)
+def bump_added_developer_lists(sender, instance, action, pk_set, **kwargs) -> None:
+    """
+    Change the validators of the lists of the developers added by `developers.add/set`.
+
+    Args:
+        sender: through model;
+        instance: task or developer;
+        action: m2m action;
+        pk_set: ids of the added objects;
+        kwargs: signal arguments.
+    """
+    if action != POST_ADD:
+        return
+    if isinstance(instance, Task):
+        user_ids = set(Developer.objects.filter(pk__in=pk_set).values_list('developer_id', flat=True))
+    else:
+        user_ids = {instance.developer_id}
+    bump_lists((Task, Comment), user_ids)
+
+
+@receiver(signals.m2m_changed, sender=TaskDeveloper)
+def count_added_developers(sender, instance, action, pk_set, **kwargs) -> None:
+    """
+    Count the developers added by `developers.add/set` in their tasks and touch them.
+
+    The assignments are inserted without `post_save`, while `remove` and `clear` delete them
+    with `post_delete`, so only the additions are counted here.
+
+    Args:
+        sender: through model;
+        instance: task or developer;
+        action: m2m action;
+        pk_set: ids of the added objects;
+        kwargs: signal arguments.
+    """
+    if action != POST_ADD:
+        return
+    if isinstance(instance, Task):
+        counters.shift(Task.objects.filter(pk=instance.pk), counters.DEVELOPER_COUNT, len(pk_set))
+    else:
+        counters.shift(Task.objects.filter(pk__in=pk_set), counters.DEVELOPER_COUNT, 1)
+
+
+@receiver(signals.post_save, sender=Comment)
+def publish_comment(sender, instance, created, **kwargs) -> None:
+    """
+    Push a new comment to the subscribers of its task.
+
+    Args:
+        sender: model class;
+        instance: saved comment;
+        created: is the comment new;
+        kwargs: signal arguments.
+    """
+    if created:
+        events.broker().publish(
+            instance.task_id, instance.publication_date, events.COMMENT, events.comment_payload(instance),
+        )
+
+
+@receiver(signals.post_save, sender=Task)
+def publish_status(sender, instance, **kwargs) -> None:
+    """
+    Push a changed status of a task to its subscribers.
+
+    Args:
+        sender: model class;
+        instance: saved task;
+        kwargs: signal arguments.
+    """
+    if instance.saved_change('status_id')[0]:
+        events.broker().publish(instance.id, instance.modified, events.STATUS, events.status_payload(instance))
+
+
+@receiver(signals.post_save, sender=Task)
+def summarize_saved_task(sender, instance, created, **kwargs) -> None:
+    """
+    Count a new task, or a task with a changed owner or status, in the status summaries.
+
+    Args:
+        sender: model class;
+        instance: saved task;
+        created: is the task new;
+        kwargs: signal arguments.
+    """
+    summaries.move_task(instance, created)
+
+
+@receiver(signals.post_delete, sender=Task)
+def summarize_deleted_task(sender, instance, **kwargs) -> None:
+    """
+    Uncount a deleted task in the status summaries.
+
+    Args:
+        sender: model class;
+        instance: deleted task;
+        kwargs: signal arguments.
+    """
+    summaries.remove_task(instance)
+
+
+@receiver(signals.post_save, sender=TaskDeveloper)
+def summarize_saved_assignment(sender, instance, created, **kwargs) -> None:
+    """
+    Count a new or moved developer assignment in the status summaries.
+
+    Args:
+        sender: model class;
+        instance: assignment of a developer;
+        created: is the assignment new;
+        kwargs: signal arguments.
+    """
+    summaries.move_assignment(instance, created)
+
+
+@receiver(signals.post_delete, sender=TaskDeveloper)
+def summarize_deleted_assignment(sender, instance, origin=None, **kwargs) -> None:
+    """
+    Uncount a deleted developer assignment in the status summaries.
+
+    Args:
+        sender: model class;
+        instance: assignment of a developer;
+        origin: object or queryset whose deletion started the cascade;
+        kwargs: signal arguments.
+    """
+    summaries.remove_assignment(instance, origin)
+
+
+@receiver(signals.m2m_changed, sender=TaskDeveloper)
+def summarize_added_developers(sender, instance, action, pk_set, **kwargs) -> None:
+    """
+    Count the developers added by `developers.add/set` in the status summaries.
+
+    Args:
+        sender: through model;
+        instance: task or developer;
+        action: m2m action;
+        pk_set: ids of the added objects;
+        kwargs: signal arguments.
+    """
+    if action == POST_ADD:
+        summaries.add_developers(instance, pk_set)
+
+
+@receiver(signals.pre_delete, sender=Status)
+def release_status(sender, instance, **kwargs) -> None:
+    """
+    Move the status summaries of a deleted status to the tasks left without a status.
+
+    The tasks are updated in bulk without signals, so the validators of all task lists are changed.
+
+    Args:
+        sender: model class;
+        instance: deleted status;
+        kwargs: signal arguments.
+    """
+    summaries.release_status(instance.pk)
+    versions.bump_version(versions.shared_version(Task))
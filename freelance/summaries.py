@@ -0,0 +1,189 @@
+"""
+This module maintains the status summaries of the owners and the developers.
+
+`OwnerStatusSummary` and `DeveloperStatusSummary` hold the number of tasks of every owner
+and every developer in every status, so the dashboards read a few rows instead of grouping
+the tasks and their assignments. The signal receivers shift the summaries by the changes
+of the tasks and their developers, the bulk writes shift them by the inserted rows,
+and `rebuild()` recomputes them from scratch for recovery.
+"""
+
+from collections import Counter, defaultdict
+
+from django.db import models, transaction
+from django.db.models.functions import Greatest
+
+from .models import DeveloperStatusSummary, OwnerStatusSummary, Task
+
+TASK_COUNT = 'task_count'
+STATUS_ID = 'status_id'
+DEVELOPER_ID = 'developer_id'
+PK = 'pk'
+SUMMARY_MODELS = (OwnerStatusSummary, DeveloperStatusSummary)
+
+
+def shift(model, deltas) -> None:
+    """
+    Add numbers to the summaries, creating the missing rows.
+
+    The rows are inserted ignoring conflicts before they are updated with F-expressions,
+    so concurrent writers never lose a change.
+
+    Args:
+        model: summary model;
+        deltas: numbers to add, negative to subtract, by the key id and the status id.
+    """
+    missing = [
+        model(**{model.key_field: key}, status_id=status_id)
+        for (key, status_id), delta in deltas.items()
+        if delta > 0
+    ]
+    if missing:
+        model.objects.bulk_create(missing, ignore_conflicts=True)
+    keys = defaultdict(list)
+    for (key, status_id), delta in deltas.items():
+        if delta:
+            keys[status_id, delta].append(key)
+    for (shifted_status_id, shift_by), shifted_keys in keys.items():
+        model.objects.filter(**{f'{model.key_field}__in': shifted_keys}, status_id=shifted_status_id).update(
+            task_count=Greatest(models.F(TASK_COUNT) + shift_by, models.Value(0)),
+        )
+
+
+def move_task(task, created) -> None:
+    """
+    Count a new task, or move a task whose owner or status changed, in the summaries.
+
+    Args:
+        task: saved task;
+        created: is the task new.
+    """
+    owner_changed, saved_owner_id = task.saved_change('owner_id')
+    status_changed, saved_status_id = task.saved_change(STATUS_ID)
+    if not (created or owner_changed or status_changed):
+        return
+    owned = Counter({(task.owner_id, task.status_id): 1})
+    if not status_changed:
+        saved_status_id = task.status_id
+    if not created:
+        owned[saved_owner_id if owner_changed else task.owner_id, saved_status_id] -= 1
+    shift(OwnerStatusSummary, owned)
+    if status_changed:
+        assigned = Counter()
+        for developer_id in task.taskdeveloper_set.values_list(DEVELOPER_ID, flat=True):
+            assigned[developer_id, saved_status_id] -= 1
+            assigned[developer_id, task.status_id] += 1
+        shift(DeveloperStatusSummary, assigned)
+
+
+def remove_task(task) -> None:
+    """
+    Uncount a deleted task in the summary of its owner.
+
+    The assignments are deleted before the task and uncounted by `remove_assignment`.
+
+    Args:
+        task: deleted task.
+    """
+    shift(OwnerStatusSummary, Counter({(task.owner_id, task.status_id): -1}))
+
+
+def move_assignment(assignment, created) -> None:
+    """
+    Count a new assignment, or move an assignment to another task or developer, in the summaries.
+
+    Args:
+        assignment: saved assignment of a developer;
+        created: is the assignment new.
+    """
+    task_changed, saved_task_id = assignment.saved_change('task_id')
+    developer_changed, saved_developer_id = assignment.saved_change(DEVELOPER_ID)
+    if not (created or task_changed or developer_changed):
+        return
+    if not task_changed:
+        saved_task_id = assignment.task_id
+    statuses = dict(Task.objects.filter(pk__in={assignment.task_id, saved_task_id}).values_list(PK, STATUS_ID))
+    assigned = Counter({(assignment.developer_id, statuses.get(assignment.task_id)): 1})
+    if not created:
+        assigned[saved_developer_id if developer_changed else assignment.developer_id, statuses.get(saved_task_id)] -= 1
+    shift(DeveloperStatusSummary, assigned)
+
+
+def remove_assignment(assignment, origin=None) -> None:
+    """
+    Uncount a deleted assignment in the summary of its developer.
+
+    Args:
+        assignment: deleted assignment of a developer;
+        origin: object or queryset whose deletion started the cascade.
+    """
+    if isinstance(origin, Task) and origin.pk == assignment.task_id:
+        status_id = origin.status_id
+    else:
+        status_id = Task.objects.filter(pk=assignment.task_id).values_list(STATUS_ID, flat=True).first()
+    shift(DeveloperStatusSummary, Counter({(assignment.developer_id, status_id): -1}))
+
+
+def add_developers(instance, pk_set) -> None:
+    """
+    Count the assignments made by `developers.add/set` in the summaries.
+
+    Args:
+        instance: task or developer;
+        pk_set: ids of the added developers or tasks.
+    """
+    if isinstance(instance, Task):
+        assigned = Counter((developer_id, instance.status_id) for developer_id in pk_set)
+    else:
+        statuses = Task.objects.filter(pk__in=pk_set).values_list(STATUS_ID, flat=True)
+        assigned = Counter((instance.pk, status_id) for status_id in statuses)
+    shift(DeveloperStatusSummary, assigned)
+
+
+def add_tasks(tasks, assignments) -> None:
+    """
+    Count the tasks and the assignments inserted in bulk in the summaries.
+
+    Args:
+        tasks: inserted tasks;
+        assignments: inserted assignments of these tasks or of existing ones.
+    """
+    statuses = {task.pk: task.status_id for task in tasks}
+    existing_ids = {assignment.task_id for assignment in assignments} - statuses.keys()
+    if existing_ids:
+        statuses.update(Task.objects.filter(pk__in=existing_ids).values_list(PK, STATUS_ID))
+    shift(OwnerStatusSummary, Counter((task.owner_id, task.status_id) for task in tasks))
+    shift(DeveloperStatusSummary, Counter(
+        (assignment.developer_id, statuses[assignment.task_id]) for assignment in assignments
+    ))
+
+
+def release_status(status_id) -> None:
+    """
+    Move the summaries of a status being deleted to the tasks without a status.
+
+    Args:
+        status_id: id of the deleted status.
+    """
+    for model in SUMMARY_MODELS:
+        rows = model.objects.filter(status_id=status_id).values_list(model.key_field, TASK_COUNT)
+        shift(model, Counter({(key, None): task_count for key, task_count in rows}))
+
+
+def rebuild() -> int:
+    """
+    Recompute all summaries from the tasks and their assignments.
+
+    Returns:
+        int: number of summary rows.
+    """
+    owned = Task.objects.order_by().values('owner_id', STATUS_ID).annotate(task_count=models.Count(PK))
+    assigned = Task.objects.order_by().annotate(
+        developer_id=models.F('taskdeveloper__developer_id'),
+    ).filter(developer_id__isnull=False).values(DEVELOPER_ID, STATUS_ID).annotate(task_count=models.Count(PK))
+    with transaction.atomic():
+        for model in SUMMARY_MODELS:
+            model.objects.all().delete()
+        rows = OwnerStatusSummary.objects.bulk_create([OwnerStatusSummary(**row) for row in owned])
+        rows += DeveloperStatusSummary.objects.bulk_create([DeveloperStatusSummary(**row) for row in assigned])
+    return len(rows)
@@ -0,0 +1,294 @@
+"""
+This module measures where the requests spend their time.
+
+With `REQUEST_TIMING` on, `middleware.TimingMiddleware` records for every request the number
+and the time of its SQL queries, the time of its serializers and of the rendering of its
+template or renderer, and the name of its view. It sends them in the `Server-Timing` header
+and writes the requests slower than `SLOW_REQUEST_MS`, with their slowest queries, to
+the `freelance.slow_requests` logger as JSON lines. With it off the middleware is not loaded,
+and the timed functions only read a context variable.
+"""
+
+import heapq
+import json
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from logging import getLogger
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+SERIALIZE = 'serialize'
+RENDER = 'render'
+SLOWEST_QUERIES = 5
+MILLISECONDS = 1000
+WATCH_UID = 'freelance.timing.watch_queries'
+
+slow_requests = getLogger('freelance.slow_requests')
+
+_current = ContextVar('request_timing', default=None)
+
+
+class RequestTiming:
+    """Measurements of one request."""
+
+    def __init__(self):
+        """Start measuring."""
+        self.started = perf_counter()
+        self.query_count = 0
+        self.query_time = 0
+        self.slowest = []
+        self.phases = Counter()
+        self._starts = {}
+
+    @contextmanager
+    def query(self, sql):
+        """
+        Count a query run in the block and keep it if it is one of the slowest; failed queries are not counted.
+
+        Args:
+            sql: query text.
+
+        Yields:
+            None: while the query runs.
+        """
+        start = perf_counter()
+        yield
+        duration = perf_counter() - start
+        self.query_count += 1
+        self.query_time += duration
+        entry = (duration, self.query_count, sql)
+        if len(self.slowest) < SLOWEST_QUERIES:
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+
+    def begin(self, name) -> bool:
+        """
+        Start timing a phase, unless it is already timed, e.g. by an outer call of a timed function.
+
+        Args:
+            name: phase name.
+
+        Returns:
+            bool: was the phase started, then it must be ended with `end`.
+        """
+        if name in self._starts:
+            return False
+        self._starts[name] = perf_counter()
+        return True
+
+    def end(self, name) -> None:
+        """
+        Add the time since a phase was started to the phase.
+
+        Args:
+            name: phase name.
+        """
+        self.phases[name] += perf_counter() - self._starts.pop(name)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Add the time of a block to a phase.
+
+        Args:
+            name: phase name.
+
+        Yields:
+            None: while the block runs.
+        """
+        if not self.begin(name):
+            yield
+            return
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def server_timing(self, view_name) -> str:
+        """
+        Format the measurements as a `Server-Timing` header.
+
+        Args:
+            view_name: name of the view.
+
+        Returns:
+            str: header value.
+        """
+        db_time = self.query_time * MILLISECONDS
+        metrics = [f'db;dur={db_time:.1f};desc="{self.query_count} queries"']
+        for name, phase_time in sorted(self.phases.items()):
+            metrics.append(f'{name};dur={phase_time * MILLISECONDS:.1f}')
+        metrics.append(f'total;dur={self.elapsed() * MILLISECONDS:.1f};desc="{view_name}"')
+        return ', '.join(metrics)
+
+    def elapsed(self) -> float:
+        """
+        Get the time since the request started.
+
+        Returns:
+            float: time in seconds.
+        """
+        return perf_counter() - self.started
+
+
+def log_record(timing, request, response, name) -> dict:
+    """
+    Describe a slow request for the log.
+
+    Args:
+        timing: measurements of the request;
+        request: served request;
+        response: its response;
+        name: name of the view.
+
+    Returns:
+        dict: JSON-serializable record.
+    """
+    record = {
+        'time': timezone.now().isoformat(),
+        'method': request.method,
+        'path': request.get_full_path(),
+        'view': name,
+        'status': response.status_code,
+        'duration_ms': round(timing.elapsed() * MILLISECONDS, 1),
+        'queries': timing.query_count,
+        'db_ms': round(timing.query_time * MILLISECONDS, 1),
+    }
+    for phase, phase_time in timing.phases.items():
+        record[f'{phase}_ms'] = round(phase_time * MILLISECONDS, 1)
+    record['slowest_queries'] = [
+        {'sql': sql, 'duration_ms': round(duration * MILLISECONDS, 1)}
+        for duration, _, sql in sorted(timing.slowest, reverse=True)
+    ]
+    return record
+
+
+def current():
+    """
+    Get the measurements of the request being served.
+
+    Returns:
+        return: RequestTiming, or None if the request is not measured.
+    """
+    return _current.get()
+
+
+@contextmanager
+def measured():
+    """
+    Measure the request served in the block, or share the measurements of an outer block.
+
+    Yields:
+        RequestTiming: measurements of the request.
+    """
+    timing = _current.get()
+    if timing is not None:
+        yield timing
+        return
+    timing = RequestTiming()
+    token = _current.set(timing)
+    try:
+        yield timing
+    finally:
+        _current.reset(token)
+
+
+def view_name(request) -> str:
+    """
+    Get the name of the view that served a request.
+
+    Args:
+        request: served request.
+
+    Returns:
+        str: URL name or dotted path of the view, or an empty string if no URL matched.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return ''
+    return match.view_name or match._func_path  # noqa: WPS437
+
+
+def report(timing, request, response) -> None:
+    """
+    Send the measurements of a request in its response and log it if it was slow.
+
+    Args:
+        timing: measurements of the request;
+        request: served request;
+        response: its response.
+    """
+    name = view_name(request)
+    response['Server-Timing'] = timing.server_timing(name)
+    if timing.elapsed() * MILLISECONDS >= settings.SLOW_REQUEST_MS:
+        slow_requests.info(json.dumps(log_record(timing, request, response, name), ensure_ascii=False))
+
+
+def timed(phase):
+    """
+    Add the time of the calls of a function to a phase of the measured request.
+
+    Args:
+        phase: phase name, e.g. `SERIALIZE`.
+
+    Returns:
+        return: decorator.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            timing = _current.get()
+            if timing is None:
+                return function(*args, **kwargs)
+            with timing.phase(phase):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_query(execute, sql, query_params, many, context):
+    """
+    Execute a query, adding it to the measured request.
+
+    Args:
+        execute: next executor;
+        sql: query text;
+        query_params: query parameters;
+        many: is it `executemany`;
+        context: execution context.
+
+    Returns:
+        return: result of the executor.
+    """
+    timing = _current.get()
+    if timing is None:
+        return execute(sql, query_params, many, context)
+    with timing.query(sql):
+        return execute(sql, query_params, many, context)
+
+
+def watch_queries(sender=None, connection=None, **kwargs) -> None:
+    """
+    Add the query recorder to a database connection.
+
+    Args:
+        sender: backend class;
+        connection: database connection;
+        kwargs: signal arguments.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def watch_all_queries() -> None:
+    """Add the query recorder to the open connections and to the connections opened later."""
+    connection_created.connect(watch_queries, dispatch_uid=WATCH_UID)
+    for connection in connections.all(initialized_only=True):
+        watch_queries(connection=connection)
@@ -11,7 +11,7 @@ The DRF router will automatically generate appropriate URLs for the registered v
 from django.contrib.auth.views import LoginView
 from django.urls import path, reverse_lazy
 
-from . import views
+from . import async_views, views
 
 urlpatterns = (
     path('', views.main_page, name='main_page'),
@@ -27,7 +27,9 @@ urlpatterns = (
     path('dev-tasks/', views.DeveloperTasksView.as_view(), name='dev_tasks'),
     path('my-tasks/', views.OwnerTasksView.as_view(), name='my_tasks'),
     path('task/<uuid:pk>', views.TaskAdministrating.as_view(), name='task'),
+    path('task/<uuid:pk>/events', async_views.TaskEventsView.as_view(), name='task_events'),
     path('add-task', views.TaskCreatingView.as_view(), name='add_task'),
     path('comment/<uuid:pk>', views.CommentCreatingView.as_view(), name='add_comment'),
     path('edit-task/<uuid:pk>', views.EditStatusView.as_view(), name='edit_task'),
+    path('search/', views.SearchView.as_view(), name='search'),
 )
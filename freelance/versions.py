@@ -0,0 +1,148 @@
+"""
+This module contains version tokens shared by all worker processes.
+
+A version token is a random string kept in the Django cache. Writers replace it
+to tell every process that the data it has cached or derived from a table is outdated.
+"""
+
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = 'freelance:version:{0}'
+
+
+def get_version(name) -> str:
+    """
+    Get the current version token.
+
+    Args:
+        name: name of the versioned data.
+
+    Returns:
+        str: version token.
+    """
+    key = VERSION_KEY.format(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(name) -> str:
+    """
+    Get the current version token without blocking the event loop.
+
+    Args:
+        name: name of the versioned data.
+
+    Returns:
+        str: version token.
+    """
+    key = VERSION_KEY.format(name)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, uuid4().hex, None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(name) -> None:
+    """
+    Replace the version token now and once more after the commit.
+
+    The second replacement makes the processes that have read the data
+    before the transaction was committed read it again.
+
+    Args:
+        name: name of the versioned data.
+    """
+    key = VERSION_KEY.format(name)
+    cache.set(key, uuid4().hex, None)
+    transaction.on_commit(lambda: cache.set(key, uuid4().hex, None))
+
+
+def writes_version(model) -> str:
+    """
+    Get the name of the version replaced by the writes of a model.
+
+    Args:
+        model: model class.
+
+    Returns:
+        str: version name.
+    """
+    return f'{model._meta.label_lower}:writes'  # noqa: WPS437
+
+
+def reader_version(model, user_id) -> str:
+    """
+    Get the name of the version replaced by the writes of a model to the rows a user may see.
+
+    Args:
+        model: model class;
+        user_id: user id.
+
+    Returns:
+        str: version name.
+    """
+    return f'{model._meta.label_lower}:reader:{user_id}'  # noqa: WPS437
+
+
+def shared_version(model) -> str:
+    """
+    Get the name of the version replaced by the writes of a model changing the rows of many users.
+
+    Args:
+        model: model class.
+
+    Returns:
+        str: version name.
+    """
+    return f'{model._meta.label_lower}:shared'  # noqa: WPS437
+
+
+def list_versions(model, user) -> tuple:
+    """
+    Get the names of the versions a list of the rows a user may see depends on.
+
+    The staff sees all rows, so its lists change with every write of the model;
+    the lists of the other users change with the writes to their rows only.
+
+    Args:
+        model: model class;
+        user: reading user.
+
+    Returns:
+        tuple: version names.
+    """
+    scoped = writes_version(model) if user.is_staff else reader_version(model, user.pk)
+    return shared_version(model), scoped
+
+
+def developer_version(user_id) -> str:
+    """
+    Get the name of the version replaced by the writes of a user's developer profile.
+
+    Args:
+        user_id: user id.
+
+    Returns:
+        str: version name.
+    """
+    return f'freelance.developer:user:{user_id}'
+
+
+def user_version(user_id) -> str:
+    """
+    Get the name of the version replaced by the writes of a user and their tokens.
+
+    Args:
+        user_id: user id.
+
+    Returns:
+        str: version name.
+    """
+    return f'freelance.user:{user_id}'
@@ -1,16 +1,49 @@
 """This module contains the views for the application."""
 
+from hashlib import sha256
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth import logout
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import HttpResponseRedirect
-from django.shortcuts import redirect, render
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Max, Prefetch
+from django.http import Http404, HttpResponseRedirect, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, redirect, render
 from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.views.generic import CreateView, DetailView, ListView, UpdateView
+from django.views.generic.base import TemplateView, View
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.permissions import SAFE_METHODS, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.utils import urls
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
-from . import forms, models, serializers
+from . import export, filters, forms, models, pagination, search, serializers
+from .categories import category_cache
+from .fieldsets import load_only, requested_fields
 from .permissions import AdminOrReadOnlyPermission, UserPermission
+from .rows import compile_plan
+from .versions import get_version, list_versions
+
+LIST = 'list'
+RETRIEVE = 'retrieve'
+TASKS_PAGE_SIZE = 20
+COMMENTS_PAGE_SIZE = 20
+OWNER = 'owner'
+MODIFIED = 'modified'
+LAST_MODIFIED_KEY = 'last_modified'
+BULK_MAX_TASKS = 50000
+SEARCH_PAGE_SIZE = 20
+PAGE = 'page'
+DEVELOPERS = 'developers'
 
 
 class OwnerRequiredMixin(ModelViewSet):
@@ -44,30 +77,281 @@ class LoginRequiredEditedMixin(LoginRequiredMixin):
         abstract = True
 
 
-class TaskViewSet(OwnerRequiredMixin):
+class SparseFieldsetMixin(ModelViewSet):
+    """
+    Mixin that serializes lists with a slim serializer and loads only the serialized columns.
+
+    The `fields` query parameter selects any fields of the full serializer instead.
+    """
+
+    list_serializer_class = None
+
+    def get_serializer_class(self):
+        """
+        Get the slim serializer for lists without a field selection.
+
+        Returns:
+            return: serializer class.
+        """
+        if self.action == LIST and self.list_serializer_class and requested_fields(self.request) is None:
+            return self.list_serializer_class
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        """
+        Get the rows restricted to the columns read by the serializer for safe requests.
+
+        Writes load the row without the prefetches, which the update would drop and load again for the response.
+
+        Returns:
+            queryset: rows to serialize.
+        """
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset.prefetch_related(None)
+        ordering = getattr(self.pagination_class, 'ordering', ())
+        return load_only(queryset, self.get_serializer(), ordering)
+
+    class Meta:
+        """Configuration class for sparse fieldset mixin."""
+
+        abstract = True
+
+
+class FastListMixin(SparseFieldsetMixin):
+    """Mixin that serializes list pages of the selected fields from `values()` rows with a compiled plan."""
+
+    def list(self, request, *args, **kwargs):
+        """
+        List rows, falling back to the serializer if the plan does not support its fields.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        plan = compile_plan(self.get_serializer())
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+        ordering = getattr(self.pagination_class, 'ordering', ())
+        queryset = plan.values_queryset(self.filter_queryset(self.get_queryset()), ordering)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(plan.serialize(queryset))
+        return self.get_paginated_response(plan.serialize(page))
+
+    class Meta:
+        """Configuration class for fast list mixin."""
+
+        abstract = True
+
+
+class ConditionalGetMixin(ModelViewSet):
+    """
+    Mixin that answers conditional GET requests without running the serializer.
+
+    The validators of a list are computed from the latest modification time of the filtered rows
+    and the versions replaced by the writes to the rows the user may see, so they change when
+    a row leaves a filtered list as well; the validators of an object from its modification time.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """
+        List rows or answer that the client's copy is still valid.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        last_modified = queryset.order_by().aggregate(last_modified=Max(MODIFIED))[LAST_MODIFIED_KEY]
+        not_modified = self.check_validators(
+            request, last_modified, *(get_version(name) for name in list_versions(queryset.model, request.user)),
+        )
+        return not_modified or super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a row or answer that the client's copy is still valid.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        lookup = {self.lookup_field: self.kwargs[self.lookup_url_kwarg or self.lookup_field]}
+        try:
+            last_modified = self.filter_queryset(self.get_queryset()).filter(**lookup).values_list(
+                MODIFIED, flat=True,
+            ).first()
+        except (ValidationError, ValueError):
+            last_modified = None
+        if last_modified is None:
+            return super().retrieve(request, *args, **kwargs)
+        return self.check_validators(request, last_modified) or super().retrieve(request, *args, **kwargs)
+
+    def check_validators(self, request, last_modified, *state):
+        """
+        Compute the validators of the response and compare them with the request's ones.
+
+        Args:
+            request: user's request;
+            last_modified: latest modification time of the rows;
+            state: other values the response depends on.
+
+        Returns:
+            return: 304 response or None.
+        """
+        validated = (
+            request.get_full_path(),
+            str(request.user.pk),
+            last_modified.isoformat() if last_modified else '',
+            *state,
+        )
+        digest = sha256('\n'.join(validated).encode('utf-8')).hexdigest()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        self.response_validators = {'etag': quote_etag(digest), LAST_MODIFIED_KEY: timestamp}
+        return get_conditional_response(request, **self.response_validators)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Add ETag and Last-Modified headers to the response.
+
+        Args:
+            request: user's request;
+            response: response of the view;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, 'response_validators', None)
+        if validators and response.status_code in {status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED}:
+            response['ETag'] = validators['etag']
+            if validators[LAST_MODIFIED_KEY] is not None:
+                response['Last-Modified'] = http_date(validators[LAST_MODIFIED_KEY])
+        return response
+
+    class Meta:
+        """Configuration class for conditional get mixin."""
+
+        abstract = True
+
+
+class TaskViewSet(ConditionalGetMixin, FastListMixin, OwnerRequiredMixin):
     """API endpoint that allows tasks to be viewed."""
 
     serializer_class = serializers.TaskSerializer
-    queryset = models.Task.objects.all()
+    list_serializer_class = serializers.TaskListSerializer
+    pagination_class = pagination.TaskPagination
+    filter_backends = (filters.VisibleRowsFilterBackend, filters.TaskFilterBackend)
+    queryset = models.Task.objects.select_related(OWNER, models.STATUS).prefetch_related(DEVELOPERS)
+    query_budget = {LIST: 3, RETRIEVE: 3}
+
+    @action(detail=False, methods=('post',))
+    def bulk(self, request):
+        """
+        Create many tasks of the user at once.
+
+        Args:
+            request: user's request with a list of tasks.
+
+        Returns:
+            return: Response with the ids of the created tasks.
+        """
+        serializer = serializers.TaskBulkSerializer(
+            data=request.data,
+            many=True,
+            max_length=BULK_MAX_TASKS,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        ids = [task.id for task in serializer.instance]
+        return Response({'created': len(ids), 'ids': ids}, status=status.HTTP_201_CREATED)
+
+
+class CategoryCacheMixin(ModelViewSet):
+    """Mixin that reads statuses or positions from the cache for safe requests."""
+
+    def list(self, request, *args, **kwargs):
+        """
+        List all cached rows.
+
+        Args:
+            request: user's request;
+            args: position args;
+            kwargs: keyword args.
+
+        Returns:
+            return: Response
+        """
+        categories = category_cache(self.queryset.model).all()
+        serializer = self.get_serializer(categories, many=True)
+        plan = compile_plan(serializer.child)
+        return Response(serializer.data if plan is None else plan.serialize_objects(categories))
 
+    def get_object(self):
+        """
+        Get the requested row from the cache, or from the database for writes.
 
-class StatusViewSet(ModelViewSet):
+        The id is normalized first, since the cache is keyed by the canonical form of the UUIDs.
+
+        Raises:
+            Http404: if the id is malformed or there is no such row.
+
+        Returns:
+            return: model instance.
+        """
+        if self.request.method not in SAFE_METHODS:
+            return super().get_object()
+        try:
+            pk = str(UUID(self.kwargs[self.lookup_field]))
+        except ValueError:
+            pk = None
+        category = category_cache(self.queryset.model).get(pk)
+        if category is None:
+            raise Http404
+        self.check_object_permissions(self.request, category)
+        return category
+
+    class Meta:
+        """Configuration class for category cache mixin."""
+
+        abstract = True
+
+
+class StatusViewSet(CategoryCacheMixin):
     """API endpoint that allows statuses to be viewed."""
 
     serializer_class = serializers.StatusSerializer
     permission_classes = (AdminOrReadOnlyPermission,)
     queryset = models.Status.objects.all()
+    query_budget = {LIST: 1, RETRIEVE: 1}
 
 
-class PositionViewSet(ModelViewSet):
+class PositionViewSet(CategoryCacheMixin):
     """API endpoint that allows posittions to be viewed."""
 
     serializer_class = serializers.PositionSerializer
     permission_classes = (AdminOrReadOnlyPermission,)
     queryset = models.Position.objects.all()
+    query_budget = {LIST: 1, RETRIEVE: 1}
 
 
-class CommentViewSet(ModelViewSet):
+class CommentViewSet(ConditionalGetMixin, FastListMixin):
     """API endpoint that allows comments to be viewed."""
 
     def perform_create(self, serializer):
@@ -77,11 +361,160 @@ class CommentViewSet(ModelViewSet):
         Args:
             serializer: some serializer.
         """
-        developer = models.Developer.objects.filter(developer=self.request.user).first()
-        serializer.save(owner=developer)
+        serializer.save(owner=self.request.developer)
 
     serializer_class = serializers.CommentSerializer
-    queryset = models.Comment.objects.all()
+    list_serializer_class = serializers.CommentListSerializer
+    pagination_class = pagination.CommentPagination
+    permission_classes = (UserPermission,)
+    filter_backends = (filters.VisibleRowsFilterBackend,)
+    task_field = 'task'
+    owner_field = 'owner__developer_id'
+    queryset = models.Comment.objects.select_related('owner__developer')
+    query_budget = {LIST: 2, RETRIEVE: 2}
+
+
+class TaskExportView(APIView):
+    """API endpoint that streams all tasks with their developers and comments."""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, export_format):
+        """
+        Stream the export, through an async iterator under ASGI.
+
+        Args:
+            request: user's request;
+            export_format: 'ndjson' or 'csv'.
+
+        Raises:
+            Http404: if the format is not supported.
+
+        Returns:
+            return: StreamingHttpResponse
+        """
+        if export_format not in export.FORMATS:
+            raise Http404
+        response = StreamingHttpResponse(
+            export.streamed_lines(request, export_format), content_type=export.CONTENT_TYPES[export_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="tasks.{export_format}"'
+        return response
+
+
+def search_page(request) -> dict:
+    """
+    Find one page of search results for the query of a request among the tasks the user may see.
+
+    Args:
+        request: request with `q` and `page` parameters.
+
+    Returns:
+        dict: query, page number, results and whether there is a next page.
+    """
+    query = request.GET.get('q', '')
+    try:
+        page = max(int(request.GET.get(PAGE, 1)), 1)
+    except ValueError:
+        page = 1
+    visible = None if request.user.is_staff else filters.visible_tasks(request.user.id, models.TASK)
+    found = search.search(query, SEARCH_PAGE_SIZE + 1, (page - 1) * SEARCH_PAGE_SIZE, visible)
+    return {
+        'query': query,
+        PAGE: page,
+        'results': found[:SEARCH_PAGE_SIZE],
+        'has_next': len(found) > SEARCH_PAGE_SIZE,
+    }
+
+
+class SearchAPIView(APIView):
+    """API endpoint that finds tasks and comments by words, the most relevant first."""
+
+    def get(self, request):
+        """
+        Get one page of search results.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: Response
+        """
+        found = search_page(request)
+        url = request.build_absolute_uri()
+        previous_url = None
+        if found[PAGE] == 2:
+            previous_url = urls.remove_query_param(url, PAGE)
+        elif found[PAGE] > 2:
+            previous_url = urls.replace_query_param(url, PAGE, found[PAGE] - 1)
+        return Response({
+            'next': urls.replace_query_param(url, PAGE, found[PAGE] + 1) if found['has_next'] else None,
+            'previous': previous_url,
+            'results': serializers.SearchResultSerializer(found['results'], many=True).data,
+        })
+
+
+class SearchView(LoginRequiredEditedMixin, TemplateView):
+    """API endpoint that renders the search results of tasks and comments."""
+
+    template_name = 'search.html'
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the search results to the context.
+
+        Args:
+            kwargs: keyword args.
+
+        Returns:
+            context: some context data.
+        """
+        context = super().get_context_data(**kwargs)
+        context.update(search_page(self.request))
+        context['title'] = 'Поиск'
+        return context
+
+
+def status_summaries(user=None) -> tuple:
+    """
+    Get the non-empty status summaries of the owners and the developers.
+
+    Args:
+        user: user whose summaries are read, None for everyone's.
+
+    Returns:
+        tuple: owner and developer summaries.
+    """
+    owned = models.OwnerStatusSummary.objects.filter(task_count__gt=0).select_related(
+        OWNER, models.STATUS,
+    ).order_by('owner__username', 'status__name')
+    assigned = models.DeveloperStatusSummary.objects.filter(task_count__gt=0).select_related(
+        'developer__developer', models.STATUS,
+    ).order_by('developer__developer__username', 'status__name')
+    if user is not None:
+        owned = owned.filter(owner=user)
+        assigned = assigned.filter(developer__developer=user)
+    return owned, assigned
+
+
+class StatusSummaryAPIView(APIView):
+    """API endpoint that shows the number of tasks of the owners and the developers in each status."""
+
+    def get(self, request):
+        """
+        Get the summaries of the user, or of everyone for the staff.
+
+        Args:
+            request: user's request.
+
+        Returns:
+            return: Response
+        """
+        owned, assigned = status_summaries(None if request.user.is_staff else request.user)
+        return Response({
+            'owners': serializers.OwnerStatusSummarySerializer(owned, many=True).data,
+            DEVELOPERS: serializers.DeveloperStatusSummarySerializer(assigned, many=True).data,
+        })
 
 
 class UserRegistrationView(CreateView):
@@ -118,57 +551,79 @@ class ProfileView(LoginRequiredEditedMixin, DetailView):
             context: some context data.
         """
         context = super().get_context_data(**kwargs)
-        context['developer'] = models.Developer.objects.filter(
-            developer=self.request.user.id,
-        ).first()
+        context['developer'] = self.request.developer
+        owned, assigned = status_summaries(self.request.user)
+        context['owned_summaries'] = owned
+        context['assigned_summaries'] = assigned
         return context
 
 
-class DeveloperTasksView(LoginRequiredEditedMixin, ListView):
-    """API endpoint that allows developer's tasks to be viewed."""
+class TasksListMixin(LoginRequiredEditedMixin, ListView):
+    """Mixin that renders a paginated list of tasks with their statuses in one query."""
 
-    def get(self, request):
+    model = models.Task
+    context_object_name = 'tasks'
+    template_name = 'tasks.html'
+    paginate_by = TASKS_PAGE_SIZE
+
+    def get_queryset(self):
         """
-        Get developer and queryset to render.
+        Get tasks to render.
+
+        Returns:
+            queryset: tasks with joined statuses.
+        """
+        tasks = models.Task.objects.select_related(models.STATUS).order_by(*pagination.TASK_ORDERING)
+        return self.filter_tasks(tasks)
+
+    def filter_tasks(self, tasks):
+        """
+        Filter the tasks of the page.
 
         Args:
-            request: request object.
+            tasks: all tasks.
 
         Returns:
-            response: HHTTPResponse.
+            queryset: filtered tasks.
         """
-        self.developer = models.Developer.objects.filter(
-            developer=self.request.user.id,
-        ).first()
-        self.queryset = [task.task for task in models.TaskDeveloper.objects.filter(
-            developer=self.developer,
-        )]
-        return super().get(request)
+        return tasks
 
-    model = models.Task
-    context_object_name = 'tasks'
-    template_name = 'tasks.html'
+    class Meta:
+        """Configuration class for tasks list mixin."""
 
+        abstract = True
 
-class OwnerTasksView(LoginRequiredEditedMixin, ListView):
-    """API endpoint that allows your tasks to be viewed."""
 
-    def get(self, request):
+class DeveloperTasksView(TasksListMixin):
+    """API endpoint that allows developer's tasks to be viewed."""
+
+    def filter_tasks(self, tasks):
         """
-        Get task object to render.
+        Get tasks assigned to the user.
 
         Args:
-            request: user's request.
+            tasks: all tasks.
 
         Returns:
-            return: Response
+            queryset: developer's tasks.
         """
-        self.queryset = models.Task.objects.filter(owner=request.user)
-        return super().get(request)
+        return tasks.filter(taskdeveloper__developer__developer=self.request.user)
 
-    model = models.Task
-    context_object_name = 'tasks'
-    template_name = 'tasks.html'
+
+class OwnerTasksView(TasksListMixin):
+    """API endpoint that allows your tasks to be viewed."""
+
+    def filter_tasks(self, tasks):
+        """
+        Get tasks created by the user.
+
+        Args:
+            tasks: all tasks.
+
+        Returns:
+            queryset: owner's tasks.
+        """
+        return tasks.filter(owner=self.request.user)
 
 
 class DeveloperCreatingView(LoginRequiredEditedMixin, CreateView):
@@ -184,7 +639,7 @@ class DeveloperCreatingView(LoginRequiredEditedMixin, CreateView):
         Returns:
             return: Response
         """
-        if models.Developer.objects.filter(developer=request.user).first():
+        if request.developer:
             return HttpResponseRedirect(reverse_lazy('profile'))
         return super().get(request)
 
@@ -237,9 +692,7 @@ class CommentCreatingView(LoginRequiredEditedMixin, CreateView):
         Returns:
             return: form validation.
         """
-        form.instance.owner = models.Developer.objects.filter(
-            developer=self.request.user,
-        ).first()
+        form.instance.owner = self.request.developer
         form.instance.task = models.Task.objects.filter(
             id=self.kwargs['pk'],
         ).first()
@@ -272,7 +725,7 @@ class EditStatusView(LoginRequiredEditedMixin, UpdateView):
 
     model = models.Task
     template_name = 'edit.html'
-    fields = ('status',)
+    form_class = forms.TaskEditForm
     success_url = reverse_lazy('my_tasks')
 
     def get_context_data(self, **kwargs):
@@ -290,27 +743,45 @@ class EditStatusView(LoginRequiredEditedMixin, UpdateView):
         return context
 
 
-class TaskAdministrating(DetailView):
+class TaskAdministrating(View):
     """API endpoint that allows tasks to be viewd."""
 
-    model = models.Task
     template_name = 'task.html'
-
-    def get_context_data(self, **kwargs):
+    queryset = models.Task.objects.select_related(OWNER, models.STATUS).prefetch_related(
+        Prefetch(
+            DEVELOPERS,
+            queryset=models.Developer.objects.select_related(models.DEVELOPER, models.POSITION),
+        ),
+    )
+
+    async def get(self, request, pk):
         """
-        Add the data to the task request's content.
+        Render the task with one page of its comments, loaded with the async ORM interface.
 
         Args:
-            kwargs: keywoard args.
+            request: user's request;
+            pk: task id.
 
         Returns:
-            context: context data.
+            return: Response
         """
-        context = super().get_context_data(**kwargs)
-        context['developers'] = [
-            dev.developer for dev in kwargs['object'].developers.all()
-        ]
-        return context
+        since = timezone.now()
+        task = await aget_object_or_404(self.queryset, pk=pk)
+        comments = task.comments.select_related('owner__developer').order_by(*pagination.COMMENT_ORDERING)
+        paginator = Paginator(comments, COMMENTS_PAGE_SIZE)
+        paginator.count = task.comment_count
+        page = paginator.get_page(request.GET.get(PAGE))
+        page.object_list = [comment async for comment in page.object_list]
+        context = {
+            'object': task,
+            'task': task,
+            'view': self,
+            DEVELOPERS: [dev.developer for dev in task.developers.all()],
+            'comments': page,
+            'since': since.isoformat(),
+        }
+        # The templates read the lazy request user and the category cache, which may query the database.
+        return await sync_to_async(render)(request, self.template_name, context)
 
 
 def log_out(request):
@@ -0,0 +1,113 @@
+"""Asynchronous views tests module."""
+
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import resolve, reverse
+from rest_framework import status, test
+
+from freelance import models, views
+from tests.test_queries import seed
+
+TASKS_URL = '/api/tasks/'
+COMMENTS_URL = '/api/comments/'
+ETAG = 'ETag'
+
+
+class AsyncViewsTest(TestCase):
+    """Test that the async endpoints answer as the viewsets."""
+
+    def setUp(self):
+        """Set up tasks and an authenticated client."""
+        seed(3)
+        self.user = User.objects.create(username='async', password='async', is_staff=True)
+        self.client = test.APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def sync_get(self, viewset, url, action, **kwargs):
+        """
+        Get a response of a synchronous viewset.
+
+        Args:
+            viewset: viewset class;
+            url: requested url;
+            action: read action;
+            kwargs: url keyword args.
+
+        Returns:
+            return: Response
+        """
+        request = test.APIRequestFactory().get(url)
+        test.force_authenticate(request, user=self.user)
+        return viewset.as_view({'get': action})(request, **kwargs).render()
+
+    def assert_same(self, viewset, url, action, **kwargs):
+        """
+        Check that the async endpoint answers the url as the viewset.
+
+        Args:
+            viewset: viewset class;
+            url: requested url;
+            action: read action;
+            kwargs: url keyword args.
+        """
+        self.assertTrue(iscoroutinefunction(resolve(urlsplit(url).path).func))
+        response = self.client.get(url)
+        expected = self.sync_get(viewset, url, action, **kwargs)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response.get(ETAG), expected.get(ETAG))
+
+    def test_identical_responses(self):
+        """Test lists, pages, field selections, details and errors."""
+        task = models.Task.objects.first()
+        comment = models.Comment.objects.first()
+        list_urls = (
+            TASKS_URL,
+            self.client.get(f'{TASKS_URL}?page_size=2').json()['next'],
+            f'{TASKS_URL}?fields=id,developers',
+            f'{TASKS_URL}?fields=nothing',
+            f'{TASKS_URL}?status=wrong',
+            f'{COMMENTS_URL}?page_size=1',
+        )
+        for url in list_urls:
+            with self.subTest(url=url):
+                viewset = views.TaskViewSet if TASKS_URL in url else views.CommentViewSet
+                self.assert_same(viewset, url, 'list')
+        details = (
+            (views.TaskViewSet, TASKS_URL, task.id),
+            (views.CommentViewSet, COMMENTS_URL, comment.id),
+            (views.TaskViewSet, TASKS_URL, uuid4()),
+        )
+        for detail_viewset, base_url, pk in details:
+            self.assert_same(detail_viewset, f'{base_url}{pk}/', 'retrieve', pk=pk)
+
+    def test_not_modified(self):
+        """Test that the conditional requests are answered without the rows."""
+        etag = self.client.get(TASKS_URL)[ETAG]
+        with self.assertNumQueries(1):
+            response = self.client.get(TASKS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_writes(self):
+        """Test that the writes and the access checks are passed to the viewsets."""
+        response = self.client.post(TASKS_URL, {'name': 'written'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        detail_url = '{0}{1}/'.format(TASKS_URL, response.json()['id'])
+        self.assertEqual(self.client.patch(detail_url, {'name': 'patched'}).json()['name'], 'patched')
+        self.assertEqual(self.client.delete(detail_url).status_code, status.HTTP_204_NO_CONTENT)
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(TASKS_URL).status_code, status.HTTP_403_FORBIDDEN)
+
+    async def test_event_loop(self):
+        """Test the endpoints and the task page served on the event loop."""
+        await self.async_client.aforce_login(self.user)
+        task = await models.Task.objects.afirst()
+        response = await self.async_client.get(TASKS_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), await models.Task.objects.acount())
+        response = await self.async_client.get(reverse('task', args=(task.id,)))
+        self.assertContains(response, task.name)
@@ -0,0 +1,88 @@
+"""Token authentication tests module."""
+
+from hashlib import sha256
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from freelance.authentication import RESOLVED_KEY, TokenCache, token_cache
+from freelance.versions import get_version, user_version
+
+TASKS_URL = '/api/tasks/'
+KEYS_TABLE = 'FROM "authtoken_token"'
+
+
+class CachedTokenAuthenticationTest(TestCase):
+    """Test that the tokens are resolved from the cache until they or their users change."""
+
+    def setUp(self):
+        """Set up a user with a token and a client sending it."""
+        cache.clear()
+        token_cache.clear()
+        self.user = User.objects.create(username='holder')
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def auth_queries(self) -> int:
+        """
+        Request the tasks counting the queries of the tokens.
+
+        Returns:
+            int: number of queries.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(TASKS_URL).status_code, status.HTTP_200_OK)
+            return sum(KEYS_TABLE in query['sql'] for query in queries.captured_queries)
+
+    def test_cached(self):
+        """Test that only the first request resolves the token in the database."""
+        self.assertEqual(self.auth_queries(), 2)
+        self.assertEqual(self.auth_queries(), 0)
+        token_cache.clear()
+        self.assertEqual(self.auth_queries(), 0)
+
+    def test_cached_fields(self):
+        """Test that the shared cache keeps no password hash and the user is rebuilt from it."""
+        self.user.set_password('hidden')
+        self.user.save()
+        self.auth_queries()
+        digest = sha256(self.token.key.encode()).hexdigest()
+        self.assertNotIn(self.user.password, repr(cache.get(RESOLVED_KEY.format(digest))))
+        token_cache.clear()
+        token = token_cache.get(digest, Token)
+        self.assertEqual(token.key, self.token.key)
+        self.assertEqual((token.user.pk, token.user.username), (self.user.pk, 'holder'))
+
+    def test_deactivated(self):
+        """Test that the token of a deactivated user is refused."""
+        self.auth_queries()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get(TASKS_URL).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deleted(self):
+        """Test that a deleted or unknown token is refused."""
+        self.auth_queries()
+        self.token.delete()
+        self.assertEqual(self.client.get(TASKS_URL).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.credentials(HTTP_AUTHORIZATION='Token unknown')
+        self.assertEqual(self.client.get(TASKS_URL).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bounded(self):
+        """Test that the process keeps the recently used tokens only."""
+        lru = TokenCache(2)
+        digests = []
+        for token_user in User.objects.bulk_create(User(username=f'user{num}') for num in range(3)):
+            digests.append(f'{token_user.pk:064x}')
+            version = get_version(user_version(token_user.pk))
+            lru.set(digests[-1], version, Token.objects.create(user=token_user))
+        self.assertEqual(len(lru), 2)
+        lru.clear()
+        self.assertIsNotNone(lru.get(digests[-1], Token))
@@ -0,0 +1,84 @@
+"""Bulk task creation tests module."""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from freelance import models
+
+BULK_URL = '/api/tasks/bulk/'
+JSON = 'json'
+LARGE = 100
+CREATED = 'created'
+DEVELOPERS = 'developers'
+
+
+class BulkCreationTest(TestCase):
+    """Test the bulk task creation endpoint."""
+
+    def setUp(self):
+        """Set up an owner, a status and developers."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='integrator', password='integrator')
+        self.client.force_authenticate(user=self.user)
+        self.status = models.Status.objects.create(name='open')
+        position = models.Position.objects.create(name='junior')
+        self.developers = [
+            models.Developer.objects.create(
+                developer=User.objects.create(username=f'bulk_dev{num}'), position=position,
+            )
+            for num in range(2)
+        ]
+
+    def make_tasks(self, tasks_number):
+        """
+        Build a request body.
+
+        Args:
+            tasks_number: number of tasks.
+
+        Returns:
+            list: tasks.
+        """
+        return [
+            {
+                'name': f'nightly {num}',
+                'status': str(self.status.id),
+                DEVELOPERS: [str(developer.id) for developer in self.developers],
+            }
+            for num in range(tasks_number)
+        ]
+
+    def test_create(self):
+        """Test that tasks and assignments are created for the requesting owner."""
+        response = self.client.post(BULK_URL, self.make_tasks(3), format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()[CREATED], 3)
+        tasks = models.Task.objects.filter(owner=self.user, status=self.status)
+        self.assertEqual(tasks.count(), 3)
+        self.assertEqual(models.TaskDeveloper.objects.filter(task__in=tasks).count(), 6)
+
+    def test_constant_queries(self):
+        """Test that the number of queries does not depend on the number of tasks within a batch."""
+        self.client.post(BULK_URL, self.make_tasks(1), format=JSON)
+        with self.assertNumQueries(10):
+            self.client.post(BULK_URL, self.make_tasks(2), format=JSON)
+        with self.assertNumQueries(10):
+            self.client.post(BULK_URL, self.make_tasks(LARGE), format=JSON)
+
+    def test_invalid_developer(self):
+        """Test that nothing is created if a developer does not exist."""
+        tasks = self.make_tasks(2)
+        tasks[1][DEVELOPERS].append(str(self.status.id))
+        response = self.client.post(BULK_URL, tasks, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(models.Task.objects.exists())
+
+    def test_future_task(self):
+        """Test that tasks from the future are rejected."""
+        tasks = self.make_tasks(2)
+        tasks[0][CREATED] = '2083-12-12T00:00:00Z'
+        response = self.client.post(BULK_URL, tasks, format=JSON)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(models.Task.objects.exists())
@@ -0,0 +1,104 @@
+"""Categorial models cache tests module."""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from freelance import forms, models, versions
+from freelance.categories import CategoryCache, category_cache
+
+STATUSES_URL = '/api/statuses/'
+NAME = 'name'
+OPEN = 'open'
+REOPENED = 'reopened'
+
+
+class CategoryCacheTest(TestCase):
+    """Test the cache of statuses and positions."""
+
+    def setUp(self):
+        """Set up a staff client and categories."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='cacher', password='cacher', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+        self.status = models.Status.objects.create(name=OPEN)
+        self.position = models.Position.objects.create(name='junior')
+
+    def test_api_without_queries(self):
+        """Test that warm statuses are listed and retrieved without queries."""
+        self.client.get(STATUSES_URL)
+        with self.assertNumQueries(0):
+            rows = self.client.get(STATUSES_URL).json()
+            self.client.get(f'{STATUSES_URL}{self.status.id}/')
+        self.assertEqual([row[NAME] for row in rows], [OPEN])
+
+    def test_api_id_forms(self):
+        """Test that an id is found in any form of the UUID and a malformed id is not found."""
+        for pk in (self.status.id.hex, str(self.status.id).upper()):
+            with self.subTest(pk=pk):
+                response = self.client.get(f'{STATUSES_URL}{pk}/')
+                self.assertEqual(response.json()[NAME], OPEN)
+        response = self.client.get(f'{STATUSES_URL}not-an-id/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_api_write_invalidates(self):
+        """Test that a status created through the API is listed at once."""
+        self.client.get(STATUSES_URL)
+        response = self.client.post(STATUSES_URL, {NAME: 'closed'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        rows = self.client.get(STATUSES_URL).json()
+        self.assertEqual([row[NAME] for row in rows], ['closed', OPEN])
+
+    def test_str_without_queries(self):
+        """Test that tasks and developers are printed without status and position queries."""
+        task = models.Task.objects.create(name='cached', owner=self.user, status=self.status)
+        developer = models.Developer.objects.create(developer=self.user, position=self.position)
+        task = models.Task.objects.get(pk=task.pk)
+        developer = models.Developer.objects.select_related(models.DEVELOPER).get(pk=developer.pk)
+        category_cache(models.Status).all()
+        category_cache(models.Position).all()
+        with self.assertNumQueries(0):
+            self.assertEqual(str(task), '"cached": open')
+            self.assertEqual(str(developer), 'cacher (junior)')
+
+    def test_form_choices(self):
+        """Test that position choices are rendered from the cache and validated."""
+        category_cache(models.Position).all()
+        with self.assertNumQueries(0):
+            self.assertIn('junior', str(forms.DeveloperCreatigForm()['position']))
+        self.assertTrue(forms.DeveloperCreatigForm(data={'position': self.position.id}).is_valid())
+        self.assertFalse(forms.DeveloperCreatigForm(data={'position': self.status.id}).is_valid())
+
+
+class CategoryVersionTest(TestCase):
+    """Test when the caches of other processes reload the rows."""
+
+    def setUp(self):
+        """Set up a status."""
+        self.status = models.Status.objects.create(name=OPEN)
+
+    @override_settings(CATEGORY_VERSION_TTL=0)
+    def test_other_process_reloads(self):
+        """Test that a cache loaded before a write reloads the rows."""
+        other_process = CategoryCache(models.Status)
+        self.assertEqual(other_process.get(self.status.id).name, OPEN)
+        self.status.name = REOPENED
+        self.status.save()
+        self.assertEqual(other_process.get(self.status.id).name, REOPENED)
+
+    @override_settings(CATEGORY_VERSION_TTL=60)
+    def test_version_ttl(self):
+        """Test that the shared version is checked once per TTL, but at once after an own write."""
+        other_process = CategoryCache(models.Status)
+        other_process.all()
+        self.status.name = REOPENED
+        self.status.save()
+        with mock.patch('freelance.categories.get_version', wraps=versions.get_version) as get_version:
+            self.assertEqual(other_process.get(self.status.id).name, OPEN)
+            self.assertEqual(other_process.get(self.status.id).name, OPEN)
+            get_version.assert_not_called()
+        other_process.invalidate()
+        self.assertEqual(other_process.get(self.status.id).name, REOPENED)
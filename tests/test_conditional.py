@@ -0,0 +1,131 @@
+"""Conditional GET tests module."""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from freelance import models
+
+TASKS_URL = '/api/tasks/'
+ETAG = 'ETag'
+
+
+class ConditionalGetTest(TestCase):
+    """Test ETag and Last-Modified validators of the API."""
+
+    def setUp(self):
+        """Set up a task."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='poller', password='poller', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+        self.task = models.Task.objects.create(name='polled', owner=self.user)
+        self.detail_url = f'{TASKS_URL}{self.task.id}/'
+
+    def assert_not_modified(self, url, etag):
+        """
+        Check that the url answers 304 to the etag with one query.
+
+        Args:
+            url: requested url;
+            etag: validator of the client's copy.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response[ETAG], etag)
+
+    def test_list(self):
+        """Test that the list answers 304 until a task is added, changed or deleted."""
+        etag = self.client.get(TASKS_URL)[ETAG]
+        self.assert_not_modified(TASKS_URL, etag)
+
+        other = models.Task.objects.create(name='other', owner=self.user)
+        changed = self.client.get(TASKS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed[ETAG], etag)
+
+        etag = changed[ETAG]
+        other.delete()
+        self.assertNotEqual(self.client.get(TASKS_URL, HTTP_IF_NONE_MATCH=etag)[ETAG], etag)
+
+    def test_filtered_list(self):
+        """Test that a filtered list changes when a row leaves it without being deleted."""
+        todo = models.Status.objects.create(name='todo')
+        models.Task.objects.filter(pk=self.task.pk).update(status=todo)
+        models.Task.objects.create(name='latest', owner=self.user, status=todo)
+        url = f'{TASKS_URL}?status={todo.id}'
+        etag = self.client.get(url)[ETAG]
+        self.assert_not_modified(url, etag)
+
+        task = models.Task.objects.get(pk=self.task.pk)
+        task.status = models.Status.objects.create(name='done')
+        task.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(changed.json()['results']), 1)
+
+    def test_detail(self):
+        """Test that a task answers 304 until its developers change."""
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response['Last-Modified'], http_date(int(self.task.modified.timestamp())))
+        etag = response[ETAG]
+        self.assert_not_modified(self.detail_url, etag)
+
+        position = models.Position.objects.create(name='junior')
+        self.task.developers.add(models.Developer.objects.create(developer=self.user, position=position))
+        changed = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed[ETAG], etag)
+
+    def test_if_modified_since(self):
+        """Test that a task answers 304 to a fresh If-Modified-Since."""
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_missing_object(self):
+        """Test that a missing task is still answered with 404."""
+        response = self.client.get(f'{TASKS_URL}not-an-id/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ListVersionTest(TestCase):
+    """Test which writes change the validators of the lists."""
+
+    def setUp(self):
+        """Set up a developer with a task and a task of another owner."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='reader')
+        self.client.force_authenticate(user=self.user)
+        self.status = models.Status.objects.create(name='review')
+        self.own = models.Task.objects.create(name='own', owner=self.user, status=self.status)
+        self.other = models.Task.objects.create(name='other', owner=User.objects.create(username='stranger'))
+
+    def is_modified(self, etag) -> bool:
+        """
+        Check if the task list of the user answers a new copy to the etag.
+
+        Args:
+            etag: validator of the client's copy.
+
+        Returns:
+            bool: is the list sent again.
+        """
+        return self.client.get(TASKS_URL, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+    def test_other_users_writes(self):
+        """Test that the writes to the tasks the user does not see keep the list valid."""
+        etag = self.client.get(TASKS_URL)[ETAG]
+        self.other.name = 'renamed'
+        self.other.save()
+        self.assertFalse(self.is_modified(etag))
+        self.other.developers.add(models.Developer.objects.create(developer=self.user))
+        self.assertTrue(self.is_modified(etag))
+
+    def test_status_deleted(self):
+        """Test that deleting a status changes the lists of its tasks."""
+        etag = self.client.get(TASKS_URL)[ETAG]
+        self.status.delete()
+        self.assertTrue(self.is_modified(etag))
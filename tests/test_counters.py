@@ -0,0 +1,102 @@
+"""Task counters tests module."""
+
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from freelance import models
+
+COMMENT_COUNT = 'comment_count'
+DEVELOPER_COUNT = 'developer_count'
+
+
+class TaskCountersTest(TestCase):
+    """Test that the counters of the tasks follow their comments and developers."""
+
+    def setUp(self):
+        """Set up two tasks and two developers."""
+        owner = User.objects.create(username='counted')
+        self.task = models.Task.objects.create(name='first', owner=owner)
+        self.other = models.Task.objects.create(name='second', owner=owner)
+        self.developers = [
+            models.Developer.objects.create(developer=User.objects.create(username=username))
+            for username in ('alpha', 'beta')
+        ]
+
+    def assert_counts(self, task, comments, developers):
+        """
+        Check the counters of a task against the expected numbers.
+
+        Args:
+            task: checked task;
+            comments: expected number of comments;
+            developers: expected number of developers.
+        """
+        counts = models.Task.objects.values_list(COMMENT_COUNT, DEVELOPER_COUNT).get(pk=task.pk)
+        self.assertEqual(counts, (comments, developers))
+
+    def test_comments(self):
+        """Test creation, moving and deletion of comments."""
+        comments = [
+            models.Comment.objects.create(task=self.task, owner=developer, comment_content='solution')
+            for developer in self.developers
+        ]
+        self.assert_counts(self.task, 2, 0)
+        moved = models.Comment.objects.get(pk=comments[0].pk)
+        moved.task = self.other
+        for _ in range(2):
+            moved.save()
+        self.assert_counts(self.other, 1, 0)
+        comments[1].delete()
+        self.assert_counts(self.task, 0, 0)
+        self.developers[0].delete()
+        self.assert_counts(self.other, 0, 0)
+
+    def test_task_developers(self):
+        """Test assigning developers through the tasks and the assignments."""
+        alpha, beta = self.developers
+        self.task.developers.add(alpha, beta)
+        self.assert_counts(self.task, 0, 2)
+        self.task.developers.remove(alpha, alpha)
+        self.task.developers.set((alpha,))
+        self.task.developers.clear()
+        self.assert_counts(self.task, 0, 0)
+        models.TaskDeveloper.objects.create(task=self.task, developer=alpha)
+        self.assert_counts(self.task, 0, 1)
+
+    def test_developer_tasks(self):
+        """Test assigning tasks through the developers."""
+        alpha, beta = self.developers
+        alpha.tasks.add(self.task, self.other)
+        beta.task_set.add(self.other)
+        self.assert_counts(self.other, 0, 2)
+        alpha.task_set.clear()
+        self.assert_counts(self.task, 0, 0)
+        self.assert_counts(self.other, 0, 1)
+        beta.tasks.remove(self.other)
+        self.assert_counts(self.other, 0, 0)
+
+    def test_task_deletion(self):
+        """Test that deleting a task does not shift the counters of its deleted rows."""
+        self.task.developers.add(*self.developers)
+        models.Comment.objects.create(task=self.task, owner=self.developers[0], comment_content='lost')
+        with CaptureQueriesContext(connection) as queries:
+            models.Task.objects.filter(pk=self.task.pk).delete()
+            updates = [query for query in queries if query['sql'].startswith('UPDATE "freelance_task"')]
+        self.assertEqual(updates, [])
+
+    def test_repair(self):
+        """Test that the command recomputes the counters changed behind the signals."""
+        self.task.developers.add(*self.developers)
+        models.Comment.objects.create(task=self.other, owner=self.developers[0], comment_content='kept')
+        models.Task.objects.update(comment_count=5, developer_count=0)
+        models.Task.objects.filter(pk=self.other.pk).update(comment_count=1)
+        output = StringIO()
+        call_command('repair_task_counters', stdout=output)
+        self.assertIn('Repaired 1 tasks', output.getvalue())
+        self.assert_counts(self.task, 0, 2)
+        self.assert_counts(self.other, 1, 0)
@@ -0,0 +1,128 @@
+"""Task events tests module."""
+
+import json
+from datetime import timedelta
+from uuid import uuid4
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from freelance import events, models
+
+EVENTS_URL = 'task_events'
+SINCE = 'since'
+
+
+def parse_event(message) -> tuple:
+    """
+    Decode an event of the stream.
+
+    Args:
+        message: encoded event.
+
+    Returns:
+        tuple: event type and data.
+    """
+    text = message.decode('utf-8') if isinstance(message, bytes) else message
+    fields = dict(line.split(': ', 1) for line in text.splitlines() if line)
+    return fields['event'], json.loads(fields['data'])
+
+
+class TaskEventsTest(TestCase):
+    """Test the events of the tasks and their stream."""
+
+    def setUp(self):
+        """Set up a task, a developer and a stub of the delivery."""
+        self.task = models.Task.objects.create(name='awaited', owner=User.objects.create(username='owner'))
+        self.developer = models.Developer.objects.create(developer=User.objects.create(username='solver'))
+        self.url = reverse(EVENTS_URL, args=(self.task.id,))
+        models.Comment.objects.create(task=self.task, owner=self.developer, comment_content='missed')
+        self.published = []
+        self.backend = events.broker().backend
+        self.backend_publish = self.backend.publish
+        self.backend.publish = lambda channel, message: self.published.append((channel, message))
+        self.addCleanup(setattr, self.backend, 'publish', self.backend_publish)
+
+    def published_events(self) -> list:
+        """
+        Decode the published events checking their channel.
+
+        Returns:
+            list: event types and data.
+        """
+        for channel, _ in self.published:
+            self.assertEqual(channel, events.CHANNEL.format(self.task.id))
+        return [parse_event(message) for _, message in self.published]
+
+    def test_comment_published(self):
+        """Test that a new comment is published after the commit only."""
+        with self.captureOnCommitCallbacks(execute=True):
+            models.Comment.objects.create(task=self.task, owner=self.developer, comment_content='solved')
+            self.assertEqual(self.published, [])
+        published = self.published_events()
+        self.assertEqual(len(published), 1)
+        kind, comment = published[0]
+        self.assertEqual(kind, events.COMMENT)
+        self.assertEqual((comment['owner'], comment['content']), ('solver', 'solved'))
+
+    def test_status_published(self):
+        """Test that only the saves changing the status are published."""
+        done = models.Status.objects.create(name='done')
+        task = models.Task.objects.get(pk=self.task.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            task.name = 'renamed'
+            task.save()
+            task.status = done
+            task.save()
+            task.save()
+        expected = (events.STATUS, {events.STATUS: str(done.id), 'name': 'done'})
+        self.assertEqual(self.published_events(), [expected])
+
+    async def test_stream(self):
+        """Test that the stream sends the missed comments and then the published events."""
+        self.backend.publish = self.backend_publish
+        stream = events.task_events(self.task.id, timezone.now() - timedelta(minutes=1))
+        self.assertEqual(parse_event(await anext(stream))[1]['content'], 'missed')
+        message = events.format_event(timezone.now(), events.STATUS, {events.STATUS: None, 'name': None})
+        await sync_to_async(self.backend.publish)(events.CHANNEL.format(self.task.id), message)
+        self.assertEqual(parse_event(await anext(stream))[0], events.STATUS)
+        await stream.aclose()
+
+    def test_wsgi(self):
+        """Test that the stream is not served by a thread per subscriber."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+
+
+class TaskEventsAccessTest(TestCase):
+    """Test who is served the event stream of a task."""
+
+    def setUp(self):
+        """Set up a task and a developer."""
+        self.task = models.Task.objects.create(name='guarded', owner=User.objects.create(username='owner'))
+        self.developer = models.Developer.objects.create(developer=User.objects.create(username='solver'))
+        self.url = reverse(EVENTS_URL, args=(self.task.id,))
+
+    async def test_stream_access(self):
+        """Test that the stream is served to the users who may see the task only."""
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        await self.async_client.aforce_login(self.developer.developer)
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        await models.TaskDeveloper.objects.acreate(task=self.task, developer=self.developer)
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+    async def test_stream_errors(self):
+        """Test that unknown tasks and malformed times are refused."""
+        await self.async_client.aforce_login(self.task.owner)
+        response = await self.async_client.get(reverse(EVENTS_URL, args=(uuid4(),)))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = await self.async_client.get(self.url, {SINCE: '2024-13-01T00:00'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
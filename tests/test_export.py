@@ -0,0 +1,77 @@
+"""Export tests module."""
+
+import csv
+import json
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from freelance import export, models
+
+NDJSON_URL = '/api/export/tasks.ndjson'
+DEVELOPERS = 'developers'
+COMMENTS = 'comments'
+TASKS_NUMBER = 5
+
+
+class ExportTest(TestCase):
+    """Test the streaming export."""
+
+    def setUp(self):
+        """Set up tasks with developers and comments."""
+        self.client = APIClient()
+        self.staff = User.objects.create(username='reporter', password='reporter', is_staff=True)
+        developer = models.Developer.objects.create(
+            developer=self.staff, position=models.Position.objects.create(name='analyst'),
+        )
+        task_status = models.Status.objects.create(name='open')
+        for num in range(TASKS_NUMBER):
+            task = models.Task.objects.create(name=f'report {num}', owner=self.staff, status=task_status)
+            task.developers.add(developer)
+            models.Comment.objects.create(task=task, owner=developer, comment_content=f'solution {num}')
+
+    def test_ndjson(self):
+        """Test that every task is streamed with its related rows."""
+        self.client.force_authenticate(user=self.staff)
+        response = self.client.get(NDJSON_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        records = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(records), TASKS_NUMBER)
+        self.assertEqual(records[0][DEVELOPERS][0]['position'], 'analyst')
+        self.assertEqual(records[0][COMMENTS][0]['owner'], 'reporter')
+
+    def test_csv(self):
+        """Test that the CSV export has a header and a row per task."""
+        self.client.force_authenticate(user=self.staff)
+        response = self.client.get('/api/export/tasks.csv')
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), TASKS_NUMBER)
+        self.assertEqual(rows[0]['status'], 'open')
+        self.assertEqual(len(json.loads(rows[0][COMMENTS])), 1)
+
+    def test_staff_only(self):
+        """Test that other users can not export."""
+        self.client.force_authenticate(user=User.objects.create(username='curious'))
+        self.assertEqual(self.client.get(NDJSON_URL).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command(self):
+        """Test that the command writes the same records in small chunks."""
+        output = StringIO()
+        call_command('export_tasks', chunk_size=2, stdout=output)
+        names = sorted(json.loads(line)['name'] for line in output.getvalue().splitlines())
+        self.assertEqual(names, [f'report {num}' for num in range(TASKS_NUMBER)])
+
+    async def test_asgi(self):
+        """Test that under ASGI the export is streamed by an async iterator in batches."""
+        await self.async_client.aforce_login(self.staff)
+        response = await self.async_client.get(NDJSON_URL)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(len(b''.join(chunks).decode().splitlines()), TASKS_NUMBER)
+        batches = [batch async for batch in export.aexport_lines(export.NDJSON, batch_size=2)]
+        self.assertEqual(len(batches), 3)
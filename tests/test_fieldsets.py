@@ -0,0 +1,79 @@
+"""Sparse fieldsets tests module."""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from freelance import models
+
+TASKS_URL = '/api/tasks/'
+COMMENTS_URL = '/api/comments/'
+ROWS = 'results'
+DESCRIPTION = 'description'
+COMMENT_TEXT = 'comment_content'
+
+
+class SparseFieldsetTest(TestCase):
+    """Test the list representations and the `fields` selector."""
+
+    def setUp(self):
+        """Set up a task with a long description and a comment."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='sparse', password='sparse')
+        self.client.force_authenticate(user=self.user)
+        developer = models.Developer.objects.create(developer=self.user)
+        self.task = models.Task.objects.create(name='slim', description='text ' * 1000, owner=self.user)
+        self.task.developers.add(developer)
+        models.Comment.objects.create(task=self.task, owner=developer, comment_content='long answer')
+
+    def get_sql(self, url):
+        """
+        Get a response and the SQL it ran.
+
+        Args:
+            url: requested url.
+
+        Returns:
+            tuple: response data and the joined SQL.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+            sql = '\n'.join(query['sql'] for query in queries)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json(), sql
+
+    def test_slim_lists(self):
+        """Test that lists do not read large text columns and developers."""
+        tasks, sql = self.get_sql(TASKS_URL)
+        self.assertEqual(
+            set(tasks[ROWS][0]),
+            {'id', 'name', 'owner', 'status', 'created', 'modified', 'comment_count', 'developer_count'},
+        )
+        self.assertNotIn(DESCRIPTION, sql)
+        self.assertNotIn('_prefetch_related_val', sql)
+        comments, sql = self.get_sql(COMMENTS_URL)
+        self.assertNotIn(COMMENT_TEXT, comments[ROWS][0])
+        self.assertNotIn(COMMENT_TEXT, sql)
+
+    def test_selected_fields(self):
+        """Test that the selector returns and reads only the requested fields."""
+        tasks, sql = self.get_sql(f'{TASKS_URL}?fields=id,description')
+        self.assertEqual(set(tasks[ROWS][0]), {'id', DESCRIPTION})
+        self.assertNotIn('auth_user', sql)
+        task, sql = self.get_sql(f'{TASKS_URL}{self.task.id}/?fields=name')
+        self.assertEqual(task, {'name': 'slim'})
+        self.assertNotIn(DESCRIPTION, sql)
+
+    def test_full_detail(self):
+        """Test that a task without a selector has all fields."""
+        task, _ = self.get_sql(f'{TASKS_URL}{self.task.id}/')
+        self.assertEqual(len(task['developers']), 1)
+        self.assertIn(DESCRIPTION, task)
+
+    def test_unknown_field(self):
+        """Test that an unknown field is rejected."""
+        response = self.client.get(f'{TASKS_URL}?fields=id,secret')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,100 @@
+"""Task API filters tests module."""
+
+import re
+from datetime import timedelta
+from itertools import combinations
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from freelance import models, pagination, views
+from freelance.filters import TASK_FILTERS, TaskFilterBackend
+
+TASKS_URL = '/api/tasks/'
+FULL_SCAN = re.compile(r'\bSCAN\b')
+ROWS = 'results'
+OLD = 'old'
+ASSIGNED = 'assigned'
+CREATED_AFTER = 'created_after'
+AGE = timedelta(weeks=4)
+
+
+class TaskFilterTest(TestCase):
+    """Test the filters of the task list."""
+
+    def setUp(self):
+        """Set up tasks of two owners with different statuses and developers."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='filterer', password='filterer', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+        other = User.objects.create(username='other_owner', password='other_owner')
+        self.done = models.Status.objects.create(name='done')
+        self.developer = models.Developer.objects.create(developer=other)
+        self.old = models.Task.objects.create(
+            name=OLD, owner=self.user, status=self.done, created=timezone.now() - AGE,
+        )
+        self.assigned = models.Task.objects.create(name=ASSIGNED, owner=other)
+        self.assigned.developers.add(self.developer)
+
+    def filtered_names(self, **query):
+        """
+        Get the names of the listed tasks.
+
+        Args:
+            query: query parameters.
+
+        Returns:
+            list: task names.
+        """
+        response = self.client.get(TASKS_URL, query)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['name'] for task in response.json()[ROWS]]
+
+    def test_filters(self):
+        """Test that every filter selects the matching tasks."""
+        self.assertEqual(self.filtered_names(status=self.done.id), [OLD])
+        self.assertEqual(self.filtered_names(owner=self.user.id), [OLD])
+        self.assertEqual(self.filtered_names(developer=self.developer.id), [ASSIGNED])
+        week_ago = (timezone.now() - timedelta(days=7)).isoformat()
+        self.assertEqual(self.filtered_names(created_after=week_ago), [ASSIGNED])
+        self.assertEqual(self.filtered_names(created_before=week_ago), [OLD])
+        self.assertEqual(self.filtered_names(owner=self.user.id, created_after=week_ago), [])
+
+    def test_open_range(self):
+        """Test that a one-sided range keeps the tasks created after the filter is applied."""
+        week_ago = (timezone.now() - timedelta(days=7)).isoformat()
+        request = Request(APIRequestFactory().get(TASKS_URL, {CREATED_AFTER: week_ago}))
+        tasks = TaskFilterBackend().filter_queryset(request, models.Task.objects.all(), None)
+        models.Task.objects.create(name='latest', owner=self.user)
+        self.assertCountEqual(tasks.values_list('name', flat=True), [ASSIGNED, 'latest'])
+
+    def test_invalid(self):
+        """Test that malformed values are rejected instead of ignored."""
+        response = self.client.get(TASKS_URL, {'status': 'open', CREATED_AFTER: 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.json()), {'status', CREATED_AFTER})
+
+    def test_query_plans(self):
+        """Test that every combination of filters is answered by index searches."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('The plan format is specific to SQLite')
+        examples = {
+            'status': self.done.id,
+            'owner': self.user.id,
+            'developer': self.developer.id,
+            CREATED_AFTER: timezone.now().isoformat(),
+            'created_before': timezone.now().isoformat(),
+        }
+        factory = APIRequestFactory()
+        for size in range(1, len(TASK_FILTERS) + 1):
+            for names in combinations(TASK_FILTERS, size):
+                request = Request(factory.get(TASKS_URL, {name: examples[name] for name in names}))
+                tasks = TaskFilterBackend().filter_queryset(request, views.TaskViewSet.queryset, None)
+                plan = tasks.order_by(*pagination.TASK_ORDERING)[:views.TASKS_PAGE_SIZE].explain()
+                with self.subTest(filters=names):
+                    self.assertIsNone(FULL_SCAN.search(plan), plan)
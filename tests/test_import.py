@@ -0,0 +1,137 @@
+"""Import tests module."""
+
+import json
+from io import StringIO
+from tempfile import NamedTemporaryFile
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from freelance import models
+from freelance.export import export_lines
+from freelance.importer import TaskImporter
+
+TASKS_NUMBER = 5
+OWNER = 'legacy_owner'
+DEVELOPER = 'legacy_dev'
+BATCH_QUERIES = 13
+LOCAL_TIME = '2020-01-02T00:00:00'
+COMMENTS = 'comments'
+OWNER_KEY = 'owner'
+
+
+def make_records(tasks_number=TASKS_NUMBER):
+    """
+    Build records of the legacy tracker.
+
+    Args:
+        tasks_number: number of tasks.
+
+    Returns:
+        list: records without ids.
+    """
+    return [
+        {
+            'name': f'migrated {num}',
+            'status': 'open',
+            OWNER_KEY: OWNER,
+            'created': '2020-01-01T00:00:00+00:00',
+            'developers': [{'username': DEVELOPER, 'position': 'senior'}],
+            COMMENTS: [{OWNER_KEY: DEVELOPER, 'content': 'done', 'published': '2020-01-02T00:00:00+00:00'}],
+        }
+        for num in range(tasks_number)
+    ]
+
+
+class ImportTest(TestCase):
+    """Test the bulk import."""
+
+    def assert_imported(self):
+        """Check that every row exists once."""
+        self.assertEqual(models.Task.objects.count(), TASKS_NUMBER)
+        self.assertEqual(models.TaskDeveloper.objects.count(), TASKS_NUMBER)
+        self.assertEqual(models.Comment.objects.count(), TASKS_NUMBER)
+        self.assertEqual(models.Developer.objects.get().position.name, 'senior')
+        self.assertEqual(set(models.Task.objects.values_list('status__name', flat=True)), {'open'})
+
+    def test_references(self):
+        """Test that missing statuses, positions, users and developers are created."""
+        TaskImporter().import_batch(make_records())
+        self.assert_imported()
+        self.assertEqual(User.objects.count(), 2)
+
+    def test_restart(self):
+        """Test that importing the same records again does not duplicate rows."""
+        records = make_records()
+        list(TaskImporter().run(records[:3]))
+        list(TaskImporter().run(records, batch_size=2))
+        self.assert_imported()
+
+    def test_existing_tasks(self):
+        """Test that only the inserted rows are counted and existing tasks count their new rows."""
+        records = make_records()
+        importer = TaskImporter()
+        importer.import_batch(records)
+        self.assertEqual(importer.rows, TASKS_NUMBER * 3)
+        records[0][COMMENTS].append({OWNER_KEY: DEVELOPER, 'content': 'reopened'})
+        records[0]['developers'].append({'username': 'late_dev', 'position': 'senior'})
+        importer = TaskImporter()
+        importer.import_batch(records)
+        self.assertEqual(importer.rows, 2)
+        task = models.Task.objects.get(name='migrated 0')
+        self.assertEqual((task.comment_count, task.developer_count), (2, 2))
+        summary = models.DeveloperStatusSummary.objects.get(developer__developer__username='late_dev')
+        self.assertEqual((summary.status_id, summary.task_count), (task.status_id, 1))
+
+    def test_constant_queries(self):
+        """Test that a batch with known references takes the same number of queries for any size."""
+        importer = TaskImporter()
+        importer.import_batch(make_records())
+        models.Task.objects.all().delete()
+        with self.assertNumQueries(BATCH_QUERIES):
+            importer.import_batch(make_records(1))
+        with self.assertNumQueries(BATCH_QUERIES):
+            importer.import_batch(make_records(TASKS_NUMBER))
+
+    def test_invalid_record(self):
+        """Test that records from the future are skipped and reported."""
+        records = make_records()
+        records[0]['created'] = '2083-12-12T00:00:00+00:00'
+        importer = TaskImporter()
+        importer.import_batch(records)
+        self.assertEqual(len(importer.errors), 1)
+        self.assertEqual(models.Task.objects.count(), TASKS_NUMBER - 1)
+
+    def test_round_trip(self):
+        """Test that the command imports its own CSV export with the same ids."""
+        TaskImporter().import_batch(make_records())
+        ids = set(models.Task.objects.values_list('id', flat=True))
+        with NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', newline='') as export:
+            export.writelines(export_lines('csv'))
+            export.flush()
+            models.Task.objects.all().delete()
+            output = StringIO()
+            call_command('import_tasks', export.name, stdout=output)
+        self.assertEqual(set(models.Task.objects.values_list('id', flat=True)), ids)
+        self.assertIn('rows/s', output.getvalue())
+        record = json.loads(next(export_lines('ndjson')))
+        self.assertEqual(record[COMMENTS][0]['content'], 'done')
+
+
+class ImportTimesTest(TestCase):
+    """Test the times of the imported rows."""
+
+    def test_naive_times(self):
+        """Test that the times without an offset are taken as local times."""
+        records = make_records(1)
+        records[0]['created'] = LOCAL_TIME
+        records[0][COMMENTS] = [{OWNER_KEY: DEVELOPER, 'published': LOCAL_TIME}]
+        importer = TaskImporter()
+        importer.import_batch(records)
+        self.assertEqual(importer.errors, [])
+        local_time = timezone.make_aware(parse_datetime(LOCAL_TIME))
+        self.assertEqual(models.Task.objects.get().created, local_time)
+        self.assertEqual(models.Comment.objects.get().publication_date, local_time)
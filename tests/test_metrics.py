@@ -0,0 +1,89 @@
+"""Metrics tests module."""
+
+from tempfile import TemporaryDirectory
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from freelance import metrics
+from freelance.authentication import token_cache
+
+TASKS_URL = '/api/tasks/'
+TASKS_ROUTE_NAME = 'api/tasks/'
+TASKS_ROUTE = 'route:api/tasks/'
+TOKENS = 'cache:tokens'
+FAST = 0.02
+SLOW = 3
+FEW_QUERIES = 4
+MANY_QUERIES = 150
+WORKERS_LINES = (
+    'freelance_requests_total{route="api/tasks/"} 4',
+    'freelance_request_errors_total{route="api/tasks/"} 2',
+    'freelance_request_duration_seconds_bucket{route="api/tasks/",le="0.025"} 2',
+    'freelance_request_duration_seconds_bucket{route="api/tasks/",le="+Inf"} 4',
+    'freelance_request_queries_bucket{route="api/tasks/",le="100"} 2',
+    'freelance_request_queries_sum{route="api/tasks/"} 308',
+    'freelance_cache_hit_ratio{cache="tokens"} 1.0000',
+)
+
+
+class MetricsTest(TestCase):
+    """Test that the requests and the cache lookups are counted and shown to the staff."""
+
+    def setUp(self):
+        """Set up an empty metrics directory and a staff user."""
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        metrics_settings = override_settings(METRICS_DIR=self.directory)
+        metrics_settings.enable()
+        self.addCleanup(metrics_settings.disable)
+        self.user = User.objects.create(username='watcher', is_staff=True)
+
+    def test_requests(self):
+        """Test that the requests are counted under their route with their latencies and queries."""
+        self.client.force_login(self.user)
+        for _ in range(3):
+            self.client.get(TASKS_URL)
+        record = metrics.collect(self.directory)[TASKS_ROUTE]
+        self.assertEqual(record[metrics.REQUESTS], 3)
+        self.assertEqual(record[metrics.ERRORS], 0)
+        self.assertEqual(sum(record[metrics.DURATIONS:metrics.DURATION_SUM]), 3)
+        self.assertEqual(sum(record[metrics.QUERIES:metrics.QUERY_SUM]), 3)
+        self.assertGreater(record[metrics.QUERY_SUM], 0)
+
+    def test_token_cache(self):
+        """Test that the lookups of the token cache are counted as misses, then hits."""
+        token_cache.clear()
+        token = Token.objects.create(user=self.user)
+        for _ in range(3):
+            self.client.get(TASKS_URL, HTTP_AUTHORIZATION=f'Token {token.key}')
+        record = metrics.collect(self.directory)[TOKENS]
+        self.assertEqual((record[metrics.HITS], record[metrics.MISSES]), (2, 1))
+
+    def test_workers(self):
+        """Test that the files of all workers are added up."""
+        for owner in ('1-1', '2-1'):
+            worker = metrics.Store(self.directory, owner)
+            worker.observe_request(TASKS_ROUTE_NAME, status.HTTP_200_OK, FAST, FEW_QUERIES)
+            worker.observe_request(TASKS_ROUTE_NAME, status.HTTP_503_SERVICE_UNAVAILABLE, SLOW, MANY_QUERIES)
+            worker.count_cache('tokens', hit=True)
+        text = metrics.exposition(self.directory)
+        for line in WORKERS_LINES:
+            self.assertIn(line, text)
+
+    def test_endpoint(self):
+        """Test that only the staff reads the metrics."""
+        url = reverse('api_metrics')
+        self.client.force_login(User.objects.create(username='developer'))
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_login(self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn('# TYPE freelance_requests_total counter', response.content.decode())
+        with override_settings(METRICS_DIR=''):
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,67 @@
+"""Developer middleware tests module."""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from freelance import models
+
+DEVELOPER_TABLE = 'FROM "freelance_developer"'
+PROFILE = 'profile'
+
+
+class DeveloperMiddlewareTest(TestCase):
+    """Test that the developer profile of a request is loaded at most once."""
+
+    def setUp(self):
+        """Set up a logged in developer."""
+        self.user = User.objects.create(username='solver')
+        self.position = models.Position.objects.create(name='backend')
+        self.developer = models.Developer.objects.create(developer=self.user, position=self.position)
+        self.client.force_login(self.user)
+
+    def developer_queries(self, url) -> int:
+        """
+        Request a page counting the queries of the developer profiles.
+
+        Args:
+            url: page address.
+
+        Returns:
+            int: number of queries.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+            return sum(DEVELOPER_TABLE in query['sql'] for query in queries.captured_queries)
+
+    def test_session_cache(self):
+        """Test that the profile is kept in the session until it changes."""
+        url = reverse(PROFILE)
+        self.assertEqual(self.developer_queries(url), 1)
+        self.assertEqual(self.developer_queries(url), 0)
+        self.assertEqual(self.client.get(url).context['developer'], self.developer)
+        self.developer.position = None
+        self.developer.save()
+        self.assertEqual(self.developer_queries(url), 1)
+        self.assertIsNone(self.client.get(url).context['developer'].position_id)
+        self.developer.delete()
+        self.assertFalse(self.client.get(url).context['developer'])
+
+    @override_settings(DEVELOPER_SESSION_CACHE=False)
+    def test_without_session_cache(self):
+        """Test that the profile is loaded once per request without the session cache."""
+        url = reverse(PROFILE)
+        self.assertEqual(self.developer_queries(url), 1)
+        self.assertEqual(self.developer_queries(url), 1)
+
+    def test_views(self):
+        """Test that the views use the profile of the request."""
+        self.assertRedirects(self.client.get(reverse('developer_evolution')), reverse(PROFILE))
+        task = models.Task.objects.create(name='solved', owner=self.user)
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        client.post('/api/comments/', {'task': str(task.id), 'comment_content': 'done'}, format='json')
+        self.assertEqual(models.Comment.objects.get().owner, self.developer)
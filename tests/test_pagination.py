@@ -0,0 +1,119 @@
+"""Keyset pagination tests module."""
+
+import json
+from base64 import b64encode
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from freelance import models
+from freelance.pagination import COMMENT_ORDERING, TASK_ORDERING
+
+TASKS_URL = '/api/tasks/'
+COMMENTS_URL = '/api/comments/'
+PAGE_SIZE = '?page_size=2'
+ID = 'id'
+NEXT = 'next'
+PREVIOUS = 'previous'
+ROWS = 'results'
+
+
+def ordered_ids(model, ordering):
+    """
+    Get the ids of all rows in the keyset order.
+
+    Args:
+        model: model class;
+        ordering: ordering column names.
+
+    Returns:
+        list: string ids.
+    """
+    return [str(pk) for pk in model.objects.order_by(*ordering).values_list(ID, flat=True)]
+
+
+class KeysetPaginationTest(TestCase):
+    """Test keyset pagination of the list endpoints."""
+
+    def setUp(self):
+        """Set up tasks with duplicated names and empty statuses."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='pager', password='pager', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+        statuses = [models.Status.objects.create(name=name) for name in ('open', 'done')]
+        position = models.Position.objects.create(name='junior')
+        developer = models.Developer.objects.create(developer=self.user, position=position)
+        for name in ('b', 'a', 'b', 'a', 'c'):
+            for task_status in (*statuses, None):
+                task = models.Task.objects.create(name=name, owner=self.user, status=task_status)
+                models.Comment.objects.create(task=task, owner=developer, comment_content=name)
+
+    def walk(self, url):
+        """
+        Walk through all pages following the next links.
+
+        Args:
+            url: first page url.
+
+        Returns:
+            return: ids of the walked rows and the last page.
+        """
+        ids = []
+        page = None
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            page = response.json()
+            ids.extend(row[ID] for row in page[ROWS])
+            url = page[NEXT]
+        return ids, page
+
+    def test_tasks_forward(self):
+        """Test that walking forward visits every task once in the keyset order."""
+        ids, _ = self.walk(TASKS_URL + PAGE_SIZE)
+        self.assertEqual(ids, ordered_ids(models.Task, TASK_ORDERING))
+
+    def test_tasks_backward(self):
+        """Test that walking backward from the last page visits every task once."""
+        _, page = self.walk(TASKS_URL + PAGE_SIZE)
+        ids = [row[ID] for row in page[ROWS]]
+        url = page[PREVIOUS]
+        while url:
+            page = self.client.get(url).json()
+            ids = [row[ID] for row in page[ROWS]] + ids
+            url = page[PREVIOUS]
+        self.assertEqual(ids, ordered_ids(models.Task, TASK_ORDERING))
+
+    def test_comments_forward(self):
+        """Test that walking forward visits every comment once in the keyset order."""
+        ids, _ = self.walk(COMMENTS_URL + PAGE_SIZE)
+        self.assertEqual(ids, ordered_ids(models.Comment, COMMENT_ORDERING))
+
+    def test_no_offset_and_count(self):
+        """Test that deep pages are fetched without OFFSET and COUNT."""
+        first_page = self.client.get(TASKS_URL + PAGE_SIZE).json()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(first_page[NEXT])
+            statements = ' '.join(query['sql'].upper() for query in queries.captured_queries)
+        self.assertNotIn('OFFSET', statements)
+        self.assertNotIn('COUNT(', statements)
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor or a cursor with values of the wrong types is rejected."""
+        cursors = [(TASKS_URL, 'broken')] + [
+            (url, b64encode(json.dumps({'p': position}).encode()).decode())
+            for url, position in (
+                (TASKS_URL, ['name', None, {'id': 1}]),
+                (TASKS_URL, ['name', 'open', 'not-an-id']),
+                (COMMENTS_URL, [{'date': 1}, None]),
+                (COMMENTS_URL, [['2024-01-01'], None]),
+            )
+        ]
+        for url, cursor in cursors:
+            with self.subTest(url=url, cursor=cursor):
+                response = self.client.get(url, {'cursor': cursor})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
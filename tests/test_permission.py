@@ -2,9 +2,17 @@
 
 from django.contrib.auth.models import User
 from django.test import RequestFactory, TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
 
+from freelance import models
 from freelance.permissions import AdminOrReadOnlyPermission, UserPermission
 
+TASKS_URL = '/api/tasks/'
+COMMENTS_URL = '/api/comments/'
+TASK_URL = '/api/tasks/{0}/'
+COMMENT_URL = '/api/comments/{0}/'
+
 
 class AdminPermissionTest(TestCase):
     """Tests user admin permission."""
@@ -46,3 +54,65 @@ class DefaultUserPermissionTest(TestCase):
         request.user = self.user
         objc = None
         self.assertTrue(self.permission.has_object_permission(request, self.view, objc))
+
+
+class ScopedAccessTest(TestCase):
+    """Test the rows the users see and change through the API."""
+
+    def setUp(self):
+        """Set up a task with an assigned developer, their comment and a stranger."""
+        self.owner = User.objects.create(username='scope_owner')
+        self.solver = User.objects.create(username='scope_solver')
+        self.stranger = User.objects.create(username='scope_stranger')
+        developer = models.Developer.objects.create(developer=self.solver)
+        models.Developer.objects.create(developer=self.stranger)
+        self.task = models.Task.objects.create(name='scoped', owner=self.owner)
+        self.task.developers.add(developer)
+        self.comment = models.Comment.objects.create(task=self.task, owner=developer, comment_content='mine')
+        self.client = APIClient()
+
+    def listed(self, user, url):
+        """
+        Get the ids of the rows listed to a user.
+
+        Args:
+            user: authenticated user;
+            url: list url.
+
+        Returns:
+            list: row ids.
+        """
+        self.client.force_authenticate(user=user)
+        return [row['id'] for row in self.client.get(url).json()['results']]
+
+    def test_visibility(self):
+        """Test that the tasks and the comments are listed to their owners, developers and the staff only."""
+        staff = User.objects.create(username='scope_staff', is_staff=True)
+        for user in (self.owner, self.solver, staff):
+            self.assertEqual(self.listed(user, TASKS_URL), [str(self.task.id)])
+            self.assertEqual(self.listed(user, COMMENTS_URL), [str(self.comment.id)])
+        self.assertEqual(self.listed(self.stranger, TASKS_URL), [])
+        self.assertEqual(self.listed(self.stranger, COMMENTS_URL), [])
+        response = self.client.get(TASK_URL.format(self.task.id))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_changes(self):
+        """Test that only the owners change the tasks and the comments."""
+        self.client.force_authenticate(user=self.solver)
+        response = self.client.patch(TASK_URL.format(self.task.id), {'name': 'stolen'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.patch(COMMENT_URL.format(self.comment.id), {'comment_content': 'edited'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.patch(COMMENT_URL.format(self.comment.id), {'comment_content': 'rewritten'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.patch(TASK_URL.format(self.task.id), {'name': 'renamed'})
+        self.assertEqual(response.json()['developers'], [str(self.task.developers.get().id)])
+
+    def test_owner_not_fetched(self):
+        """Test that the owner check compares the loaded ids."""
+        request = RequestFactory().delete('/')
+        request.user = self.stranger
+        task = models.Task.objects.only('id', 'owner_id').get()
+        with self.assertNumQueries(0):
+            self.assertFalse(UserPermission().has_object_permission(request, None, task))
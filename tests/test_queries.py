@@ -0,0 +1,80 @@
+"""Query budget tests module."""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from django_sirius.urls import router
+from freelance import models
+
+SMALL = 3
+LARGE = 30
+LIST = 'list'
+RETRIEVE = 'retrieve'
+
+
+def seed(tasks_number):
+    """
+    Create tasks with owners, statuses, developers and comments.
+
+    Args:
+        tasks_number: number of tasks.
+    """
+    position = models.Position.objects.create(name='senior')
+    task_status = models.Status.objects.create(name='open')
+    developers = [
+        models.Developer.objects.create(
+            developer=User.objects.create(username=f'dev{tasks_number}_{num}'),
+            position=position,
+        )
+        for num in range(2)
+    ]
+    for num in range(tasks_number):
+        owner = User.objects.create(username=f'owner{tasks_number}_{num}')
+        task = models.Task.objects.create(name=f'task {num}', owner=owner, status=task_status)
+        task.developers.add(*developers)
+        for developer in developers:
+            models.Comment.objects.create(task=task, owner=developer, comment_content='done')
+
+
+class QueryBudgetTest(TestCase):
+    """Test that every router endpoint stays within its query budget."""
+
+    def setUp(self):
+        """Set up an authenticated client."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='budget', password='budget', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+
+    def count_queries(self, url):
+        """
+        Count the queries of a GET request.
+
+        Args:
+            url: requested url.
+
+        Returns:
+            int: number of queries.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            queries_number = len(queries)
+        return queries_number
+
+    def test_budgets(self):
+        """Test that the number of queries does not grow with the number of rows."""
+        seed(SMALL)
+        small = {prefix: self.count_queries(f'/api/{prefix}/') for prefix, _, _ in router.registry}
+        seed(LARGE)
+        for prefix, viewset, _ in router.registry:
+            url = f'/api/{prefix}/'
+            with self.subTest(url=url):
+                queries = self.count_queries(url)
+                self.assertEqual(queries, small[prefix])
+                self.assertLessEqual(queries, viewset.query_budget[LIST])
+                detail = viewset.queryset.model.objects.first()
+                self.assertLessEqual(self.count_queries(f'{url}{detail.pk}/'), viewset.query_budget[RETRIEVE])
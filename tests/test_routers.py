@@ -0,0 +1,123 @@
+"""Read replica routing tests module."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory, TestCase, override_settings
+
+from freelance import models, routers
+
+REPLICA = 'replica'
+TASKS_URL = '/api/tasks/'
+WRITTEN = 'written'
+NAME = 'name'
+PRIMARY = 'primary'
+REPLICATED_MODELS = (models.Task, Session, User)
+
+
+def create_replica(name) -> None:
+    """
+    Connect a replica file, out of the test databases, and create the tables of the models in it.
+
+    Args:
+        name: name of the file.
+    """
+    primary = connections[DEFAULT_DB_ALIAS]
+    connections[REPLICA] = primary.__class__({**primary.settings_dict, 'NAME': name}, alias=REPLICA)
+    with connections[REPLICA].schema_editor() as editor:
+        for model in apps.get_models():
+            if model._meta.can_migrate(editor.connection):  # noqa: WPS437
+                editor.create_model(model)
+
+
+def clear_replica() -> None:
+    """Delete the rows of the replica without the signals writing to the primary."""
+    with connections[REPLICA].cursor() as cursor:
+        for model in REPLICATED_MODELS:
+            cursor.execute(f'DELETE FROM {model._meta.db_table}')  # noqa: S608, WPS437
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA])
+class ReplicaTestCase(TestCase):
+    """Test case with a replica holding a logged in user and a task."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the replica."""
+        super().setUpClass()
+        cls.directory = TemporaryDirectory()
+        create_replica(str(Path(cls.directory.name) / 'replica.sqlite3'))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Drop the replica."""
+        connections[REPLICA].close()
+        del connections[REPLICA]  # noqa: WPS420
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Set up a logged in user, replicate them and add a task that has reached the replica only."""
+        self.user = User.objects.create(username='reader', is_staff=True)
+        self.client.force_login(self.user)
+        for model in (User, Session):
+            model.objects.using(REPLICA).bulk_create(model.objects.all())
+        replicated = models.Task(name='replicated', owner_id=self.user.id)
+        models.Task.objects.using(REPLICA).bulk_create([replicated])
+        self.addCleanup(clear_replica)
+
+
+class ReplicaRouterTest(ReplicaTestCase):
+    """Test that the safe requests read from a replica until their client writes."""
+
+    def task_names(self) -> list:
+        """
+        List the names of the tasks the user reads.
+
+        Returns:
+            list: task names.
+        """
+        return [task[NAME] for task in self.client.get(TASKS_URL).json()['results']]
+
+    def test_reads(self):
+        """Test that the safe requests read from the replica and the others from the primary."""
+        self.assertEqual(self.task_names(), ['replicated'])
+        self.client.post(TASKS_URL, {NAME: WRITTEN})
+        self.assertEqual(models.Task.objects.get().name, WRITTEN)
+        self.assertEqual(self.task_names(), [WRITTEN])
+
+    @override_settings(REPLICA_PIN_SECONDS=-1)
+    def test_pin_expired(self):
+        """Test that the client reads from the replica again after the pin expires."""
+        self.client.post(TASKS_URL, {NAME: WRITTEN})
+        self.assertEqual(self.task_names(), ['replicated'])
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        """Test that everything is read from the primary without the replicas."""
+        models.Task.objects.create(name=PRIMARY, owner=self.user)
+        self.assertEqual(self.task_names(), [PRIMARY])
+
+
+class ReplicaConsistencyTest(ReplicaTestCase):
+    """Test that a request reads one snapshot and the caches are filled from the primary."""
+
+    def test_cache_fills(self):
+        """Test that the shared caches are filled from the primary during a replicated request."""
+        models.Status.objects.create(name=PRIMARY)
+        response = self.client.get('/api/statuses/')
+        self.assertEqual([row[NAME] for row in response.json()], [PRIMARY])
+
+    @override_settings(DATABASE_REPLICAS=[REPLICA, DEFAULT_DB_ALIAS])
+    def test_one_replica_per_request(self):
+        """Test that all reads of a request go to the same replica."""
+        router = routers.ReplicaRouter()
+        with routers.routed_reads(RequestFactory().get(TASKS_URL)):
+            chosen = {router.db_for_read(models.Task) for _ in range(4)}
+            with routers.primary_reads():
+                self.assertIsNone(router.db_for_read(models.Task))
+        self.assertEqual(len(chosen), 1)
@@ -0,0 +1,86 @@
+"""Fast list serialization tests module."""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from freelance import models, rows, serializers
+from tests.test_queries import seed
+
+LIST_URLS = (
+    '/api/tasks/',
+    '/api/tasks/?page_size=2',
+    '/api/tasks/?fields=id,developers,description,created,status',
+    '/api/comments/',
+    '/api/comments/?fields=comment_content,owner,task',
+    '/api/statuses/',
+    '/api/positions/',
+)
+LIST_SERIALIZERS = (
+    serializers.TaskSerializer,
+    serializers.TaskListSerializer,
+    serializers.CommentListSerializer,
+    serializers.StatusSerializer,
+    serializers.PositionSerializer,
+)
+
+
+class FastListTest(TestCase):
+    """Test that the compiled plans give the same JSON as the serializers."""
+
+    def setUp(self):
+        """Set up tasks with all kinds of related rows."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=User.objects.create(username='lister', password='lister', is_staff=True))
+        seed(7)
+        models.Task.objects.create(name='no status', owner=User.objects.first())
+
+    def test_plans_compile(self):
+        """Test that every list serializer is supported by the plans."""
+        for serializer_class in LIST_SERIALIZERS:
+            with self.subTest(serializer=serializer_class.__name__):
+                self.assertIsNotNone(rows.compile_plan(serializer_class()))
+
+    def assert_same(self, url):
+        """
+        Check that a list is the same with and without the plans.
+
+        Args:
+            url: requested url.
+
+        Returns:
+            dict: response data.
+        """
+        fast = self.client.get(url)
+        with mock.patch.object(rows, 'compile_plan', return_value=None):
+            slow = self.client.get(url)
+        self.assertEqual(fast.content, slow.content)
+        return fast.json()
+
+    def test_identical_output(self):
+        """Test that the list responses are byte for byte the same as without the plans."""
+        for url in LIST_URLS:
+            with self.subTest(url=url):
+                self.assert_same(url)
+
+    def test_identical_pages(self):
+        """Test that every page and cursor is the same as without the plans."""
+        page = self.assert_same('/api/tasks/?page_size=2')
+        pages = 1
+        while page['next']:
+            page = self.assert_same(page['next'])
+            pages += 1
+        self.assertEqual(pages, 4)
+
+    def test_unsupported_field(self):
+        """Test that a serializer with a method field is left to DRF."""
+
+        class NamedTaskSerializer(serializers.TaskSerializer):
+            shout = serializers.serializers.SerializerMethodField(method_name='shouted_name')
+
+            def shouted_name(self, task):
+                return task.name.upper()
+
+        self.assertIsNone(rows.compile_plan(NamedTaskSerializer()))
@@ -0,0 +1,128 @@
+"""Full-text search tests module."""
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from freelance import models, search
+
+SEARCH_URL = '/api/search/'
+FOUND = 'results'
+INVOICES = 'invoices'
+OBJECT_ID = 'object_id'
+QUERY = 'q'
+
+
+class SearchTest(TestCase):
+    """Test the search index and its endpoints."""
+
+    def setUp(self):
+        """Set up tasks with a comment."""
+        self.user = User.objects.create(username='seeker', password='seeker')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        developer = models.Developer.objects.create(developer=self.user)
+        self.parser = models.Task.objects.create(
+            name='Parser', description='Write a parser for invoices', owner=self.user,
+        )
+        self.report = models.Task.objects.create(
+            name='Report', description='Monthly invoices report', owner=self.user,
+        )
+        self.comment = models.Comment.objects.create(
+            task=self.report, owner=developer, comment_content='Parsing is done with regular expressions',
+        )
+
+    def found_ids(self, query):
+        """
+        Get the ids of the found objects.
+
+        Args:
+            query: searched text.
+
+        Returns:
+            list: ids in rank order.
+        """
+        return [document.object_id for document in search.search(query, limit=10)]
+
+    def test_ranking(self):
+        """Test that a title match is ranked above a body match and words are prefixes."""
+        self.assertCountEqual(self.found_ids(INVOICES), [self.parser.id, self.report.id])
+        self.assertEqual(self.found_ids('pars'), [self.parser.id, self.comment.id])
+        self.assertEqual(self.found_ids('monthly invoices'), [self.report.id])
+        self.assertEqual(self.found_ids('" OR *'), [])
+
+    def test_sync(self):
+        """Test that the index follows saves and deletions."""
+        self.comment.comment_content = 'Rewritten with a grammar'
+        self.comment.save()
+        self.assertEqual(self.found_ids('grammar'), [self.comment.id])
+        self.comment.delete()
+        self.assertEqual(self.found_ids('grammar'), [])
+        self.parser.delete()
+        self.assertEqual(self.found_ids(INVOICES), [self.report.id])
+
+    def test_api(self):
+        """Test that the API answers with two queries and the page renders the found tasks."""
+        with self.assertNumQueries(2):
+            response = self.client.get(SEARCH_URL, {QUERY: 'pars'})
+        self.assertEqual([found[OBJECT_ID] for found in response.json()[FOUND]], [
+            str(self.parser.id), str(self.comment.id),
+        ])
+        self.assertIsNone(response.json()['next'])
+        self.assertEqual(response.json()[FOUND][1]['task_name'], 'Report')
+
+        self.client.force_login(self.user)
+        response = self.client.get('/search/', {QUERY: 'report'})
+        self.assertContains(response, 'Monthly invoices report')
+        self.assertNotContains(response, 'Write a parser')
+
+    def test_rebuild(self):
+        """Test that the command restores a lost index."""
+        models.SearchDocument.objects.all().delete()
+        self.assertEqual(self.found_ids(INVOICES), [])
+        call_command('rebuild_search_index', stdout=None)
+        self.assertEqual(len(self.found_ids(INVOICES)), 2)
+
+    def test_index_is_used(self):
+        """Test that SQLite answers from the FTS5 index."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('FTS5 is specific to SQLite')
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {search.SQLITE_QUERY}', ('"invoices"*', 1, 0))
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn('VIRTUAL TABLE INDEX', plan)
+
+
+class SearchVisibilityTest(TestCase):
+    """Test that the search shows the rows the user may see only."""
+
+    def setUp(self):
+        """Set up an API client."""
+        self.client = APIClient()
+
+    def test_visibility(self):
+        """Test that the tasks and the comments of other users are found by the staff only."""
+        user = User.objects.create(username='seeker')
+        own = models.Task.objects.create(name='Parser', description='Parse invoices', owner=user)
+        self.client.force_authenticate(user=user)
+        stranger = User.objects.create(username='stranger')
+        hidden = models.Task.objects.create(name='Ledger', description='Secret invoices ledger', owner=stranger)
+        remark = models.Comment.objects.create(
+            task=hidden,
+            owner=models.Developer.objects.create(developer=stranger),
+            comment_content='Secret ledger remark',
+        )
+        response = self.client.get(SEARCH_URL, {QUERY: INVOICES})
+        found_ids = [found[OBJECT_ID] for found in response.json()[FOUND]]
+        self.assertEqual(found_ids, [str(own.id)])
+        self.assertEqual(self.client.get(SEARCH_URL, {QUERY: 'secret'}).json()[FOUND], [])
+        self.client.force_login(user)
+        self.assertNotContains(self.client.get('/search/', {QUERY: 'ledger'}), 'Secret')
+
+        self.client.force_authenticate(user=User.objects.create(username='auditor', is_staff=True))
+        response = self.client.get(SEARCH_URL, {QUERY: 'secret'})
+        self.assertCountEqual([found[OBJECT_ID] for found in response.json()[FOUND]], [
+            str(hidden.id), str(remark.id),
+        ])
@@ -0,0 +1,115 @@
+"""Status summaries tests module."""
+
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from freelance import models, summaries
+
+SUMMARIES_URL = '/api/summaries/'
+TASK_COUNT = 'task_count'
+
+
+def snapshot() -> set:
+    """
+    Read the non-empty summaries.
+
+    Returns:
+        set: model names, keys, statuses and numbers of tasks.
+    """
+    rows = set()
+    for model in summaries.SUMMARY_MODELS:
+        summary_rows = model.objects.filter(task_count__gt=0).values_list(model.key_field, 'status_id', TASK_COUNT)
+        rows.update((model.__name__, *row) for row in summary_rows)
+    return rows
+
+
+class StatusSummariesTest(TestCase):
+    """Test that the summaries follow the tasks and their developers."""
+
+    def setUp(self):
+        """Set up owners, statuses and developers."""
+        self.owner = User.objects.create(username='manager')
+        self.open = models.Status.objects.create(name='open')
+        self.done = models.Status.objects.create(name='done')
+        self.developers = [
+            models.Developer.objects.create(developer=User.objects.create(username=username))
+            for username in ('alpha', 'beta')
+        ]
+
+    def assert_rebuilt(self):
+        """Check that the maintained summaries are the same as the rebuilt ones."""
+        maintained = snapshot()
+        summaries.rebuild()
+        self.assertEqual(maintained, snapshot())
+
+    def test_tasks(self):
+        """Test creation, status and owner changes and deletion of tasks."""
+        alpha, beta = self.developers
+        task = models.Task.objects.create(name='first', owner=self.owner, status=self.open)
+        task.developers.add(alpha, beta)
+        self.assertIn(('OwnerStatusSummary', self.owner.id, self.open.id, 1), snapshot())
+        task.status = self.done
+        task.save()
+        task.owner = alpha.developer
+        task.save()
+        self.assert_rebuilt()
+        models.Task.objects.get(pk=task.pk).delete()
+        self.assertEqual(snapshot(), set())
+
+    def test_developers(self):
+        """Test assignments from both sides, moved assignments and deleted statuses."""
+        alpha, beta = self.developers
+        first = models.Task.objects.create(name='first', owner=self.owner, status=self.open)
+        second = models.Task.objects.create(name='second', owner=self.owner, status=self.done)
+        alpha.tasks.add(first, second)
+        beta.task_set.add(first)
+        assignment = models.TaskDeveloper.objects.get(task=first, developer=beta)
+        assignment.task = second
+        assignment.save()
+        self.assert_rebuilt()
+        first.developers.remove(alpha)
+        self.open.delete()
+        self.assert_rebuilt()
+        self.assertIn(('DeveloperStatusSummary', beta.id, self.done.id, 1), snapshot())
+
+    def test_bulk(self):
+        """Test that the tasks inserted in bulk are counted."""
+        client = APIClient()
+        client.force_authenticate(user=self.owner)
+        developer_ids = [str(developer.id) for developer in self.developers]
+        tasks = [
+            {'name': f'bulk {num}', 'status': str(self.open.id), 'developers': developer_ids}
+            for num in range(3)
+        ]
+        client.post('/api/tasks/bulk/', tasks, format='json')
+        self.assertIn(('OwnerStatusSummary', self.owner.id, self.open.id, 3), snapshot())
+        self.assert_rebuilt()
+
+    def test_views(self):
+        """Test that the users see their summaries and the staff sees everyone's."""
+        alpha = self.developers[0]
+        models.Task.objects.create(name='own', owner=self.owner, status=self.open).developers.add(alpha)
+        models.Task.objects.create(name='other', owner=alpha.developer)
+        client = APIClient()
+        client.force_authenticate(user=self.owner)
+        response = client.get(SUMMARIES_URL).json()
+        expected = {'status': str(self.open.id), TASK_COUNT: 1, 'owner': 'manager'}
+        self.assertEqual(response, {'owners': [expected], 'developers': []})
+        client.force_authenticate(user=User.objects.create(username='staff', is_staff=True))
+        self.assertEqual(len(client.get(SUMMARIES_URL).json()['owners']), 2)
+        self.client.force_login(alpha.developer)
+        self.assertContains(self.client.get(reverse('profile')), 'без статуса: 1')
+
+    def test_rebuild_command(self):
+        """Test that the command recomputes the summaries."""
+        models.Task.objects.create(name='lost', owner=self.owner, status=self.open)
+        models.OwnerStatusSummary.objects.update(task_count=7)
+        output = StringIO()
+        call_command('rebuild_status_summaries', stdout=output)
+        self.assertIn('Summarized 1 rows', output.getvalue())
+        self.assertEqual(snapshot(), {('OwnerStatusSummary', self.owner.id, self.open.id, 1)})
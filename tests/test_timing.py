@@ -0,0 +1,57 @@
+"""Request timing tests module."""
+
+import json
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from freelance import models, timing
+
+TASKS_URL = '/api/tasks/'
+SERVER_TIMING = 'Server-Timing'
+NEVER_SLOW_MS = 60000
+
+
+@override_settings(REQUEST_TIMING=True, SLOW_REQUEST_MS=NEVER_SLOW_MS)
+class TimingMiddlewareTest(TestCase):
+    """Test that the requests are measured and the slow ones are logged."""
+
+    def setUp(self):
+        """Set up a logged in user with tasks."""
+        self.user = User.objects.create(username='timed', is_staff=True)
+        for num in range(3):
+            models.Task.objects.create(name=f'task {num}', owner=self.user)
+        self.client.force_login(self.user)
+
+    def test_server_timing(self):
+        """Test that the header counts the queries and times the phases."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(TASKS_URL, {'fields': 'id,name'})
+            query_count = len(queries)
+        header = response[SERVER_TIMING]
+        self.assertIn(f'desc="{query_count} queries"', header)
+        self.assertIn('serialize;dur=', header)
+        self.assertIn('render;dur=', header)
+        self.assertIn('desc="freelance.async_views.AsyncViewSetView"', header)
+        self.assertIn('desc="profile"', self.client.get(reverse('profile'))[SERVER_TIMING])
+
+    @override_settings(SLOW_REQUEST_MS=0)
+    def test_slow_log(self):
+        """Test that a slow request is logged with its slowest queries."""
+        with self.assertLogs('freelance.slow_requests', 'INFO') as logs:
+            self.client.get(TASKS_URL)
+            record = json.loads(logs.records[0].getMessage())
+        self.assertEqual((record['method'], record['path'], record['status']), ('GET', TASKS_URL, 200))
+        self.assertGreater(record['queries'], 0)
+        durations = [query['duration_ms'] for query in record['slowest_queries']]
+        self.assertEqual(durations, sorted(durations, reverse=True))
+        self.assertLessEqual(len(durations), timing.SLOWEST_QUERIES)
+
+    @override_settings(REQUEST_TIMING=False)
+    def test_off(self):
+        """Test that nothing is measured with the timing off."""
+        self.assertNotIn(SERVER_TIMING, self.client.get(TASKS_URL))
+        self.assertIsNone(timing.current())
@@ -1,12 +1,15 @@
 """Views testing module."""
 
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from freelance.models import Developer, Position
+from freelance.models import Comment, Developer, Position, Status, Task
+from freelance.views import COMMENTS_PAGE_SIZE, TASKS_PAGE_SIZE
 
 
 def create_view_test_user(page_url, page_name, template, auth=True):
@@ -102,3 +105,113 @@ no_auth_test_methods = {
     f'test_{attrs[1]}': unauthorized_view_test(attrs[0]) for attrs in pages_attrs
 }
 TestNoAuth = type('TestNoAuth', (TestCase,), no_auth_test_methods)
+
+
+class TestTaskLists(TestCase):
+    """Test the paginated task lists."""
+
+    def setUp(self):
+        """Set up a user who owns and develops tasks."""
+        self.client = APIClient()
+        self.user = User.objects.create(username='lister', password='lister')
+        self.developer = Developer.objects.create(
+            developer=self.user, position=Position.objects.create(name='middle'),
+        )
+        self.status = Status.objects.create(name='open')
+        self.client.force_login(self.user)
+
+    def add_tasks(self, tasks_number):
+        """
+        Create tasks owned and developed by the user.
+
+        Args:
+            tasks_number: number of tasks.
+        """
+        for num in range(tasks_number):
+            task = Task.objects.create(name=f'task {num}', owner=self.user, status=self.status)
+            task.developers.add(self.developer)
+
+    def count_queries(self, page_name):
+        """
+        Count the queries of a page.
+
+        Args:
+            page_name: name of the page.
+
+        Returns:
+            int: number of queries.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(page_name))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.context['tasks']), min(Task.objects.count(), TASKS_PAGE_SIZE))
+            queries_number = len(queries)
+        return queries_number
+
+    def test_constant_queries(self):
+        """Test that the number of queries does not depend on the number of tasks."""
+        for page_name in ('dev_tasks', 'my_tasks'):
+            with self.subTest(page_name=page_name):
+                Task.objects.all().delete()
+                self.add_tasks(2)
+                small = self.count_queries(page_name)
+                self.add_tasks(TASKS_PAGE_SIZE * 2)
+                self.assertEqual(self.count_queries(page_name), small)
+
+
+class TestTaskPage(TestCase):
+    """Test the task page."""
+
+    def setUp(self):
+        """Set up a task."""
+        self.client = APIClient()
+        self.owner = User.objects.create(username='task_owner', password='task_owner')
+        self.position = Position.objects.create(name='lead')
+        self.task = Task.objects.create(
+            name='popular', owner=self.owner, status=Status.objects.create(name='open'),
+        )
+        self.developers_number = 0
+        self.client.force_login(self.owner)
+
+    def add_solutions(self, solutions_number):
+        """
+        Assign new developers to the task and add their solutions.
+
+        Args:
+            solutions_number: number of developers and solutions.
+        """
+        for _ in range(solutions_number):
+            self.developers_number += 1
+            user = User.objects.create(username=f'solver{self.developers_number}')
+            developer = Developer.objects.create(developer=user, position=self.position)
+            self.task.developers.add(developer)
+            Comment.objects.create(task=self.task, owner=developer, comment_content=user.username)
+
+    def count_queries(self):
+        """
+        Count the queries of the task page.
+
+        Returns:
+            int: number of queries.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('task', args=(self.task.id,)))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertContains(response, 'solver1')
+            queries_number = len(queries)
+        return queries_number
+
+    def test_constant_queries(self):
+        """Test that the number of queries does not depend on the number of solutions (with warm caches)."""
+        self.add_solutions(1)
+        self.count_queries()
+        small = self.count_queries()
+        self.add_solutions(COMMENTS_PAGE_SIZE * 2)
+        self.assertEqual(self.count_queries(), small)
+
+    def test_new_comments_on_last_page(self):
+        """Test that the streamed comments are appended on the last page only."""
+        self.add_solutions(COMMENTS_PAGE_SIZE + 1)
+        url = reverse('task', args=(self.task.id,))
+        self.assertContains(self.client.get(url), 'const lastPage = false;')
+        self.assertContains(self.client.get(url, {'page': 2}), 'const lastPage = true;')